@@ -8,6 +8,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from fastapi.exceptions import RequestValidationError
 from pydantic import ValidationError
+import asyncio
 import structlog
 import os
 from pathlib import Path
@@ -170,6 +171,16 @@ async def startup_event():
     """
     logger.info("application_starting", log_level=settings.log_level)
 
+    # Allow many concurrent blocking calls off the event loop
+    from src.core.wan26_adapter import install_blocking_executor
+
+    app.state.blocking_executor = install_blocking_executor()
+
+    # Warm the DashScope connection pool in the background
+    from src.core.wan26_adapter import Wan26Adapter
+
+    app.state.dashscope_prewarm = asyncio.create_task(Wan26Adapter().prewarm())
+
     # Initialize database and load templates
     from src.models import SessionLocal
     from src.services.storage import init_db as init_storage
@@ -191,6 +202,18 @@ async def shutdown_event():
     """
     logger.info("application_shutting_down")
 
+    from src.services.artifact_writer import AsyncArtifactWriter
+
+    await AsyncArtifactWriter.flush_all()
+
+    from src.core.wan26_adapter import Wan26Adapter
+
+    await Wan26Adapter.aclose_client()
+
+    executor = getattr(app.state, "blocking_executor", None)
+    if executor is not None:
+        executor.shutdown(wait=False)
+
 
 # Import routers
 from src.api.routes import generation, jobs, finalize, revise, plan, render
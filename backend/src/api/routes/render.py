@@ -52,9 +52,11 @@ async def render_job(
             raise ValueError("Job already has generated assets")
 
         rate_limiter = RateLimiter()
-        rate_limit_result = rate_limiter.check_rate_limit(client_ip)
-        if not rate_limit_result["allowed"]:
-            raise ValueError(f"Rate limit exceeded. Try again at {rate_limit_result['reset_at']}")
+        # Planning already counted a fresh job against the rate limit
+        if not rate_limiter.planned_within_grace(job.created_at):
+            rate_limit_result = rate_limiter.check_rate_limit(client_ip)
+            if not rate_limit_result["allowed"]:
+                raise ValueError(f"Rate limit exceeded. Try again at {rate_limit_result['reset_at']}")
 
         concurrent_result = rate_limiter.check_concurrent_jobs(client_ip)
         if not concurrent_result["allowed"]:
@@ -64,7 +64,7 @@ QUALITY_MODES: Dict[str, Dict] = {
 }
 
 # Validation Strictness Levels
-VALIDATION_STRICTNESS_LEVELS = {
+VALIDATION_STRICTNESS_LEVELS: Dict[str, Dict] = {
     "loose": {
         "duration_tolerance_percent": 20,
         "allow_minor_violations": True,
@@ -89,7 +89,7 @@ VALIDATION_STRICTNESS_LEVELS = {
 }
 
 # Narration Compression Levels
-NARRATION_COMPRESSION_LEVELS = {
+NARRATION_COMPRESSION_LEVELS: Dict[str, Dict] = {
     "aggressive": {
         "target_reduction_percent": 40,
         "preserve_keywords": True,
@@ -112,6 +112,9 @@ RATE_LIMIT_PER_MIN: int = 10
 RATE_LIMIT_BURST: int = 10
 RATE_LIMIT_WINDOW_S: int = 60
 MAX_CONCURRENT_JOBS_PER_IP: int = 5
+# A job planned this recently already counted against the rate limit when it
+# was created, so starting its render only checks the concurrency slots
+RATE_LIMIT_RESUME_GRACE_S: int = 60
 
 # Language Support
 SUPPORTED_LANGUAGES: List[str] = ["zh-CN", "en-US", "ja-JP"]
@@ -135,6 +138,15 @@ SUBTITLE_POLICY_OPTIONS: List[str] = ["none", "allowed", "auto"]
 # Job Timeout
 JOB_TIMEOUT_MINUTES: int = 20
 
+# Planning Cache (IR/template/shot plan reused for identical inputs)
+PLAN_CACHE_SIZE: int = 512
+PLAN_CACHE_TTL_S: int = 3600
+
+# Shots of one job generated at once (each holds a DashScope submission,
+# download and ffmpeg split); keeps one large job from taking every
+# DASHSCOPE_MAX_CONCURRENCY slot
+SHOT_GENERATION_CONCURRENCY: int = 5
+
 # Retry Configuration
 MAX_RETRY_ATTEMPTS: int = 3
 RETRY_INITIAL_DELAY_S: int = 2
@@ -145,6 +157,11 @@ FFMPEG_VIDEO_CODEC: str = "libx264"
 FFMPEG_AUDIO_CODEC: str = "mp3"
 FFMPEG_VIDEO_BITRATE: str = "2M"
 FFMPEG_AUDIO_BITRATE: str = "192k"
+# Source codecs remuxed as-is instead of re-encoded ("-c:v copy" / "-c:a copy")
+FFMPEG_VIDEO_COPY_CODECS: frozenset = frozenset({"h264", "hevc"})
+FFMPEG_AUDIO_COPY_CODECS: frozenset = frozenset({"mp3"})
+# Trailing ffmpeg stderr lines kept for error messages
+FFMPEG_STDERR_TAIL_LINES: int = 64
 
 # Storage Retention
 JOB_RETENTION_DAYS: int = 30
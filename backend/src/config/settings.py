@@ -15,6 +15,18 @@ class Settings(BaseSettings):
     # DashScope API Key for Wan2.6-t2v video generation
     dashscope_api_key: str = Field(default="", env="DASHSCOPE_API_KEY")
 
+    # DashScope REST API endpoint
+    dashscope_base_url: str = Field(
+        default="https://dashscope.aliyuncs.com/api/v1",
+        env="DASHSCOPE_BASE_URL"
+    )
+
+    # Maximum DashScope submissions in flight per adapter
+    dashscope_max_concurrency: int = Field(default=8, env="DASHSCOPE_MAX_CONCURRENCY")
+
+    # Longest wait between task status polls
+    dashscope_poll_interval_s: float = Field(default=5.0, env="DASHSCOPE_POLL_INTERVAL_S")
+
     # ModelScope API Key for Qwen LLM (using OpenAI-compatible endpoint)
     modelscope_api_key: str = Field(default="", env="MODELSCOPE_API_KEY")
 
@@ -41,8 +53,20 @@ class Settings(BaseSettings):
         env="TEMPLATE_MATCH_MIN_CONFIDENCE"
     )
 
+    # Template count at which the FAISS index switches to 8-bit scalar quantization
+    template_index_sq8_min_templates: int = Field(
+        default=2000,
+        env="TEMPLATE_INDEX_SQ8_MIN_TEMPLATES"
+    )
+
+    # Threads for blocking calls (ffmpeg splitting) offloaded from the event loop
+    blocking_io_max_workers: int = Field(default=32, env="BLOCKING_IO_MAX_WORKERS")
+
     # Database
     database_url: str = Field(default="sqlite:///./data/jobs.db", env="DATABASE_URL")
+    database_pool_size: int = Field(default=20, env="DATABASE_POOL_SIZE")
+    database_max_overflow: int = Field(default=40, env="DATABASE_MAX_OVERFLOW")
+    database_pool_recycle_s: int = Field(default=1800, env="DATABASE_POOL_RECYCLE_S")
 
     # Redis
     redis_url: str = Field(default="redis://localhost:6379/0", env="REDIS_URL")
@@ -2,12 +2,16 @@
 Prompt Compiler - Jinja2-based per-shot prompt compilation
 """
 
+from bisect import bisect_left
 from typing import Dict, Any, List, Optional, Tuple
 from jinja2 import Template, Environment, BaseLoader
 from pydantic import BaseModel
 
 from src.config.constants import FFMPEG_VIDEO_CODEC, FFMPEG_AUDIO_CODEC
 
+# Terms every compiled negative prompt must contain
+REQUIRED_NEGATIVE_TERMS: Tuple[str, ...] = ("text", "subtitles")
+
 
 class CompiledPrompt(BaseModel):
     """Compiled prompt with all sections"""
@@ -35,6 +39,12 @@ class PromptCompiler:
         """Initialize prompt compiler"""
         self.jinja_env = Environment(loader=BaseLoader())
 
+        # Section templates are class constants, so parse them once
+        self._global_tpl = self.jinja_env.from_string(self.GLOBAL_REQUIREMENTS_TEMPLATE)
+        self._shot_script_tpl = self.jinja_env.from_string(self.SHOT_SCRIPT_TEMPLATE)
+        self._audio_tpl = self.jinja_env.from_string(self.AUDIO_TEMPLATE)
+        self._consistency_tpl = self.jinja_env.from_string(self.CONSISTENCY_TEMPLATE)
+
     def compile_shot_prompt(
         self,
         shot: Dict[str, Any],
@@ -68,6 +78,75 @@ class PromptCompiler:
 
         ir = ir or {}
         shot_plan = shot_plan or {}
+        context = self._plan_context(shot_plan, ir, quality_mode)
+
+        # Calculate start time based on shot sequence
+        shot_id = shot.get("shot_id", 1)
+        start_time = sum(
+            s.get("duration_s", 0) for s in shot_plan.get("shots", []) if s.get("shot_id") < shot_id
+        )
+
+        return self._compile_with_context(
+            shot, context, start_time, ir, negative_prompt_base, prompt_extend
+        )
+
+    def compile_shot_prompts_batch(
+        self,
+        shots: List[Dict[str, Any]],
+        shot_plan: Dict[str, Any],
+        ir: Dict[str, Any],
+        negative_prompt_base: str = "",
+        prompt_extend: bool = False,
+        quality_mode: str = "balanced",
+    ) -> List[CompiledPrompt]:
+        """
+        Compile prompts for several shots of the same plan
+
+        Produces the same result as calling compile_shot_prompt per shot, but
+        the plan-wide sections are rendered once and shot start times come
+        from a single prefix sum instead of rescanning the plan per shot.
+
+        Args:
+            shots: Shots to compile (usually shot_plan["shots"])
+            shot_plan: Full shot plan with global settings
+            ir: Intermediate Representation
+            negative_prompt_base: Base negative prompt from template
+            prompt_extend: Whether to enable prompt extension
+            quality_mode: Quality mode
+
+        Returns:
+            CompiledPrompt objects in the order of ``shots``
+        """
+        context = self._plan_context(shot_plan, ir, quality_mode)
+
+        # start_time(shot) = total duration of plan shots with a smaller shot_id
+        timeline = sorted(
+            (s.get("shot_id"), s.get("duration_s", 0)) for s in shot_plan.get("shots", [])
+        )
+        shot_ids = [shot_id for shot_id, _ in timeline]
+        elapsed = [0]
+        for _, duration in timeline:
+            elapsed.append(elapsed[-1] + duration)
+
+        return [
+            self._compile_with_context(
+                shot,
+                context,
+                elapsed[bisect_left(shot_ids, shot.get("shot_id", 1))],
+                ir,
+                negative_prompt_base,
+                prompt_extend,
+            )
+            for shot in shots
+        ]
+
+    def _plan_context(
+        self,
+        shot_plan: Dict[str, Any],
+        ir: Dict[str, Any],
+        quality_mode: str,
+    ) -> Dict[str, Any]:
+        """Render the sections and parameters shared by every shot of a plan"""
         from src.config.constants import QUALITY_MODES
 
         # Validate shot count against quality mode limits
@@ -97,70 +176,73 @@ class PromptCompiler:
         subtitle_policy = shot_plan.get("subtitle_policy", "none")
 
         # Compile global requirements section
-        global_requirements = self._render_template(
-            self.GLOBAL_REQUIREMENTS_TEMPLATE,
-            {
-                "visual_style": visual_style,
-                "lighting": lighting,
-                "color_tone": color_tone,
-                "scene_desc": scene_desc,
-                "emotion_desc": emotion_desc,
-                "subtitle_policy": subtitle_policy,
-            }
+        global_requirements = self._global_tpl.render(
+            visual_style=visual_style,
+            lighting=lighting,
+            color_tone=color_tone,
+            scene_desc=scene_desc,
+            emotion_desc=emotion_desc,
+            subtitle_policy=subtitle_policy,
         )
 
+        # Compile consistency section
+        consistency_notes = self._generate_consistency_notes(ir, shot_plan)
+        consistency_section = self._consistency_tpl.render(
+            consistency_notes=consistency_notes,
+        )
+
+        return {
+            "global_requirements": global_requirements,
+            "consistency_section": consistency_section,
+            "subtitle_policy": subtitle_policy,
+            "narration_language": ir.get("audio", {}).get("narration_language", "中文"),
+            "narration_tone": ir.get("audio", {}).get("narration_tone", "自然"),
+            "resolution": ir.get("resolution", "1280x720").replace("x", "*"),
+            "watermark": ir.get("watermark", False),
+        }
+
+    def _compile_with_context(
+        self,
+        shot: Dict[str, Any],
+        context: Dict[str, Any],
+        start_time: int,
+        ir: Dict[str, Any],
+        negative_prompt_base: str,
+        prompt_extend: bool,
+    ) -> CompiledPrompt:
+        """Compile the per-shot sections on top of a plan context"""
         # Compile shot script section
-        shot_id = shot.get("shot_id", 1)
         duration_s = shot.get("duration_s", 5)
-
-        # Calculate start and end time based on shot sequence
-        shots = shot_plan.get("shots", [])
-        start_time = sum(s.get("duration_s", 0) for s in shots if s.get("shot_id") < shot_id)
         end_time = start_time + duration_s
 
         shot_description = shot.get("visual", shot.get("visual_template", ""))
         camera_motion = shot.get("camera_motion", "静态")
         shot_script_text = f"{shot_description}，镜头{camera_motion}"
 
-        shot_script = self._render_template(
-            self.SHOT_SCRIPT_TEMPLATE,
-            {
-                "start_time": start_time,
-                "end_time": end_time,
-                "shot_description": shot_script_text,
-            }
+        shot_script = self._shot_script_tpl.render(
+            start_time=start_time,
+            end_time=end_time,
+            shot_description=shot_script_text,
         )
 
         # Compile audio section
         audio = shot.get("audio", {})
         sfx = audio.get("sfx", shot.get("audio_template", "无"))
         narration = audio.get("narration", "")
-        narration_language = ir.get("audio", {}).get("narration_language", "中文")
-        narration_tone = ir.get("audio", {}).get("narration_tone", "自然")
-
-        audio_section = self._render_template(
-            self.AUDIO_TEMPLATE,
-            {
-                "sfx": sfx,
-                "narration_language": narration_language,
-                "narration_tone": narration_tone,
-                "narration": narration,
-            }
-        )
 
-        # Compile consistency section
-        consistency_notes = self._generate_consistency_notes(ir, shot_plan)
-        consistency_section = self._render_template(
-            self.CONSISTENCY_TEMPLATE,
-            {"consistency_notes": consistency_notes}
+        audio_section = self._audio_tpl.render(
+            sfx=sfx,
+            narration_language=context["narration_language"],
+            narration_tone=context["narration_tone"],
+            narration=narration,
         )
 
         # Combine all sections
         compiled_prompt = "\n".join([
-            global_requirements,
+            context["global_requirements"],
             shot_script,
             audio_section,
-            consistency_section,
+            context["consistency_section"],
         ])
 
         # Compile negative prompt
@@ -168,18 +250,17 @@ class PromptCompiler:
             negative_prompt_base,
             shot,
             ir,
-            subtitle_policy,
+            context["subtitle_policy"],
         )
 
         # Build generation parameters
-        resolution = ir.get("resolution", "1280x720").replace("x", "*")
         params = {
             "model": "wan2.6-t2v",
-            "size": resolution,
+            "size": context["resolution"],
             "duration": duration_s,
             "seed": self._generate_seed(),
             "prompt_extend": prompt_extend,
-            "watermark": ir.get("watermark", False),
+            "watermark": context["watermark"],
         }
 
         return CompiledPrompt(
@@ -362,24 +443,6 @@ class PromptCompiler:
         import random
         return random.randint(1, 2**31 - 1)
 
-    def _render_template(
-        self,
-        template_string: str,
-        context: Dict[str, Any],
-    ) -> str:
-        """
-        Render Jinja2 template with context
-
-        Args:
-            template_string: Template string
-            context: Template context variables
-
-        Returns:
-            Rendered string
-        """
-        template = self.jinja_env.from_string(template_string)
-        return template.render(**context)
-
     def validate_compiled_prompt(
         self,
         compiled_prompt: str,
@@ -400,24 +463,15 @@ class PromptCompiler:
             "一致性",
         ]
 
-        # Check all sections present
-        for section in required_sections:
-            if section not in compiled_prompt:
-                return False, f"Missing required section: {section}"
-
-        # Check sections are in order
-        section_positions = {}
+        # Check all sections present and in order
+        prev_pos = -1
         for section in required_sections:
             pos = compiled_prompt.find(section)
             if pos == -1:
-                return False, f"Section not found: {section}"
-            section_positions[section] = pos
-
-        # Verify order
-        section_names = list(section_positions.keys())
-        positions = list(section_positions.values())
-        if positions != sorted(positions):
-            return False, "Sections not in correct order"
+                return False, f"Missing required section: {section}"
+            if pos < prev_pos:
+                return False, "Sections not in correct order"
+            prev_pos = pos
 
         return True, None
 
@@ -439,8 +493,8 @@ class PromptCompiler:
             return False, "Negative prompt cannot be empty"
 
         # Check for base negative terms
-        required_terms = ["text", "subtitles"]
-        missing_terms = [term for term in required_terms if term.lower() not in negative_prompt.lower()]
+        lowered = negative_prompt.lower()
+        missing_terms = [term for term in REQUIRED_NEGATIVE_TERMS if term not in lowered]
 
         if missing_terms:
             return False, f"Negative prompt missing required terms: {', '.join(missing_terms)}"
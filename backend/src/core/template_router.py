@@ -7,11 +7,13 @@ from pathlib import Path
 import hashlib
 import json
 import re
+from dataclasses import dataclass
 import numpy as np
 from langchain_community.vectorstores import FAISS
 from pydantic import BaseModel
 
 from src.config.settings import settings
+from src.models.template import TemplateModel
 from src.services.storage import TemplateDB
 from src.services.observability import log_template_hit, logger
 from sqlalchemy.orm import Session
@@ -27,6 +29,18 @@ class TemplateMatch(BaseModel):
     template: Dict[str, Any]
 
 
+@dataclass(slots=True)
+class _IRView:
+    """Normalized IR fields shared by the keyword and Jaccard scoring paths."""
+
+    topic_norm: str
+    topic_tokens: frozenset
+    style_norms: frozenset
+    emotion_norms: frozenset
+    tag_norms: frozenset
+    query_str: str
+
+
 class _CachedEmbeddings:
     """Embedding wrapper that caches template embeddings on disk."""
 
@@ -143,6 +157,7 @@ class TemplateRouter:
             self.embeddings = None
         self.faiss_index: Optional[FAISS] = None
         self.template_metadata: Dict[str, Dict[str, Any]] = {}
+        self.template_tag_norms: Dict[str, frozenset] = {}
 
     def build_index(self, templates: List[Dict[str, Any]]) -> None:
         """
@@ -166,6 +181,7 @@ class TemplateRouter:
             # Store metadata
             key = f"{template['template_id']}:{template['version']}"
             self.template_metadata[key] = template
+            self.template_tag_norms[key] = self._template_tag_norms(template)
             metadata.append({"key": key})
 
         # Build FAISS index
@@ -187,6 +203,34 @@ class TemplateRouter:
                 # Allow metadata-only builds in unit tests without embeddings
                 self.faiss_index = None
 
+            if self.faiss_index is not None and len(texts) >= settings.template_index_sq8_min_templates:
+                try:
+                    self._quantize_index()
+                except Exception as exc:
+                    # The flat index is only replaced once quantization succeeds
+                    logger.warning("template_index_quantize_failed", error=str(exc))
+
+    def _quantize_index(self) -> None:
+        """
+        Replace the flat float32 index with an 8-bit scalar-quantized index
+
+        Keeps the L2 metric so scores stay comparable with the flat index, and
+        keeps the docstore mapping since vectors are re-added in the same order.
+        """
+        import faiss
+
+        flat_index = self.faiss_index.index
+        vectors = flat_index.reconstruct_n(0, flat_index.ntotal)
+        sq_index = faiss.IndexScalarQuantizer(
+            flat_index.d,
+            faiss.ScalarQuantizer.QT_8bit,
+            faiss.METRIC_L2,
+        )
+        sq_index.train(vectors)
+        sq_index.add(vectors)
+        self.faiss_index.index = sq_index
+        logger.info("template_index_quantized", templates=flat_index.ntotal, dim=flat_index.d)
+
     def _embedding_cache_path(self) -> Path:
         backend_root = Path(__file__).resolve().parents[2]
         return backend_root / "data" / "template_embeddings.json"
@@ -246,11 +290,13 @@ class TemplateRouter:
         if min_confidence is None:
             min_confidence = settings.template_match_min_confidence
 
+        view = self._build_ir_view(ir)
+
         template_dicts: List[Dict[str, Any]] = []
         # Rebuild index if needed
         if self.faiss_index is None:
             templates = TemplateDB.list_templates(db)
-            template_dicts = [t.to_dict() for t in templates]
+            template_dicts = TemplateModel.to_dicts(templates)
             self.build_index(template_dicts)
 
         if not template_dicts:
@@ -258,28 +304,25 @@ class TemplateRouter:
 
         if self.faiss_index is None:
             # Fallback to keyword matching when embeddings are unavailable.
-            keyword_match = self._keyword_match(ir, template_dicts, top_k, min_confidence)
+            keyword_match = self._keyword_match(view, template_dicts, top_k, min_confidence)
             return keyword_match or self._fallback_template(db)
 
-        # Create search query from IR
-        query = self._create_query_from_ir(ir)
-
         # Search FAISS index
         try:
-            results = self.faiss_index.similarity_search_with_score(query, k=top_k)
+            results = self.faiss_index.similarity_search_with_score(view.query_str, k=top_k)
 
             if not results:
-                keyword_match = self._keyword_match(ir, template_dicts, top_k, min_confidence)
+                keyword_match = self._keyword_match(view, template_dicts, top_k, min_confidence)
                 return keyword_match or self._fallback_template(db)
 
             # Rank results by combined confidence
-            ranked = self._rank_results(ir, results)
+            ranked = self._rank_results(view, results)
 
             # Return best match if above threshold
             if ranked and ranked[0].confidence >= min_confidence:
                 return ranked[0]
             else:
-                keyword_match = self._keyword_match(ir, template_dicts, top_k, min_confidence)
+                keyword_match = self._keyword_match(view, template_dicts, top_k, min_confidence)
                 return keyword_match or self._fallback_template(db)
 
         except Exception as e:
@@ -289,7 +332,7 @@ class TemplateRouter:
                 confidence_components={},
                 job_id=None,
             )
-            keyword_match = self._keyword_match(ir, template_dicts, top_k, min_confidence)
+            keyword_match = self._keyword_match(view, template_dicts, top_k, min_confidence)
             return keyword_match or self._fallback_template(db)
 
     def _fallback_template(self, db: Session) -> Optional[TemplateMatch]:
@@ -317,7 +360,7 @@ class TemplateRouter:
 
     def _keyword_match(
         self,
-        ir: Dict[str, Any],
+        view: _IRView,
         templates: List[Dict[str, Any]],
         top_k: int,
         min_confidence: float,
@@ -328,22 +371,10 @@ class TemplateRouter:
         if not templates:
             return None
 
-        ir_topic = ir.get("topic", "")
-        ir_topic_norm = self._normalize_tag(ir_topic) if ir_topic else ""
-        ir_topic_tokens = self._tokenize_phrase(ir_topic)
-
-        ir_emotions = {self._normalize_tag(e) for e in ir.get("emotion_curve", []) if e}
-
-        style = ir.get("style", {}) or {}
-        ir_style_values: List[str] = []
-        if isinstance(style, dict):
-            for key in ("visual", "visual_approach", "visual_style", "color_tone", "lighting"):
-                value = style.get(key)
-                if value:
-                    ir_style_values.append(value)
-        elif isinstance(style, str):
-            ir_style_values = [style]
-        ir_styles = {self._normalize_tag(v) for v in ir_style_values if v}
+        ir_topic_norm = view.topic_norm
+        ir_topic_tokens = view.topic_tokens
+        ir_emotions = view.emotion_norms
+        ir_styles = view.style_norms
 
         candidates: List[TemplateMatch] = []
         for template in templates:
@@ -417,6 +448,60 @@ class TemplateRouter:
         tokens = re.split(r"[_\s]+", normalized)
         return {t for t in tokens if t}
 
+    def _build_ir_view(self, ir: Dict[str, Any]) -> _IRView:
+        """
+        Normalize the IR fields used for matching once per request
+
+        Args:
+            ir: Intermediate Representation
+
+        Returns:
+            _IRView shared by keyword matching and Jaccard ranking
+        """
+        topic = ir.get("topic", "") or ""
+        topic_norm = self._normalize_tag(topic) if topic else ""
+
+        style = ir.get("style", {}) or {}
+        style_values: List[str] = []
+        primary_style_values: List[Any] = []
+        if isinstance(style, dict):
+            for key in ("visual", "visual_approach", "visual_style", "color_tone", "lighting"):
+                value = style.get(key)
+                if value:
+                    style_values.append(value)
+            primary_style_values = [
+                style.get("visual") or style.get("visual_approach") or style.get("visual_style"),
+                style.get("color_tone"),
+                style.get("lighting"),
+            ]
+        elif isinstance(style, str):
+            style_values = [style]
+            primary_style_values = [style]
+
+        scene = ir.get("scene", {}) or {}
+        scene_values = (
+            [scene.get("location"), scene.get("time")] if isinstance(scene, dict) else []
+        )
+
+        emotion_norms = frozenset(
+            self._normalize_tag(e) for e in ir.get("emotion_curve", []) or [] if e
+        )
+
+        tag_norms = {self._normalize_tag(v) for v in primary_style_values if v}
+        tag_norms.update(self._normalize_tag(v) for v in scene_values if v)
+        tag_norms.update(emotion_norms)
+        if topic:
+            tag_norms.add(topic_norm)
+
+        return _IRView(
+            topic_norm=topic_norm,
+            topic_tokens=frozenset(self._tokenize_phrase(topic)),
+            style_norms=frozenset(self._normalize_tag(v) for v in style_values if v),
+            emotion_norms=emotion_norms,
+            tag_norms=frozenset(tag_norms),
+            query_str=self._create_query_from_ir(ir),
+        )
+
     def _create_query_from_ir(self, ir: Dict[str, Any]) -> str:
         """Create search query from IR"""
         query_parts = []
@@ -431,25 +516,28 @@ class TemplateRouter:
         query_parts.append(ir.get("intent", ""))
 
         # Add style information
-        style = ir.get("style", {})
+        style = ir.get("style", {}) or {}
+        if isinstance(style, str):
+            style = {"visual": style}
         query_parts.append(style.get("visual", "") or style.get("visual_approach", "") or style.get("visual_style", ""))
         query_parts.append(style.get("color_tone", ""))
         query_parts.append(style.get("lighting", ""))
 
         # Add scene information
-        scene = ir.get("scene", {})
-        query_parts.append(scene.get("location", ""))
-        query_parts.append(scene.get("time", ""))
+        scene = ir.get("scene", {}) or {}
+        if isinstance(scene, dict):
+            query_parts.append(scene.get("location", ""))
+            query_parts.append(scene.get("time", ""))
 
         # Add emotion curve
-        emotions = ir.get("emotion_curve", [])
+        emotions = ir.get("emotion_curve", []) or []
         query_parts.extend(emotions)
 
         return " ".join([p for p in query_parts if p])
 
     def _rank_results(
         self,
-        ir: Dict[str, Any],
+        view: _IRView,
         results: List[tuple],
     ) -> List[TemplateMatch]:
         """
@@ -458,7 +546,7 @@ class TemplateRouter:
         Confidence = 0.7 * cosine_similarity + 0.3 * jaccard_similarity(tags)
 
         Args:
-            ir: Intermediate Representation
+            view: Normalized IR view
             results: FAISS search results with (doc, score) tuples
 
         Returns:
@@ -481,7 +569,7 @@ class TemplateRouter:
             cosine_sim = max(0.0, min(1.0, cosine_sim))
 
             # Calculate Jaccard similarity for tags
-            jaccard_sim = self._calculate_jaccard_similarity(ir, template)
+            jaccard_sim = self._calculate_jaccard_similarity(view, template)
 
             # Combined confidence
             confidence = 0.7 * cosine_sim + 0.3 * jaccard_sim
@@ -506,49 +594,44 @@ class TemplateRouter:
 
     def _calculate_jaccard_similarity(
         self,
-        ir: Dict[str, Any],
+        view: _IRView,
         template: Dict[str, Any],
     ) -> float:
         """
         Calculate Jaccard similarity between IR tags and template tags
 
         Args:
-            ir: Intermediate Representation
+            view: Normalized IR view
             template: Template dictionary
 
         Returns:
             Jaccard similarity [0, 1]
         """
-        # Extract IR tags
-        ir_tags = set()
-
-        ir_topic = ir.get("topic", "")
-        if ir_topic:
-            ir_tags.add(self._normalize_tag(ir_topic))
-
-        style = ir.get("style", {})
-        style_visual = style.get("visual") or style.get("visual_approach") or style.get("visual_style")
-        if style_visual:
-            ir_tags.add(self._normalize_tag(style_visual))
-        for key in ("color_tone", "lighting"):
-            value = style.get(key)
-            if value:
-                ir_tags.add(self._normalize_tag(value))
-
-        scene = ir.get("scene", {})
-        for key in ("location", "time"):
-            value = scene.get(key)
-            if value:
-                ir_tags.add(self._normalize_tag(value))
-
-        ir_emotions = ir.get("emotion_curve", [])
-        ir_tags.update([self._normalize_tag(e) for e in ir_emotions if e])
-
-        # Extract template tags
-        template_tags_dict = template.get("tags", {})
+        ir_tags = view.tag_norms
+
+        if not ir_tags:
+            return 0.0
+
+        key = f"{template.get('template_id')}:{template.get('version')}"
+        template_tags = self.template_tag_norms.get(key)
+        if template_tags is None:
+            template_tags = self._template_tag_norms(template)
+
+        if not template_tags:
+            return 0.0
+
+        # |A ∪ B| = |A| + |B| - |A ∩ B|, so the union never has to be materialized
+        intersection = len(ir_tags & template_tags)
+        if not intersection:
+            return 0.0
+
+        return intersection / (len(ir_tags) + len(template_tags) - intersection)
+
+    def _template_tag_norms(self, template: Dict[str, Any]) -> frozenset:
+        """Collect normalized tags and emotion curve entries for a template."""
         template_tags = set()
 
-        for category, tags in template_tags_dict.items():
+        for category, tags in (template.get("tags", {}) or {}).items():
             if isinstance(tags, list):
                 template_tags.update([self._normalize_tag(t) for t in tags if t])
             elif isinstance(tags, str):
@@ -557,14 +640,7 @@ class TemplateRouter:
         template_emotions = template.get("emotion_curve", []) or []
         template_tags.update([self._normalize_tag(e) for e in template_emotions if e])
 
-        # Calculate Jaccard similarity
-        if not ir_tags or not template_tags:
-            return 0.0
-
-        intersection = len(ir_tags & template_tags)
-        union = len(ir_tags | template_tags)
-
-        return intersection / union if union > 0 else 0.0
+        return frozenset(template_tags)
 
     def get_template_by_id(
         self,
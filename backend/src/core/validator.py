@@ -2,9 +2,20 @@
 Validator - Parameter validation, medical compliance, and subtitle policy enforcement
 """
 
+import functools
+import re
+import threading
 from dataclasses import dataclass, field
-from typing import Dict, Any, List, Optional, Tuple, Union
+from typing import Dict, Any, List, Optional, Sequence, Tuple, Union
 from pydantic import BaseModel, Field, validator
+try:
+    import ahocorasick
+except Exception:  # pragma: no cover - optional dependency
+    ahocorasick = None
+try:
+    import hyperscan
+except Exception:  # pragma: no cover - optional dependency
+    hyperscan = None  # type: ignore[assignment]
 
 from src.config.constants import (
     SUPPORTED_LANGUAGES,
@@ -16,8 +27,163 @@ from src.config.constants import (
     WATERMARK_OPTIONS,
     SUBTITLE_POLICY_OPTIONS,
     QUALITY_MODES,
+    VALIDATION_STRICTNESS_LEVELS,
+    NARRATION_COMPRESSION_LEVELS,
 )
 
+# Negative prompt terms required when subtitle policy is "none"
+REQUIRED_NEGATIVE_TERMS: Tuple[str, ...] = ("text", "subtitles", "watermark", "logo")
+SUBTITLE_REQUEST_KEYWORDS: Tuple[str, ...] = ("subtitle", "caption", "text on screen", "文字", "字幕")
+
+# Compiled prompt sections, in required order
+REQUIRED_PROMPT_SECTIONS: Tuple[str, ...] = (
+    "全片要求",  # Global requirements
+    "镜头脚本",  # Shot script
+    "音频",  # Audio
+    "一致性",  # Consistency
+)
+
+# Hashed views of the option lists for O(1) membership checks
+_SUPPORTED_RESOLUTIONS = frozenset(SUPPORTED_RESOLUTIONS)
+_WATERMARK_OPTIONS = frozenset(WATERMARK_OPTIONS)
+_SUBTITLE_POLICY_OPTIONS = frozenset(SUBTITLE_POLICY_OPTIONS)
+
+# Narration simplification vocabulary
+_FILLER_WORDS = frozenset({"um", "uh", "like", "you know", "basically", "actually"})
+_SENTENCE_PUNCT = "?!."
+
+_REQUIRED_NEGATIVE_RE = re.compile("|".join(map(re.escape, REQUIRED_NEGATIVE_TERMS)), re.IGNORECASE)
+_SUBTITLE_REQUEST_RE = re.compile("|".join(map(re.escape, SUBTITLE_REQUEST_KEYWORDS)), re.IGNORECASE)
+
+
+def _build_subtitle_request_db() -> Optional[Any]:
+    """Compile subtitle request keywords into a Hyperscan block-mode database."""
+    if hyperscan is None:
+        return None
+
+    try:
+        db = hyperscan.Database()
+        db.compile(
+            expressions=[keyword.encode("utf-8") for keyword in SUBTITLE_REQUEST_KEYWORDS],
+            ids=list(range(len(SUBTITLE_REQUEST_KEYWORDS))),
+            flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH]
+            * len(SUBTITLE_REQUEST_KEYWORDS),
+        )
+    except Exception:
+        return None
+    return db
+
+
+_SUBTITLE_REQUEST_DB = _build_subtitle_request_db()
+# Hyperscan scratch space must not be shared between concurrent scans
+_hyperscan_local = threading.local()
+
+
+def _stop_on_first_match(*_args: Any) -> bool:
+    """Hyperscan match callback; returning True terminates the scan."""
+    return True
+
+
+def _has_subtitle_request(user_input: str) -> bool:
+    """Return True if the input mentions subtitles, captions or on-screen text."""
+    if _SUBTITLE_REQUEST_DB is None:
+        return _SUBTITLE_REQUEST_RE.search(user_input) is not None
+
+    scratch = getattr(_hyperscan_local, "scratch", None)
+    if scratch is None:
+        scratch = hyperscan.Scratch(_SUBTITLE_REQUEST_DB)
+        _hyperscan_local.scratch = scratch
+
+    try:
+        _SUBTITLE_REQUEST_DB.scan(
+            user_input.encode("utf-8"),
+            match_event_handler=_stop_on_first_match,
+            scratch=scratch,
+        )
+    except hyperscan.ScanTerminated:
+        return True
+    return False
+
+
+def _missing_negative_terms(negative_prompt: str) -> List[str]:
+    """Return required negative terms absent from the prompt, scanning it once."""
+    found = {match.lower() for match in _REQUIRED_NEGATIVE_RE.findall(negative_prompt)}
+    return [term for term in REQUIRED_NEGATIVE_TERMS if term not in found]
+
+
+def _simplify_language(text: str) -> str:
+    """
+    Simplify language by removing filler words
+
+    Args:
+        text: Input text
+
+    Returns:
+        Simplified text
+    """
+    # Remove common filler words and tokens made only of sentence punctuation
+    # ("...", "??"); punctuation inside words ("2.5", URLs) is kept
+    return " ".join(
+        w for w in text.split() if w.strip(_SENTENCE_PUNCT) and w.lower() not in _FILLER_WORDS
+    )
+
+
+def _fuse_compress(text: str, target_length: int, simplify: bool) -> str:
+    """
+    Truncate text to target_length and optionally simplify it in one chain
+
+    Args:
+        text: Original narration text
+        target_length: Number of characters to keep
+        simplify: Whether to remove filler words
+
+    Returns:
+        Compressed text
+    """
+    compressed = text[:target_length].rstrip()
+    # Add ellipsis if truncated
+    if len(compressed) < len(text):
+        compressed += "..."
+    if simplify:
+        compressed = _simplify_language(compressed)
+    return compressed
+
+
+@functools.lru_cache(maxsize=1024)
+def _compress_narration_cached(
+    narration: str,
+    quality_mode: str,
+    max_length: int,
+    target_reduction_percent: int,
+    simplify_language: bool,
+) -> Tuple[str, Optional[str]]:
+    """
+    Compress narration text; pure in its arguments, so results are memoized
+
+    Args:
+        narration: Original narration text
+        quality_mode: Resolved quality mode (used in the suggestion text)
+        max_length: Maximum narration length for the mode
+        target_reduction_percent: Target reduction for the mode's compression level
+        simplify_language: Whether to strip filler words
+
+    Returns:
+        Tuple of (compressed_narration, suggested_modification)
+    """
+    # Check if compression is needed
+    if len(narration) <= max_length:
+        return narration, None
+
+    # Calculate target length based on compression level
+    target_length = int(len(narration) * (1 - target_reduction_percent / 100))
+    target_length = min(target_length, max_length)
+
+    compressed = _fuse_compress(narration, target_length, simplify_language)
+
+    suggestion = f"Narration compressed from {len(narration)} to {len(compressed)} characters ({quality_mode} mode)"
+
+    return compressed, suggestion
+
 
 class ValidationError(Exception):
     """Validation error with suggested modifications"""
@@ -42,29 +208,152 @@ class ValidationResult:
         return self.is_valid
 
 
+@dataclass(frozen=True, slots=True)
+class ModeRecord:
+    """Flattened per-quality-mode validation settings"""
+
+    max_shots: int
+    min_shot_duration_s: int
+    max_shot_duration_s: int
+    # Total-duration limit; taken from the mode's max_shot_duration_s
+    # (falling back to MAX_DURATION_S), not from a separate total setting
+    mode_duration_limit_s: int
+    duration_tolerance_s: float
+    auto_fix_attempts: int
+    max_narration_length: int
+    compression_config: Dict[str, Any]
+
+
 class Validator:
     """
     Validate generation parameters with medical compliance and auto-fix
     """
 
     # Medical content violation vocabulary
-    ABSOLUTE_EFFICACY_PHRASES = [
+    ABSOLUTE_EFFICACY_PHRASES: Tuple[str, ...] = (
         "guaranteed cure", "100% effective", "immediate results",
         "absolute cure", "complete recovery guaranteed",
-    ]
+    )
 
-    SUBSTITUTE_MEDICAL_ADVICE_PHRASES = [
+    SUBSTITUTE_MEDICAL_ADVICE_PHRASES: Tuple[str, ...] = (
         "don't go to hospital", "ignore doctor's orders",
         "skip medical treatment", "avoid doctors",
-    ]
+    )
 
-    MEDICAL_ADVICE_PHRASES = [
+    MEDICAL_ADVICE_PHRASES: Tuple[str, ...] = (
         "服用", "安眠药", "吃药", "药物治疗",
-    ]
+    )
+
+    # (violation, suggestion) message formats per compliance category
+    COMPLIANCE_MESSAGES = {
+        "absolute_efficacy": (
+            "Absolute efficacy claim detected: '{}'",
+            "Remove or soften absolute claim: '{}'",
+        ),
+        "substitute_medical_advice": (
+            "Substitute medical advice detected: '{}'",
+            "Remove harmful advice: '{}'",
+        ),
+        "medical_advice": (
+            "Medical advice detected: '{}'",
+            "Avoid direct medical advice: '{}'",
+        ),
+    }
+
+    # Single categorized vocabulary: (phrase, category, match against lowercased text)
+    # English phrases are lowercased once here and match case-insensitively;
+    # Chinese phrases match against the raw text
+    PHRASE_CHECKS = (
+        tuple((phrase.lower(), "absolute_efficacy", True) for phrase in ABSOLUTE_EFFICACY_PHRASES)
+        + tuple(
+            (phrase.lower(), "substitute_medical_advice", True)
+            for phrase in SUBSTITUTE_MEDICAL_ADVICE_PHRASES
+        )
+        + tuple((phrase, "medical_advice", False) for phrase in MEDICAL_ADVICE_PHRASES)
+    )
 
-    def __init__(self):
+    def __init__(self) -> None:
         """Initialize validator"""
-        pass
+        self._check_order = {
+            phrase: idx for idx, (phrase, _, _) in enumerate(self.PHRASE_CHECKS)
+        }
+        self._lowered_automaton = self._build_automaton(
+            [(phrase, category) for phrase, category, lowered in self.PHRASE_CHECKS if lowered]
+        )
+        self._raw_automaton = self._build_automaton(
+            [(phrase, category) for phrase, category, lowered in self.PHRASE_CHECKS if not lowered]
+        )
+        self._mode_table = self._build_mode_table()
+
+    def _build_mode_table(self) -> Dict[str, ModeRecord]:
+        """
+        Resolve quality mode, strictness and compression settings once
+
+        Returns:
+            ModeRecord per quality mode
+        """
+        mode_table = {}
+        for mode, mode_config in QUALITY_MODES.items():
+            strictness_config = VALIDATION_STRICTNESS_LEVELS[mode_config["validation_strictness"]]
+            mode_duration_limit = mode_config.get("max_shot_duration_s", MAX_DURATION_S)
+            compression_level = mode_config.get("narration_compression", "standard")
+            mode_table[mode] = ModeRecord(
+                max_shots=mode_config["max_shots"],
+                min_shot_duration_s=mode_config.get("min_shot_duration_s", MIN_SHOT_DURATION_S),
+                max_shot_duration_s=mode_config.get("max_shot_duration_s", MAX_SHOT_DURATION_S),
+                mode_duration_limit_s=mode_duration_limit,
+                duration_tolerance_s=(
+                    mode_duration_limit * strictness_config["duration_tolerance_percent"] / 100
+                ),
+                auto_fix_attempts=strictness_config["auto_fix_attempts"],
+                max_narration_length=mode_config.get("max_narration_length", 50),
+                compression_config=NARRATION_COMPRESSION_LEVELS[compression_level],
+            )
+        return mode_table
+
+    def _build_automaton(self, checks: List[Tuple[str, str]]) -> Optional[Any]:
+        """
+        Build an Aho-Corasick automaton over (phrase, category) pairs
+
+        Args:
+            checks: Phrases with their compliance category
+
+        Returns:
+            Automaton, or None when pyahocorasick is unavailable
+        """
+        if ahocorasick is None or not checks:
+            return None
+
+        automaton = ahocorasick.Automaton()
+        for phrase, category in checks:
+            automaton.add_word(phrase, (phrase, category))
+        automaton.make_automaton()
+        return automaton
+
+    def _find_compliance_hits(self, text: str) -> List[Tuple[str, str]]:
+        """
+        Find compliance phrases present in a single text
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            Distinct (phrase, category) hits in vocabulary order
+        """
+        text_lower = text.lower()
+
+        if self._lowered_automaton is None or self._raw_automaton is None:
+            # One pass over the categorized vocabulary, already in order
+            return [
+                (phrase, category)
+                for phrase, category, lowered in self.PHRASE_CHECKS
+                if phrase in (text_lower if lowered else text)
+            ]
+
+        hits = {value for _, value in self._lowered_automaton.iter(text_lower)}
+        hits.update(value for _, value in self._raw_automaton.iter(text))
+
+        return sorted(hits, key=lambda hit: self._check_order[hit[0]])
 
     def validate_parameters(
         self,
@@ -83,28 +372,20 @@ class Validator:
         Returns:
             Tuple of (is_valid, suggested_modifications)
         """
-        from src.config.constants import QUALITY_MODES, VALIDATION_STRICTNESS_LEVELS
-
-        errors = []
-        suggestions = []
+        errors: List[str] = []
+        suggestions: List[str] = []
 
         # Get quality mode configuration
-        if quality_mode not in QUALITY_MODES:
+        mode = self._mode_table.get(quality_mode)
+        if mode is None:
             errors.append(f"Quality mode {quality_mode} not supported")
             return False, suggestions
 
-        mode_config = QUALITY_MODES[quality_mode]
-        validation_strictness = mode_config["validation_strictness"]
-        strictness_config = VALIDATION_STRICTNESS_LEVELS[validation_strictness]
-
         # Validate total duration with tolerance
         total_duration = shot_plan.get("duration_s", 0)
         min_duration = MIN_DURATION_S
-        max_duration = mode_config.get("max_shot_duration_s", MAX_DURATION_S)
-
-        # Apply tolerance based on strictness
-        tolerance_percent = strictness_config["duration_tolerance_percent"]
-        duration_tolerance = max_duration * tolerance_percent / 100
+        max_duration = mode.mode_duration_limit_s
+        duration_tolerance = mode.duration_tolerance_s
 
         if total_duration < min_duration or total_duration > max_duration + duration_tolerance:
             errors.append(
@@ -114,7 +395,7 @@ class Validator:
 
         # Validate per-shot durations with mode-specific limits
         shots = shot_plan.get("shots", [])
-        max_shots = mode_config["max_shots"]
+        max_shots = mode.max_shots
 
         if len(shots) > max_shots:
             errors.append(
@@ -122,36 +403,36 @@ class Validator:
             )
             suggestions.append(f"Reduce to {max_shots} shots or use higher quality mode")
 
+        min_shot_duration = mode.min_shot_duration_s
+        max_shot_duration = mode.max_shot_duration_s
         for shot in shots:
             shot_duration = shot.get("duration_s", 0)
-            min_shot_duration = mode_config.get("min_shot_duration_s", MIN_SHOT_DURATION_S)
-            max_shot_duration = mode_config.get("max_shot_duration_s", MAX_SHOT_DURATION_S)
 
-            if shot_duration < min_shot_duration or shot_duration > max_shot_duration:
+            if not min_shot_duration <= shot_duration <= max_shot_duration:
                 errors.append(
                     f"Shot {shot.get('shot_id')} duration {shot_duration}s out of range for {quality_mode} mode [{min_shot_duration}, {max_shot_duration}]"
                 )
 
         # Validate resolution
         resolution = ir.get("resolution", "1280x720")
-        if resolution not in SUPPORTED_RESOLUTIONS:
+        if resolution not in _SUPPORTED_RESOLUTIONS:
             errors.append(f"Resolution {resolution} not supported")
             suggestions.append(f"Use one of: {', '.join(SUPPORTED_RESOLUTIONS)}")
 
         # Validate watermark
         watermark = ir.get("watermark", "none")
-        if watermark not in WATERMARK_OPTIONS:
+        if watermark not in _WATERMARK_OPTIONS:
             errors.append(f"Watermark {watermark} not supported")
 
         # Validate subtitle policy based on strictness
         subtitle_policy = shot_plan.get("subtitle_policy", "none")
-        if subtitle_policy not in SUBTITLE_POLICY_OPTIONS:
+        if subtitle_policy not in _SUBTITLE_POLICY_OPTIONS:
             errors.append(f"Subtitle policy {subtitle_policy} not supported")
 
         is_valid = len(errors) == 0
 
         # Apply auto-fix if enabled and validation failed
-        if not is_valid and strictness_config["auto_fix_attempts"] > 0:
+        if not is_valid and mode.auto_fix_attempts > 0:
             # TODO: Implement auto-fix logic
             pass
 
@@ -171,10 +452,10 @@ class Validator:
         errors: List[str] = []
         warnings: List[str] = []
 
-        mode_config = QUALITY_MODES.get(quality_mode, QUALITY_MODES["balanced"])
+        mode = self._mode_table.get(quality_mode) or self._mode_table["balanced"]
         shots = shot_plan.get("shots", [])
 
-        max_shots = mode_config["max_shots"]
+        max_shots = mode.max_shots
         if len(shots) > max_shots:
             errors.append(
                 f"Shot count {len(shots)} exceeds limit {max_shots} for {quality_mode}"
@@ -186,8 +467,8 @@ class Validator:
                 f"Total duration {total_duration}s exceeds limit {MAX_DURATION_S}s"
             )
 
-        min_shot_duration = mode_config.get("min_shot_duration_s", MIN_SHOT_DURATION_S)
-        max_shot_duration = mode_config.get("max_shot_duration_s", MAX_SHOT_DURATION_S)
+        min_shot_duration = mode.min_shot_duration_s
+        max_shot_duration = mode.max_shot_duration_s
 
         for shot in shots:
             if "compiled_prompt" not in shot:
@@ -202,93 +483,81 @@ class Validator:
 
         return ValidationResult(is_valid=len(errors) == 0, errors=errors, warnings=warnings)
 
-    def compress_narration(
+    def validate_shot_plan_soa(
         self,
-        narration: str,
+        durations: Sequence[float],
+        shot_ids: Sequence[Any],
+        has_prompt: Sequence[bool],
         quality_mode: str = "balanced",
-    ) -> Tuple[str, Optional[str]]:
+    ) -> ValidationResult:
         """
-        Compress narration text based on quality mode settings
+        Validate a shot plan given as parallel per-shot columns.
 
         Args:
-            narration: Original narration text
+            durations: Shot durations in seconds
+            shot_ids: Shot identifiers, used in error messages
+            has_prompt: Whether each shot carries a compiled prompt
             quality_mode: Quality mode
 
         Returns:
-            Tuple of (compressed_narration, suggested_modification)
+            ValidationResult with the same errors as validate_shot_plan
         """
-        from src.config.constants import QUALITY_MODES, NARRATION_COMPRESSION_LEVELS
-
-        if quality_mode not in QUALITY_MODES:
-            quality_mode = "balanced"
-
-        mode_config = QUALITY_MODES[quality_mode]
-        max_length = mode_config.get("max_narration_length", 50)
-        compression_level = mode_config.get("narration_compression", "standard")
-        compression_config = NARRATION_COMPRESSION_LEVELS[compression_level]
-
-        # Check if compression is needed
-        if len(narration) <= max_length:
-            return narration, None
-
-        # Calculate target length based on compression level
-        target_reduction = compression_config["target_reduction_percent"]
-        target_length = int(len(narration) * (1 - target_reduction / 100))
-        target_length = min(target_length, max_length)
+        errors: List[str] = []
+        warnings: List[str] = []
 
-        # Compress narration
-        compressed = narration[:target_length].rstrip()
+        mode = self._mode_table.get(quality_mode) or self._mode_table["balanced"]
 
-        # Add ellipsis if truncated
-        if len(compressed) < len(narration):
-            compressed += "..."
+        max_shots = mode.max_shots
+        if len(shot_ids) > max_shots:
+            errors.append(
+                f"Shot count {len(shot_ids)} exceeds limit {max_shots} for {quality_mode}"
+            )
 
-        # Simplify language if enabled
-        if compression_config["simplify_language"]:
-            compressed = self._simplify_language(compressed)
+        total_duration = sum(durations)
+        if total_duration > MAX_DURATION_S:
+            errors.append(
+                f"Total duration {total_duration}s exceeds limit {MAX_DURATION_S}s"
+            )
 
-        # Preserve keywords if enabled
-        if compression_config["preserve_keywords"]:
-            compressed = self._preserve_keywords(compressed, narration)
+        min_shot_duration = mode.min_shot_duration_s
+        max_shot_duration = mode.max_shot_duration_s
 
-        suggestion = f"Narration compressed from {len(narration)} to {len(compressed)} characters ({quality_mode} mode)"
+        for shot_id, shot_duration, present in zip(shot_ids, durations, has_prompt):
+            if not present:
+                errors.append(f"Missing compiled prompt for shot {shot_id}")
+            if shot_duration < min_shot_duration or shot_duration > max_shot_duration:
+                errors.append(f"Shot {shot_id} duration {shot_duration}s out of range")
 
-        return compressed, suggestion
+        return ValidationResult(is_valid=len(errors) == 0, errors=errors, warnings=warnings)
 
-    def _simplify_language(self, text: str) -> str:
+    def compress_narration(
+        self,
+        narration: str,
+        quality_mode: str = "balanced",
+    ) -> Tuple[str, Optional[str]]:
         """
-        Simplify language by removing filler words
+        Compress narration text based on quality mode settings
 
         Args:
-            text: Input text
+            narration: Original narration text
+            quality_mode: Quality mode
 
         Returns:
-            Simplified text
-        """
-        # Remove common filler words
-        filler_words = ["um", "uh", "like", "you know", "basically", "actually"]
-        words = text.split()
-        filtered = [w for w in words if w.lower() not in filler_words and w not in ["...", "??", "!!"]]
-        return " ".join(filtered)
-
-    def _preserve_keywords(self, compressed: str, original: str) -> str:
+            Tuple of (compressed_narration, suggested_modification)
         """
-        Preserve important keywords from original text
-
-        Args:
-            compressed: Compressed text
-            original: Original text
+        if quality_mode not in self._mode_table:
+            quality_mode = "balanced"
 
-        Returns:
-            Text with preserved keywords
-        """
-        # Extract important words (longer words, numbers, medical terms)
-        import re
-        keywords = re.findall(r'\b[A-Z][a-z]+\b|\b\d+\b', original)
+        mode = self._mode_table[quality_mode]
+        compression_config = mode.compression_config
 
-        # This is a simplified implementation
-        # In production, would use more sophisticated keyword extraction
-        return compressed
+        return _compress_narration_cached(
+            narration,
+            quality_mode,
+            mode.max_narration_length,
+            compression_config["target_reduction_percent"],
+            compression_config["simplify_language"],
+        )
 
     def validate_medical_compliance(
         self,
@@ -312,25 +581,13 @@ class Validator:
         if visual_descriptions is None:
             visual_descriptions = []
 
-        # Check for absolute efficacy claims
+        # Check for absolute efficacy claims, substitute and direct medical advice
         text_to_check = [narration_text] + visual_descriptions
         for text in text_to_check:
-            text_lower = text.lower()
-
-            for phrase in self.ABSOLUTE_EFFICACY_PHRASES:
-                if phrase in text_lower:
-                    violations.append(f"Absolute efficacy claim detected: '{phrase}'")
-                    suggestions.append(f"Remove or soften absolute claim: '{phrase}'")
-
-            for phrase in self.SUBSTITUTE_MEDICAL_ADVICE_PHRASES:
-                if phrase in text_lower:
-                    violations.append(f"Substitute medical advice detected: '{phrase}'")
-                    suggestions.append(f"Remove harmful advice: '{phrase}'")
-
-            for phrase in self.MEDICAL_ADVICE_PHRASES:
-                if phrase in text:
-                    violations.append(f"Medical advice detected: '{phrase}'")
-                    suggestions.append(f"Avoid direct medical advice: '{phrase}'")
+            for phrase, category in self._find_compliance_hits(text):
+                violation_fmt, suggestion_fmt = self.COMPLIANCE_MESSAGES[category]
+                violations.append(violation_fmt.format(phrase))
+                suggestions.append(suggestion_fmt.format(phrase))
 
         is_compliant = len(violations) == 0
 
@@ -346,7 +603,7 @@ class Validator:
     def validate_resolution(self, resolution: str) -> bool:
         """Validate resolution with both x and * separators."""
         normalized = resolution.replace("*", "x")
-        return normalized in SUPPORTED_RESOLUTIONS
+        return normalized in _SUPPORTED_RESOLUTIONS
 
     def validate_seed_count(self, seed_count: int, quality_mode: str) -> bool:
         """Validate seed count by quality mode configuration."""
@@ -372,11 +629,9 @@ class Validator:
         Returns:
             Tuple of (enforced_negative_prompt, error_message)
         """
-        required_terms = ["text", "subtitles", "watermark", "logo"]
-
         if subtitle_policy == "none":
             # Ensure all required terms are present
-            missing_terms = [term for term in required_terms if term.lower() not in negative_prompt.lower()]
+            missing_terms = _missing_negative_terms(negative_prompt)
 
             if missing_terms:
                 # Add missing terms
@@ -402,10 +657,7 @@ class Validator:
             Tuple of (is_allowed, clarification_message)
         """
         # Check if user explicitly requested subtitles
-        subtitle_keywords = ["subtitle", "caption", "text on screen", "文字", "字幕"]
-        user_input_lower = user_input.lower()
-
-        has_subtitle_request = any(keyword in user_input_lower for keyword in subtitle_keywords)
+        has_subtitle_request = _has_subtitle_request(user_input)
 
         if has_subtitle_request and subtitle_policy == "none":
             clarification = (
@@ -459,14 +711,7 @@ class Validator:
         Returns:
             Tuple of (is_valid, error_message)
         """
-        required_sections = [
-            "全片要求",  # Global requirements
-            "镜头脚本",  # Shot script
-            "音频",  # Audio
-            "一致性",  # Consistency
-        ]
-
-        missing_sections = [section for section in required_sections if section not in compiled_prompt]
+        missing_sections = [section for section in REQUIRED_PROMPT_SECTIONS if section not in compiled_prompt]
 
         if missing_sections:
             return False, f"Missing required sections: {', '.join(missing_sections)}"
@@ -486,9 +731,7 @@ class Validator:
         Returns:
             Tuple of (is_valid, error_message)
         """
-        required_terms = ["text", "subtitles", "watermark", "logo"]
-
-        missing_terms = [term for term in required_terms if term.lower() not in negative_prompt.lower()]
+        missing_terms = _missing_negative_terms(negative_prompt)
 
         if missing_terms:
             return False, f"Negative prompt missing required terms: {', '.join(missing_terms)}"
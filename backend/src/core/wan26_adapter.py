@@ -3,20 +3,109 @@ Wan2.6-t2v Adapter - DashScope text-to-video API integration
 """
 
 import asyncio
-from typing import Dict, Any, Optional, List
-from pydantic import BaseModel
-try:
-    from dashscope import VideoSynthesis
-except Exception:  # pragma: no cover - optional dependency for tests
-    VideoSynthesis = None
+import random
+import re
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Annotated, AsyncIterator, Dict, Any, Optional, List, Union
 from http import HTTPStatus
 
+import httpx
+from tenacity import (
+    AsyncRetrying,
+    RetryCallState,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_exponential_jitter,
+)
+from pydantic import BaseModel, BeforeValidator, ConfigDict, Field, ValidationError
+
 from src.config.settings import settings
 from src.services.observability import logger
 
+# Network, timeout and 5xx server errors are worth retrying
+_RETRYABLE_ERROR_RE = re.compile(
+    r"timeout|connection|network|temporary|50[02-4]", re.IGNORECASE
+)
+
+# DashScope REST endpoints, relative to settings.dashscope_base_url
+VIDEO_SYNTHESIS_PATH = "/services/aigc/video-generation/video-synthesis"
+TASK_PATH = "/tasks/{task_id}"
+
+# Task statuses that mean the task is still queued or rendering
+PENDING_TASK_STATUSES = frozenset({"pending", "running"})
+
+# Task statuses that mean the video was generated
+SUCCEEDED_TASK_STATUSES = frozenset({"succeeded", "success", "completed", "done", "finished"})
+
+
+def install_blocking_executor() -> ThreadPoolExecutor:
+    """
+    Size the running loop's default executor for blocking work
+
+    Blocking calls (e.g. ffmpeg splitting) run via asyncio.to_thread, so the
+    default executor bounds how many of them can be in flight at once.
+
+    Returns:
+        The installed executor, to be shut down by the caller
+    """
+    executor = ThreadPoolExecutor(
+        max_workers=settings.blocking_io_max_workers,
+        thread_name_prefix="blocking-io",
+    )
+    asyncio.get_running_loop().set_default_executor(executor)
+    return executor
+
+
+def _response_json(rsp: httpx.Response) -> Dict[str, Any]:
+    """Decode a DashScope JSON body, tolerating empty or non-JSON error pages."""
+    try:
+        body = rsp.json()
+    except ValueError:
+        return {}
+    return body if isinstance(body, dict) else {}
+
+
+def _str_or_empty(value: Any) -> str:
+    return value if isinstance(value, str) else ""
+
+
+def _dict_or_empty(value: Any) -> Dict[str, Any]:
+    return value if isinstance(value, dict) else {}
+
+
+class _DashScopeTaskOutput(BaseModel):
+    """`output` object of a DashScope task query"""
+
+    # Failure details (code, message, error_msg, ...) vary by error and stay in model_extra
+    model_config = ConfigDict(extra="allow")
+
+    task_status: Annotated[str, BeforeValidator(_str_or_empty)] = ""
+    video_url: Annotated[str, BeforeValidator(_str_or_empty)] = ""
 
-class ShotGenerationRequest(BaseModel):
-    """Request for single shot generation"""
+
+class _DashScopeTaskResponse(BaseModel):
+    """DashScope task query response body"""
+
+    output: Annotated[_DashScopeTaskOutput, BeforeValidator(_dict_or_empty)] = Field(
+        default_factory=_DashScopeTaskOutput
+    )
+    code: Any = None
+    message: Any = None
+
+    @classmethod
+    def parse(cls, content: bytes) -> "_DashScopeTaskResponse":
+        """Parse a response body, tolerating empty or non-JSON error pages."""
+        try:
+            return cls.model_validate_json(content)
+        except ValidationError:
+            return cls()
+
+
+@dataclass(frozen=True, slots=True)
+class ShotGenerationRequest:
+    """Request for single shot generation (internal transport, not validated)"""
 
     prompt: str
     negative_prompt: str = ""
@@ -27,7 +116,8 @@ class ShotGenerationRequest(BaseModel):
     watermark: bool = False
 
 
-class ShotGenerationResponse(BaseModel):
+@dataclass(frozen=True, slots=True)
+class ShotGenerationResponse:
     """Response from shot generation"""
 
     task_id: str
@@ -36,33 +126,167 @@ class ShotGenerationResponse(BaseModel):
     error: Optional[str] = None
 
 
+class _SubmissionSlots:
+    """
+    Process-wide cap on concurrent DashScope submissions
+
+    A counter under a condition (not a Semaphore) so the cap can be resized.
+    The condition is bound to the event loop it was created on, like the
+    shared HTTP client, and is recreated when the loop changes.
+    """
+
+    def __init__(self) -> None:
+        # None means settings.dashscope_max_concurrency (until resized)
+        self.cap: Optional[int] = None
+        self.active = 0
+        self._cond: Optional[asyncio.Condition] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @property
+    def limit(self) -> int:
+        return self.cap or settings.dashscope_max_concurrency
+
+    def _condition(self) -> asyncio.Condition:
+        loop = asyncio.get_running_loop()
+        if self._cond is None or self._loop is not loop:
+            # Slots held on a previous loop (e.g. one asyncio.run per RQ job) died with it
+            self._cond = asyncio.Condition()
+            self._loop = loop
+            self.active = 0
+        return self._cond
+
+    @asynccontextmanager
+    async def hold(self) -> AsyncIterator[None]:
+        """Hold one submission slot for the duration of the block"""
+        cond = self._condition()
+        async with cond:
+            await cond.wait_for(lambda: self.active < self.limit)
+            self.active += 1
+        try:
+            yield
+        finally:
+            # Shielded so a cancellation cannot skip the notify and strand waiters
+            await asyncio.shield(self._release(cond))
+
+    async def _release(self, cond: asyncio.Condition) -> None:
+        async with cond:
+            self.active -= 1
+            cond.notify(1)
+
+    async def resize(self, limit: int) -> None:
+        """Set the cap and wake waiters that may now proceed"""
+        cond = self._condition()
+        async with cond:
+            self.cap = limit
+            cond.notify_all()
+
+
 class Wan26Adapter:
     """
     Adapter for DashScope wan2.6-t2v text-to-video API
-    Uses DashScope VideoSynthesis SDK
+    Uses the DashScope REST API over a shared, pooled httpx client
     """
 
+    MODEL = "wan2.6-t2v"
+
+    # Task polling backoff: first delay and +/- jitter fraction
+    POLL_INITIAL_DELAY_S = 1.0
+    POLL_JITTER = 0.2
+    # Draws poll_many's full-jitter delays; seed it to make them reproducible
+    _poll_rng = random.Random()
+
+    # Submission cap shared by every adapter instance (see set_concurrency)
+    _submit_slots = _SubmissionSlots()
+
+    # Process-wide client, bound to the event loop it was created on
+    _client: Optional[httpx.AsyncClient] = None
+    _client_loop: Optional[asyncio.AbstractEventLoop] = None
+
     def __init__(self):
         """Initialize wan2.6 adapter"""
         self.api_key = settings.dashscope_api_key
+        self.base_url = settings.dashscope_base_url.rstrip("/")
+        # Built once and passed as-is on every call (httpx merges per-request
+        # headers into a new Headers object without mutating these dicts)
+        self._auth_headers = {"Authorization": f"Bearer {self.api_key}"}
+        self._submit_headers = {**self._auth_headers, "X-DashScope-Async": "enable"}
+
+    @classmethod
+    def _get_client(cls) -> httpx.AsyncClient:
+        """
+        Return the shared HTTP client, creating it for the running loop
 
-    def _format_task_error(
-        self,
-        task_status: str,
-        rsp: Any,
-        output_payload: Optional[Dict[str, Any]],
-    ) -> str:
+        Keep-alive connections are reused across shots, so only the first
+        request per loop pays the TCP and TLS handshake. A new client is
+        created when the loop changes (e.g. one asyncio.run per RQ job).
+        """
+        loop = asyncio.get_running_loop()
+        if cls._client is None or cls._client.is_closed or cls._client_loop is not loop:
+            cls._client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_keepalive_connections=20,
+                    max_connections=100,
+                    keepalive_expiry=30.0,
+                ),
+                timeout=httpx.Timeout(60.0, connect=10.0),
+            )
+            cls._client_loop = loop
+        return cls._client
+
+    @classmethod
+    async def aclose_client(cls) -> None:
+        """Close the shared HTTP client and its pooled connections"""
+        client = cls._client
+        cls._client = None
+        cls._client_loop = None
+        if client is not None and not client.is_closed:
+            await client.aclose()
+
+    async def prewarm(self) -> None:
+        """
+        Open a pooled connection to DashScope ahead of the first shot
+
+        Best effort: the response is ignored and failures are only logged,
+        the point is to pay the TCP and TLS handshake off the request path.
+        """
+        try:
+            await self._get_client().head(self.base_url + "/")
+            logger.info("dashscope_prewarmed", base_url=self.base_url)
+        except Exception as e:
+            logger.warning("dashscope_prewarm_failed", error=str(e))
+
+    @classmethod
+    async def set_concurrency(cls, limit: int) -> None:
+        """
+        Resize the submission cap at runtime (e.g. to back off on DashScope 429s)
+
+        The cap is process-wide: it applies to every adapter instance, and to
+        instances created later. Submissions already in flight are not
+        interrupted; lowering the cap only delays new ones until enough
+        slots are released.
+
+        Args:
+            limit: Maximum number of submissions in flight
+
+        Raises:
+            ValueError: If limit is less than 1
+        """
+        if limit < 1:
+            raise ValueError(f"Concurrency limit must be at least 1, got {limit}")
+
+        await cls._submit_slots.resize(limit)
+
+    def _format_task_error(self, task: _DashScopeTaskResponse) -> str:
         parts: List[str] = []
-        if task_status:
-            parts.append(f"task_status={task_status}")
+        if task.output.task_status:
+            parts.append(f"task_status={task.output.task_status}")
 
-        code = getattr(rsp, "code", None)
-        message = getattr(rsp, "message", None)
-        if code:
-            parts.append(f"code={code}")
-        if message:
-            parts.append(f"message={message}")
+        if task.code:
+            parts.append(f"code={task.code}")
+        if task.message:
+            parts.append(f"message={task.message}")
 
+        output_payload = task.output.model_extra
         if output_payload:
             for key in ("code", "message", "error", "error_code", "error_msg", "reason", "failed_reason"):
                 value = output_payload.get(key)
@@ -96,25 +320,30 @@ class Wan26Adapter:
                 seed=request.seed,
             )
 
-            if VideoSynthesis is None:
-                raise ImportError("dashscope VideoSynthesis is not available")
-
-            # Use DashScope VideoSynthesis async_call
-            rsp = await asyncio.to_thread(
-                VideoSynthesis.async_call,
-                api_key=self.api_key,
-                model='wan2.6-t2v',
-                prompt=request.prompt,
-                negative_prompt=request.negative_prompt,
-                size=request.size,
-                duration=request.duration,
-                seed=request.seed,
-                prompt_extend=request.prompt_extend,
-                watermark=request.watermark,
-            )
+            shot_input: Dict[str, Any] = {"prompt": request.prompt}
+            if request.negative_prompt:
+                shot_input["negative_prompt"] = request.negative_prompt
+
+            async with self._submit_slots.hold():
+                rsp = await self._get_client().post(
+                    self.base_url + VIDEO_SYNTHESIS_PATH,
+                    headers=self._submit_headers,
+                    json={
+                        "model": self.MODEL,
+                        "input": shot_input,
+                        "parameters": {
+                            "size": request.size,
+                            "duration": request.duration,
+                            "seed": request.seed,
+                            "prompt_extend": request.prompt_extend,
+                            "watermark": request.watermark,
+                        },
+                    },
+                )
+            body = _response_json(rsp)
 
             if rsp.status_code == HTTPStatus.OK:
-                task_id = rsp.output.task_id
+                task_id = (body.get("output") or {}).get("task_id")
                 logger.info(
                     "shot_request_submitted",
                     task_id=task_id,
@@ -125,7 +354,7 @@ class Wan26Adapter:
                     status="submitted",
                 )
             else:
-                error_msg = f'Failed, status_code: {rsp.status_code}, code: {rsp.code}, message: {rsp.message}'
+                error_msg = f'Failed, status_code: {rsp.status_code}, code: {body.get("code")}, message: {body.get("message")}'
                 logger.error(
                     "shot_request_failed",
                     error=error_msg,
@@ -139,121 +368,184 @@ class Wan26Adapter:
             )
             raise
 
+    async def _submit(self, request: ShotGenerationRequest) -> ShotGenerationResponse:
+        """Submission used by submit_many; subclasses may add retries."""
+        return await self.submit_shot_request(request)
+
+    async def submit_many(
+        self,
+        requests: List[ShotGenerationRequest],
+    ) -> List[Union[ShotGenerationResponse, BaseException]]:
+        """
+        Submit several shot requests concurrently
+
+        Concurrency is bounded by the adapter's submission cap
+        (DASHSCOPE_MAX_CONCURRENCY, see set_concurrency), shared with all
+        other submissions.
+
+        Args:
+            requests: Shot generation requests
+
+        Returns:
+            Response or raised exception per request, in request order
+        """
+        return await asyncio.gather(
+            *(self._submit(request) for request in requests),
+            return_exceptions=True,
+        )
+
+    async def query_task_status(self, task_id: str) -> Optional[ShotGenerationResponse]:
+        """
+        Query a task's status once
+
+        Args:
+            task_id: DashScope task ID
+
+        A 429 or 5xx answer says nothing about the task itself (it is still
+        rendering on DashScope's side), so it is treated like a pending task
+        and polled again; only other error statuses fail the task.
+
+        Returns:
+            ShotGenerationResponse once the task has finished (succeeded or
+            failed), or None while it is still pending (or its status could
+            not be read right now)
+
+        Raises:
+            Exception: If the status request fails
+        """
+        client = self._get_client()
+        task_url = self.base_url + TASK_PATH.format(task_id=task_id)
+        rsp = await client.get(task_url, headers=self._auth_headers)
+        task = _DashScopeTaskResponse.parse(rsp.content)
+
+        if rsp.status_code != HTTPStatus.OK:
+            error_msg = f'Failed, status_code: {rsp.status_code}, code: {task.code}, message: {task.message}'
+            if rsp.status_code == HTTPStatus.TOO_MANY_REQUESTS or rsp.status_code >= 500:
+                logger.warning(
+                    "task_query_retryable",
+                    task_id=task_id,
+                    error=error_msg,
+                )
+                return None
+
+            logger.error(
+                "task_failed",
+                task_id=task_id,
+                error=error_msg,
+            )
+
+            return ShotGenerationResponse(
+                task_id=task_id,
+                status="failed",
+                error=error_msg,
+            )
+
+        task_status = task.output.task_status
+        video_url = task.output.video_url
+        normalized_status = task_status.strip().lower()
+
+        if normalized_status in PENDING_TASK_STATUSES:
+            return None
+
+        if normalized_status and normalized_status not in SUCCEEDED_TASK_STATUSES:
+            error_msg = self._format_task_error(task)
+            logger.error(
+                "task_failed",
+                task_id=task_id,
+                task_status=task_status,
+                error=error_msg,
+            )
+            return ShotGenerationResponse(
+                task_id=task_id,
+                status="failed",
+                error=error_msg,
+            )
+
+        if not video_url:
+            error_msg = self._format_task_error(task)
+            if not error_msg:
+                error_msg = "Video synthesis completed but no video_url returned"
+            logger.error(
+                "task_failed",
+                task_id=task_id,
+                task_status=task_status or "unknown",
+                error=error_msg,
+            )
+            return ShotGenerationResponse(
+                task_id=task_id,
+                status="failed",
+                error=error_msg,
+            )
+
+        logger.info(
+            "task_completed",
+            task_id=task_id,
+            task_status=task_status or "unknown",
+            video_url=video_url,
+        )
+
+        return ShotGenerationResponse(
+            task_id=task_id,
+            status="succeeded",
+            video_url=video_url,
+        )
+
     async def poll_task_status(
         self,
         task_id: str,
-        max_attempts: int = 60,
-        poll_interval: int = 5,
+        timeout_s: float = 600.0,
+        poll_interval: float = 5.0,
     ) -> ShotGenerationResponse:
         """
-        Poll task status until completion or timeout using DashScope wait()
+        Poll task status until completion or timeout
+
+        The first query is sent immediately; while the task is pending the
+        delay doubles from POLL_INITIAL_DELAY_S up to poll_interval, with
+        jitter so concurrent shots do not poll in lockstep. A status query
+        that raises (e.g. a dropped connection) is retried on the same
+        schedule until the deadline.
 
         Args:
             task_id: DashScope task ID
-            max_attempts: Maximum number of polling attempts (not used with wait())
-            poll_interval: Seconds between polls (not used with wait())
+            timeout_s: Seconds to wait for the task to leave the pending states
+            poll_interval: Maximum seconds between polls
 
         Returns:
             ShotGenerationResponse with status and video_url if successful
 
         Raises:
-            Exception: If task fails or times out
+            TimeoutError: If the task is still pending after timeout_s
+            Exception: The last status request error, if the query was still
+                failing at the deadline
         """
         try:
-            if VideoSynthesis is None:
-                raise ImportError("dashscope VideoSynthesis is not available")
-
-            # Use DashScope VideoSynthesis.wait() for automatic polling
             logger.info(
                 "task_wait_start",
                 task_id=task_id,
             )
 
-            rsp = await asyncio.to_thread(
-                VideoSynthesis.wait,
-                task=task_id,
-                api_key=self.api_key,
-            )
-
-            if rsp.status_code == HTTPStatus.OK:
-                output_payload: Dict[str, Any] = (
-                    rsp.output if isinstance(rsp.output, dict) else {}
-                )
-                raw_task_status = None
-                raw_video_url = None
-                if rsp.output is not None:
-                    if isinstance(rsp.output, dict):
-                        raw_task_status = rsp.output.get("task_status")
-                        raw_video_url = rsp.output.get("video_url")
-                    else:
-                        raw_task_status = getattr(rsp.output, "task_status", None)
-                        raw_video_url = getattr(rsp.output, "video_url", None)
-
-                task_status = raw_task_status if isinstance(raw_task_status, str) else ""
-                video_url = raw_video_url if isinstance(raw_video_url, str) else ""
-                normalized_status = task_status.strip().lower()
-
-                if normalized_status and normalized_status not in {
-                    "succeeded",
-                    "success",
-                    "completed",
-                    "done",
-                    "finished",
-                }:
-                    error_msg = self._format_task_error(task_status, rsp, output_payload)
-                    logger.error(
-                        "task_failed",
-                        task_id=task_id,
-                        task_status=task_status,
-                        error=error_msg,
-                    )
-                    return ShotGenerationResponse(
-                        task_id=task_id,
-                        status="failed",
-                        error=error_msg,
-                    )
-
-                if not video_url:
-                    error_msg = self._format_task_error(task_status, rsp, output_payload)
-                    if not error_msg:
-                        error_msg = "Video synthesis completed but no video_url returned"
-                    logger.error(
-                        "task_failed",
-                        task_id=task_id,
-                        task_status=task_status or "unknown",
-                        error=error_msg,
-                    )
-                    return ShotGenerationResponse(
-                        task_id=task_id,
-                        status="failed",
-                        error=error_msg,
-                    )
-
-                logger.info(
-                    "task_completed",
-                    task_id=task_id,
-                    task_status=task_status or "unknown",
-                    video_url=video_url,
-                )
-
-                return ShotGenerationResponse(
-                    task_id=task_id,
-                    status="succeeded",
-                    video_url=video_url,
-                )
-            else:
-                error_msg = f'Failed, status_code: {rsp.status_code}, code: {rsp.code}, message: {rsp.message}'
-                logger.error(
-                    "task_failed",
-                    task_id=task_id,
-                    error=error_msg,
-                )
-
-                return ShotGenerationResponse(
-                    task_id=task_id,
-                    status="failed",
-                    error=error_msg,
-                )
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + timeout_s
+            delay = self.POLL_INITIAL_DELAY_S
+
+            while True:
+                try:
+                    response = await self.query_task_status(task_id)
+                    last_error = None
+                except Exception as e:
+                    logger.warning("task_query_retry", task_id=task_id, error=str(e))
+                    response, last_error = None, e
+                if response is not None:
+                    return response
+
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    if last_error is not None:
+                        raise last_error
+                    raise TimeoutError(f"Task {task_id} still pending after {timeout_s}s")
+                jitter = random.uniform(1 - self.POLL_JITTER, 1 + self.POLL_JITTER)
+                await asyncio.sleep(min(min(delay, poll_interval) * jitter, remaining))
+                delay *= 2
 
         except Exception as e:
             logger.error(
@@ -263,9 +555,98 @@ class Wan26Adapter:
             )
             raise
 
+    async def poll_many(
+        self,
+        task_ids: List[str],
+        timeout_s: float = 600.0,
+        poll_interval: Optional[float] = None,
+        done_q: Optional[asyncio.Queue] = None,
+    ) -> Dict[str, Union[ShotGenerationResponse, BaseException]]:
+        """
+        Poll several tasks from a single loop until all of them finish
+
+        Each task keeps its own backoff: after its n-th pending answer it is
+        due again after a full-jitter delay drawn from
+        [0, min(poll_interval, POLL_INITIAL_DELAY_S * 2**(n-1))], so tasks
+        submitted together drift apart instead of polling in lockstep. The
+        loop sleeps until the next task is due and queries every due task
+        concurrently. A task whose status query raises is retried on the
+        same schedule until the deadline.
+
+        Args:
+            task_ids: DashScope task IDs
+            timeout_s: Seconds to wait for the tasks to leave the pending states
+            poll_interval: Maximum seconds between polls of one task
+                (settings.dashscope_poll_interval_s if None)
+            done_q: Optional queue that receives (task_id, result) as soon as
+                each task finishes, so callers need not wait for the slowest
+
+        Returns:
+            Dict mapping each task ID to its final ShotGenerationResponse, or,
+            for tasks unfinished at the deadline, to the exception their last
+            status query raised (TimeoutError if it answered pending)
+        """
+        if poll_interval is None:
+            poll_interval = settings.dashscope_poll_interval_s
+
+        results: Dict[str, Union[ShotGenerationResponse, BaseException]] = {}
+        task_ids = list(dict.fromkeys(task_ids))
+        logger.info("task_wait_start", task_ids=task_ids)
+
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        deadline = now + timeout_s
+        # task_id -> (pending answers so far, loop time the next query is due)
+        schedule: Dict[str, tuple] = {task_id: (0, now) for task_id in task_ids}
+        # task_id -> error raised by its latest status query
+        last_errors: Dict[str, Exception] = {}
+
+        def _finish(task_id: str, result: Union[ShotGenerationResponse, BaseException]) -> None:
+            results[task_id] = result
+            if done_q is not None:
+                done_q.put_nowait((task_id, result))
+
+        while schedule:
+            now = loop.time()
+            due = [task_id for task_id, (_, at) in schedule.items() if at <= now]
+            responses = await asyncio.gather(
+                *(self.query_task_status(task_id) for task_id in due),
+                return_exceptions=True,
+            )
+            for task_id, response in zip(due, responses):
+                if isinstance(response, Exception):
+                    logger.warning("task_query_retry", task_id=task_id, error=str(response))
+                    last_errors[task_id] = response
+                    response = None
+                else:
+                    last_errors.pop(task_id, None)
+                if response is None:
+                    attempt = schedule[task_id][0]
+                    cap = min(poll_interval, self.POLL_INITIAL_DELAY_S * 2 ** attempt)
+                    schedule[task_id] = (attempt + 1, loop.time() + self._poll_rng.uniform(0, cap))
+                    continue
+                _finish(task_id, response)
+                del schedule[task_id]
+            if not schedule:
+                break
+
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                for task_id in schedule:
+                    error = last_errors.get(task_id)
+                    if error is None:
+                        error = TimeoutError(f"Task {task_id} still pending after {timeout_s}s")
+                    logger.error("task_poll_error", task_id=task_id, error=str(error))
+                    _finish(task_id, error)
+                break
+            next_due = min(at for _, at in schedule.values())
+            await asyncio.sleep(max(0.0, min(next_due - loop.time(), remaining)))
+
+        return results
+
     async def close(self):
-        """Close resources (no-op for DashScope SDK)"""
-        pass
+        """Close the shared HTTP client"""
+        await self.aclose_client()
 
 
 class Wan26RetryAdapter(Wan26Adapter):
@@ -276,6 +657,9 @@ class Wan26RetryAdapter(Wan26Adapter):
     MAX_RETRY_ATTEMPTS = 3
     RETRY_INITIAL_DELAY_S = 2
     RETRY_MAX_DELAY_S = 20
+    # Up to this many seconds of random jitter per backoff, so a fan-out batch
+    # that hits the same 503 does not retry in lockstep
+    RETRY_JITTER_S = 1
 
     async def submit_shot_request_with_retry(
         self,
@@ -293,42 +677,46 @@ class Wan26RetryAdapter(Wan26Adapter):
         Raises:
             Exception: If all retry attempts exhausted
         """
-        last_error = None
-
-        for attempt in range(self.MAX_RETRY_ATTEMPTS):
-            try:
-                return await self.submit_shot_request(request)
-            except Exception as e:
-                last_error = e
-                error_type = type(e).__name__
+        retrying = AsyncRetrying(
+            stop=stop_after_attempt(self.MAX_RETRY_ATTEMPTS),
+            wait=wait_exponential_jitter(
+                initial=self.RETRY_INITIAL_DELAY_S,
+                max=self.RETRY_MAX_DELAY_S,
+                jitter=self.RETRY_JITTER_S,
+            ),
+            retry=retry_if_exception(self._is_retryable_error),
+            before_sleep=self._log_retry,
+            sleep=asyncio.sleep,
+            reraise=True,
+        )
 
-                logger.warning(
-                    "shot_request_retry",
-                    attempt=attempt + 1,
+        try:
+            async for attempt in retrying:
+                with attempt:
+                    return await self.submit_shot_request(request)
+        except Exception as e:
+            if self._is_retryable_error(e):
+                # All retries exhausted
+                logger.error(
+                    "shot_request_exhausted",
                     max_attempts=self.MAX_RETRY_ATTEMPTS,
-                    error_type=error_type,
-                    error=str(e),
+                    last_error=str(e),
                 )
+            raise
 
-                # Check if error is retryable
-                if self._is_retryable_error(e):
-                    # Exponential backoff using asyncio
-                    delay = min(
-                        self.RETRY_INITIAL_DELAY_S * (2 ** attempt),
-                        self.RETRY_MAX_DELAY_S,
-                    )
-                    await asyncio.sleep(delay)
-                else:
-                    # Non-retryable error, raise immediately
-                    raise
-
-        # All retries exhausted
-        logger.error(
-            "shot_request_exhausted",
+    def _log_retry(self, retry_state: RetryCallState) -> None:
+        error = retry_state.outcome.exception()
+        logger.warning(
+            "shot_request_retry",
+            attempt=retry_state.attempt_number,
             max_attempts=self.MAX_RETRY_ATTEMPTS,
-            last_error=str(last_error),
+            error_type=type(error).__name__,
+            error=str(error),
+            sleep_s=round(retry_state.next_action.sleep, 3),
         )
-        raise last_error
+
+    async def _submit(self, request: ShotGenerationRequest) -> ShotGenerationResponse:
+        return await self.submit_shot_request_with_retry(request)
 
     def _is_retryable_error(self, error: Exception) -> bool:
         """
@@ -340,17 +728,8 @@ class Wan26RetryAdapter(Wan26Adapter):
         Returns:
             True if error is retryable
         """
-        # Network errors and timeout errors are retryable
-        error_message = str(error).lower()
-        retryable_keywords = [
-            'timeout',
-            'connection',
-            'network',
-            'temporary',
-            '500',
-            '502',
-            '503',
-            '504',
-        ]
-
-        return any(keyword in error_message for keyword in retryable_keywords)
+        # Network errors and timeout errors are retryable; httpx raises them
+        # with messages that are often empty, so match them by type
+        if isinstance(error, (httpx.TimeoutException, httpx.NetworkError)):
+            return True
+        return _RETRYABLE_ERROR_RE.search(str(error)) is not None
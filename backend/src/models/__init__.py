@@ -2,20 +2,176 @@
 SQLAlchemy Models Initialization
 """
 
-from sqlalchemy import create_engine
+import json
+from operator import attrgetter
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import DateTime, create_engine, inspect
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.sql.compiler import SQLCompiler
+from sqlalchemy.pool import StaticPool
+from sqlalchemy.sql.expression import FunctionElement
 from src.config.settings import settings
 
+try:
+    import orjson
+except Exception:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
+
+
+def _json_serializer(value: Any) -> str:
+    """Encode JSON column values (orjson when available)"""
+    if orjson is None:
+        return json.dumps(value)
+    # Non-string keys (e.g. per-shot dicts keyed by int) are stringified like stdlib json
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+_json_deserializer = orjson.loads if orjson is not None else json.loads
+
+
+def _engine_options(database_url: str) -> dict:
+    """
+    Pool options for the configured database
+
+    Server databases get a sized pool with pre-ping (dead connections are
+    replaced at checkout instead of failing mid-request) and periodic
+    recycling. SQLite ignores pool sizing; an in-memory database shares a
+    single connection so every session sees the same data.
+    """
+    if not database_url.startswith("sqlite"):
+        return {
+            "pool_size": settings.database_pool_size,
+            "max_overflow": settings.database_max_overflow,
+            "pool_pre_ping": True,
+            "pool_recycle": settings.database_pool_recycle_s,
+        }
+
+    options: dict = {"connect_args": {"check_same_thread": False}}
+    if database_url in ("sqlite://", "sqlite:///:memory:"):
+        options["poolclass"] = StaticPool
+    return options
+
+
 # Create engine
 engine = create_engine(
     settings.database_url,
-    connect_args={"check_same_thread": False} if settings.database_url.startswith("sqlite") else {}
+    json_serializer=_json_serializer,
+    json_deserializer=_json_deserializer,
+    **_engine_options(settings.database_url),
 )
 
 # Create base class for models
 Base = declarative_base()
 
+
+class utcnow(FunctionElement):
+    """
+    Database-side naive UTC timestamp for column defaults
+
+    Used as ``server_default``/``onupdate`` so timestamps are filled in by the
+    database instead of calling ``datetime.utcnow`` and binding a parameter
+    per row. Values keep the naive-UTC convention used everywhere else.
+    """
+
+    type = DateTime()
+    inherit_cache = True
+
+
+@compiles(utcnow)
+def _utcnow_default(element: utcnow, compiler: SQLCompiler, **kw: Any) -> str:
+    return "CURRENT_TIMESTAMP"
+
+
+@compiles(utcnow, "postgresql")
+def _utcnow_postgresql(element: utcnow, compiler: SQLCompiler, **kw: Any) -> str:
+    return "TIMEZONE('utc', CURRENT_TIMESTAMP)"
+
+
+@compiles(utcnow, "sqlite")
+def _utcnow_sqlite(element: utcnow, compiler: SQLCompiler, **kw: Any) -> str:
+    # CURRENT_TIMESTAMP is UTC on SQLite but only has second precision
+    return "STRFTIME('%Y-%m-%d %H:%M:%f', 'now')"
+
+
+class ColumnSerializerMixin:
+    """
+    Mapper-driven ``to_dict`` for ORM models
+
+    The serialized column keys, a single ``operator.attrgetter`` over them and
+    the DateTime columns needing ``isoformat()`` are resolved once per class
+    from ``inspect(cls).columns`` instead of hand-listing attributes per call.
+
+    Subclasses may set ``_dict_fields`` to serialize (in order) a subset of
+    columns or extra attributes, ``_dict_aliases`` to rename attribute keys in
+    the output and ``_dict_datetime_fields`` to mark non-column attributes
+    holding datetimes.
+    """
+
+    _dict_fields: Optional[Tuple[str, ...]] = None
+    _dict_aliases: Dict[str, str] = {}
+    _dict_datetime_fields: Tuple[str, ...] = ()
+
+    @classmethod
+    def _dict_plan(cls) -> Tuple[Tuple[str, ...], Callable, Tuple[str, ...]]:
+        plan = cls.__dict__.get("_dict_plan_cache")
+        if plan is None:
+            columns = inspect(cls).columns
+            fields = cls._dict_fields or tuple(columns.keys())
+            keys = tuple(cls._dict_aliases.get(field, field) for field in fields)
+            datetime_keys = tuple(
+                key for key, field in zip(keys, fields)
+                if field in cls._dict_datetime_fields
+                or (field in columns and isinstance(columns[field].type, DateTime))
+            )
+            getter = attrgetter(*fields)
+            if len(fields) == 1:
+                single = getter
+                getter = lambda obj: (single(obj),)
+            plan = (keys, getter, datetime_keys)
+            cls._dict_plan_cache = plan
+        return plan
+
+    @staticmethod
+    def _isoformat_datetimes(data: dict, datetime_keys: Tuple[str, ...]) -> dict:
+        for key in datetime_keys:
+            value = data[key]
+            if value is not None:
+                data[key] = value.isoformat()
+        return data
+
+    def to_dict(self, iso_datetimes: bool = True) -> dict:
+        """
+        Convert model to dictionary
+
+        Args:
+            iso_datetimes: Render DateTime values as ISO 8601 strings. Pass
+                False to keep ``datetime`` objects when the result is encoded
+                by orjson, which formats them natively (and identically).
+        """
+        keys, getter, datetime_keys = self._dict_plan()
+        data = dict(zip(keys, getter(self)))
+        if iso_datetimes and datetime_keys:
+            self._isoformat_datetimes(data, datetime_keys)
+        return data
+
+    @classmethod
+    def to_dicts(
+        cls,
+        rows: Iterable["ColumnSerializerMixin"],
+        iso_datetimes: bool = True,
+    ) -> List[dict]:
+        """Serialize many rows of this model with a single column plan"""
+        keys, getter, datetime_keys = cls._dict_plan()
+        result = [dict(zip(keys, getter(row))) for row in rows]
+        if iso_datetimes and datetime_keys:
+            for data in result:
+                cls._isoformat_datetimes(data, datetime_keys)
+        return result
+
+
 # Create session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
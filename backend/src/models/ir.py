@@ -2,15 +2,14 @@
 Intermediate Representation (IR) Model
 """
 
-from datetime import datetime
 from typing import Any, Dict, List
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from sqlalchemy import Column, Integer, String, JSON, DateTime
 
-from src.models import Base
+from src.models import Base, ColumnSerializerMixin, utcnow
 
 
-class IRModel(Base):
+class IRModel(ColumnSerializerMixin, Base):
     """
     Intermediate Representation - Structured output from LLM intent parsing
 
@@ -32,28 +31,29 @@ class IRModel(Base):
     audio = Column(JSON, nullable=False)  # {"mode": "auto_voiceover_in_prompt", "narration_language": "zh-CN", ...}
     duration_preference_s = Column(Integer, nullable=False)
     quality_mode = Column(String, nullable=False)  # "fast", "balanced", "high"
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, server_default=utcnow())
 
-    def to_dict(self) -> dict:
-        """Convert IR model to dictionary"""
-        return {
-            "topic": self.topic,
-            "intent": self.intent,
-            "optimized_prompt": self.optimized_prompt,
-            "style": self.style,
-            "scene": self.scene,
-            "characters": self.characters,
-            "emotion_curve": self.emotion_curve,
-            "subtitle_policy": self.subtitle_policy,
-            "audio": self.audio,
-            "duration_preference_s": self.duration_preference_s,
-            "quality_mode": self.quality_mode,
-        }
+    # Serialized columns (to_dict)
+    _dict_fields = (
+        "topic",
+        "intent",
+        "optimized_prompt",
+        "style",
+        "scene",
+        "characters",
+        "emotion_curve",
+        "subtitle_policy",
+        "audio",
+        "duration_preference_s",
+        "quality_mode",
+    )
 
 
 class IR(BaseModel):
     """Pydantic IR model for tests and lightweight usage."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     topic: str
     intent: str
     optimized_prompt: str
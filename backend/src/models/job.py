@@ -5,10 +5,20 @@ Job Model
 import uuid
 from datetime import datetime
 from enum import Enum
-from sqlalchemy import Column, Integer, String, JSON, DateTime, Index
-from typing import Optional, List
+from sqlalchemy import Column, ForeignKey, Integer, String, JSON, DateTime, Index
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy.orm import relationship
+from typing import Any, Dict, Optional, List
 
-from src.models import Base
+from src.models import Base, ColumnSerializerMixin, utcnow
+
+# JSON document column: binary JSONB on PostgreSQL (parsed once at write time),
+# plain JSON elsewhere (SQLite)
+JSONDocument = JSON().with_variant(JSONB(), "postgresql")
+
+# Job identifier: native 16-byte UUID on PostgreSQL, text elsewhere; Python
+# code always sees the canonical string form
+JobID = String().with_variant(UUID(as_uuid=False), "postgresql")
 
 
 class JobState(str, Enum):
@@ -21,7 +31,7 @@ class JobState(str, Enum):
     FAILED = "FAILED"
 
 
-class JobModel(Base):
+class JobModel(ColumnSerializerMixin, Base):
     """
     Job - Lifecycle and result tracking for a single user request
 
@@ -31,15 +41,15 @@ class JobModel(Base):
 
     __tablename__ = "jobs"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
 
     # Public job identifier
-    job_id = Column(String, unique=True, nullable=False, index=True)
+    job_id = Column(JobID, unique=True, nullable=False)
 
     # User input (PII redacted)
     user_input_redacted = Column(String, nullable=False)
-    user_input_hash = Column(String, nullable=False, index=True)
-    pii_flags = Column(JSON, nullable=True)  # List of detected PII categories
+    user_input_hash = Column(String, nullable=False)
+    pii_flags = Column(JSONDocument, nullable=True)  # List of detected PII categories
 
     # Template reference
     template_id = Column(String, nullable=False, index=True)
@@ -49,95 +59,104 @@ class JobModel(Base):
     quality_mode = Column(String, nullable=False)  # "fast", "balanced", "high"
 
     # Job state
-    state = Column(String, nullable=False, index=True)  # CREATED, SUBMITTED, RUNNING, SUCCEEDED, FAILED
+    state = Column(String, nullable=False)  # CREATED, SUBMITTED, RUNNING, SUCCEEDED, FAILED
     clarification_state = Column(String, nullable=True)  # "pending", "clarified", "waived"
-    clarification_required_fields = Column(JSON, nullable=True)  # Fields requiring clarification
+    clarification_required_fields = Column(JSONDocument, nullable=True)  # Fields requiring clarification
 
     # Intermediate data
-    ir = Column(JSON, nullable=False)  # Complete Intermediate Representation
-    shot_plan = Column(JSON, nullable=False)  # Complete Shot Plan
+    ir = Column(JSONDocument, nullable=False)  # Complete Intermediate Representation
+    shot_plan = Column(JSONDocument, nullable=False)  # Complete Shot Plan
 
     # Per-shot generation data
-    shot_requests = Column(JSON, nullable=False)  # Per-shot compiled prompts and params
-    shot_assets = Column(JSON, nullable=True)  # Per-shot video/audio assets
-    preview_shot_assets = Column(JSON, nullable=True)  # Preview candidates per shot
-    selected_seeds = Column(JSON, nullable=True)  # User-selected seeds per shot
+    shot_requests = Column(JSONDocument, nullable=False)  # Per-shot compiled prompts and params
+    shot_assets = Column(JSONDocument, nullable=True)  # Per-shot video/audio assets
+    preview_shot_assets = Column(JSONDocument, nullable=True)  # Preview candidates per shot
+    selected_seeds = Column(JSONDocument, nullable=True)  # User-selected seeds per shot
 
     # External task IDs
-    external_task_ids = Column(JSON, nullable=False)  # DashScope task IDs per shot
+    external_task_ids = Column(JSONDocument, nullable=False)  # DashScope task IDs per shot
 
     # Output metadata
     total_duration_s = Column(Integer, nullable=False)
     resolution = Column(String, nullable=False)  # "1280x720" or "1920x1080"
 
     # Error handling
-    error_details = Column(JSON, nullable=True)  # {"code": "ERROR_CODE", "message": "...", "classification": "retryable/non_retryable"}
+    error_details = Column(JSONDocument, nullable=True)  # {"code": "ERROR_CODE", "message": "...", "classification": "retryable/non_retryable"}
 
-    # State transitions
-    state_transitions = Column(JSON, nullable=False)  # [{"state": "CREATED", "timestamp": "...", "event": "job_created"}]
+    # State transitions and retry attempts live in append-only child tables
+    # (job_state_transitions / job_retries): one small INSERT per event
+    # instead of rewriting a growing JSON list on the job row
+    transitions = relationship(
+        "JobStateTransitionModel",
+        order_by="JobStateTransitionModel.seq",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+    )
+    retries = relationship(
+        "JobRetryModel",
+        order_by="JobRetryModel.attempt",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+    )
 
     # Retry tracking
-    retry_count = Column(Integer, default=0, nullable=False)
-    last_retry_error = Column(JSON, nullable=True)  # Last error details
-    retry_exhausted = Column(JSON, nullable=True)  # Boolean flag
+    retry_exhausted = Column(JSONDocument, nullable=True)  # Boolean flag
 
     # Revision tracking
-    revision_of = Column(String, nullable=True, index=True)  # Parent job_id if this is a revision
-    targeted_fields = Column(JSON, nullable=True)  # Fields modified in revision
+    revision_of = Column(JobID, nullable=True, index=True)  # Parent job_id if this is a revision
+    targeted_fields = Column(JSONDocument, nullable=True)  # Fields modified in revision
 
     # Timestamps
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
-    submitted_at = Column(DateTime, nullable=True)
-    running_at = Column(DateTime, nullable=True)
-    succeeded_at = Column(DateTime, nullable=True)
-    failed_at = Column(DateTime, nullable=True)
+    created_at = Column(DateTime, server_default=utcnow(), nullable=False)
+    updated_at = Column(DateTime, server_default=utcnow(), onupdate=utcnow())
+    # submitted_at / running_at / succeeded_at / failed_at are derived from
+    # job_state_transitions rather than stored as mostly-NULL columns
 
     # Indexes
     __table_args__ = (
-        Index("idx_job_id", "job_id"),
-        Index("idx_state", "state"),
+        # Serves equality-on-state filters and "latest N jobs in state X" (backward range scan)
+        Index("idx_state_created_at", "state", "created_at"),
         Index("idx_created_at", "created_at"),
         Index("idx_user_input_hash", "user_input_hash"),
     )
 
-    def to_dict(self) -> dict:
-        """Convert job model to dictionary"""
-        return {
-            "id": self.id,
-            "job_id": self.job_id,
-            "user_input_redacted": self.user_input_redacted,
-            "user_input_hash": self.user_input_hash,
-            "pii_flags": self.pii_flags,
-            "template_id": self.template_id,
-            "template_version": self.template_version,
-            "quality_mode": self.quality_mode,
-            "state": self.state,
-            "clarification_state": self.clarification_state,
-            "clarification_required_fields": self.clarification_required_fields,
-            "ir": self.ir,
-            "shot_plan": self.shot_plan,
-            "shot_requests": self.shot_requests,
-            "shot_assets": self.shot_assets,
-            "preview_shot_assets": self.preview_shot_assets,
-            "selected_seeds": self.selected_seeds,
-            "external_task_ids": self.external_task_ids,
-            "total_duration_s": self.total_duration_s,
-            "resolution": self.resolution,
-            "error_details": self.error_details,
-            "state_transitions": self.state_transitions,
-            "retry_count": self.retry_count,
-            "last_retry_error": self.last_retry_error,
-            "retry_exhausted": self.retry_exhausted,
-            "revision_of": self.revision_of,
-            "targeted_fields": self.targeted_fields,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
-            "submitted_at": self.submitted_at.isoformat() if self.submitted_at else None,
-            "running_at": self.running_at.isoformat() if self.running_at else None,
-            "succeeded_at": self.succeeded_at.isoformat() if self.succeeded_at else None,
-            "failed_at": self.failed_at.isoformat() if self.failed_at else None,
-        }
+    # Serialized columns (to_dict); history fields are read from the child tables
+    _dict_datetime_fields = ("submitted_at", "running_at", "succeeded_at", "failed_at")
+    _dict_fields = (
+        "id",
+        "job_id",
+        "user_input_redacted",
+        "user_input_hash",
+        "pii_flags",
+        "template_id",
+        "template_version",
+        "quality_mode",
+        "state",
+        "clarification_state",
+        "clarification_required_fields",
+        "ir",
+        "shot_plan",
+        "shot_requests",
+        "shot_assets",
+        "preview_shot_assets",
+        "selected_seeds",
+        "external_task_ids",
+        "total_duration_s",
+        "resolution",
+        "error_details",
+        "state_transitions",
+        "retry_count",
+        "last_retry_error",
+        "retry_exhausted",
+        "revision_of",
+        "targeted_fields",
+        "created_at",
+        "updated_at",
+        "submitted_at",
+        "running_at",
+        "succeeded_at",
+        "failed_at",
+    )
 
     @property
     def input_hash(self) -> str:
@@ -148,7 +167,112 @@ class JobModel(Base):
     def input_hash(self, value: str) -> None:
         self.user_input_hash = value
 
+    @property
+    def state_transitions(self) -> List[Dict[str, Any]]:
+        """State history as [{"state", "timestamp", "event"}], oldest first"""
+        return JobStateTransitionModel.to_dicts(self.transitions)
+
+    @state_transitions.setter
+    def state_transitions(self, value: List[Dict[str, Any]]) -> None:
+        self.transitions = [
+            JobStateTransitionModel.from_dict(seq, transition)
+            for seq, transition in enumerate(value or [])
+        ]
+
+    @property
+    def retry_count(self) -> int:
+        """Number of the latest retry attempt (0 when never retried)"""
+        return self.retries[-1].attempt if self.retries else 0
+
+    @property
+    def last_retry_error(self) -> Optional[Dict[str, Any]]:
+        """Error details recorded with the latest retry attempt"""
+        return self.retries[-1].error_details if self.retries else None
+
+    def _entered_state_at(self, state: str) -> Optional[datetime]:
+        """Timestamp of the latest transition into ``state``"""
+        for transition in reversed(self.transitions):
+            if transition.state == state:
+                return transition.timestamp
+        return None
+
+    @property
+    def submitted_at(self) -> Optional[datetime]:
+        """When the job last entered SUBMITTED"""
+        return self._entered_state_at(JobState.SUBMITTED.value)
+
+    @property
+    def running_at(self) -> Optional[datetime]:
+        """When the job last entered RUNNING"""
+        return self._entered_state_at(JobState.RUNNING.value)
+
+    @property
+    def succeeded_at(self) -> Optional[datetime]:
+        """When the job last entered SUCCEEDED"""
+        return self._entered_state_at(JobState.SUCCEEDED.value)
+
+    @property
+    def failed_at(self) -> Optional[datetime]:
+        """When the job last entered FAILED"""
+        return self._entered_state_at(JobState.FAILED.value)
+
     @staticmethod
     def generate_job_id() -> str:
         """Generate a unique job ID"""
         return str(uuid.uuid4())
+
+
+class JobStateTransitionModel(ColumnSerializerMixin, Base):
+    """
+    Job State Transition - Append-only lifecycle history of a job
+    """
+
+    __tablename__ = "job_state_transitions"
+
+    id = Column(Integer, primary_key=True)
+    job_id = Column(JobID, ForeignKey("jobs.job_id", ondelete="CASCADE"), nullable=False)
+    seq = Column(Integer, nullable=False)  # 0-based position in the job's history
+
+    state = Column(String, nullable=False)
+    timestamp = Column(DateTime, server_default=utcnow(), nullable=False)
+    event = Column(String, nullable=False)
+    payload = Column(JSONDocument, nullable=True)  # Optional event context
+
+    __table_args__ = (
+        Index("idx_job_transition_seq", "job_id", "seq", unique=True),
+    )
+
+    # Serialized columns (to_dict)
+    _dict_fields = ("state", "timestamp", "event")
+
+    @classmethod
+    def from_dict(cls, seq: int, transition: Dict[str, Any]) -> "JobStateTransitionModel":
+        """Build a transition row from its {"state", "timestamp", "event"} form"""
+        timestamp = transition.get("timestamp")
+        if isinstance(timestamp, str):
+            timestamp = datetime.fromisoformat(timestamp)
+        return cls(
+            seq=seq,
+            state=transition["state"],
+            timestamp=timestamp or datetime.utcnow(),
+            event=transition.get("event") or "state_updated",
+        )
+
+
+class JobRetryModel(ColumnSerializerMixin, Base):
+    """
+    Job Retry - Append-only record of retry attempts for a job
+    """
+
+    __tablename__ = "job_retries"
+
+    id = Column(Integer, primary_key=True)
+    job_id = Column(JobID, ForeignKey("jobs.job_id", ondelete="CASCADE"), nullable=False)
+    attempt = Column(Integer, nullable=False)
+
+    error_details = Column(JSONDocument, nullable=True)  # Error that triggered the retry
+    retried_at = Column(DateTime, server_default=utcnow(), nullable=False)
+
+    __table_args__ = (
+        Index("idx_job_retry_attempt", "job_id", "attempt"),
+    )
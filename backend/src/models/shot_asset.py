@@ -2,15 +2,14 @@
 Shot Asset Model
 """
 
-from datetime import datetime
 from typing import Optional
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from sqlalchemy import Column, Integer, String, JSON, DateTime
 
-from src.models import Base
+from src.models import Base, ColumnSerializerMixin, utcnow
 
 
-class ShotAssetModel(Base):
+class ShotAssetModel(ColumnSerializerMixin, Base):
     """
     Shot Asset - Per-shot output assets (video-only and audio-only files)
     """
@@ -40,27 +39,28 @@ class ShotAssetModel(Base):
     resolution = Column(String, nullable=False)  # "1280x720" or "1920x1080"
 
     # Timestamps
-    created_at = Column(DateTime, default=datetime.utcnow)
-
-    def to_dict(self) -> dict:
-        """Convert shot asset model to dictionary"""
-        return {
-            "shot_id": self.shot_id,
-            "seed": self.seed,
-            "model_task_id": self.model_task_id,
-            "raw_video_url": self.raw_video_url,
-            "video_url": self.video_url,
-            "audio_url": self.audio_url,
-            "video_path": self.video_path,
-            "audio_path": self.audio_path,
-            "duration_s": self.duration_s,
-            "resolution": self.resolution,
-        }
+    created_at = Column(DateTime, server_default=utcnow())
+
+    # Serialized columns (to_dict)
+    _dict_fields = (
+        "shot_id",
+        "seed",
+        "model_task_id",
+        "raw_video_url",
+        "video_url",
+        "audio_url",
+        "video_path",
+        "audio_path",
+        "duration_s",
+        "resolution",
+    )
 
 
 class ShotAsset(BaseModel):
     """Pydantic shot asset model for tests."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     shot_id: int
     video_url: str
     audio_url: str
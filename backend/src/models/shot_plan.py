@@ -2,15 +2,14 @@
 Shot Plan Models
 """
 
-from datetime import datetime
 from typing import Any, Dict, List
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from sqlalchemy import Column, Integer, String, JSON, DateTime
 
-from src.models import Base
+from src.models import Base, ColumnSerializerMixin, utcnow
 
 
-class ShotModel(Base):
+class ShotModel(ColumnSerializerMixin, Base):
     """
     Individual Shot within a Shot Plan
     """
@@ -24,21 +23,13 @@ class ShotModel(Base):
     visual = Column(String, nullable=False)
     camera_motion = Column(String, nullable=False)
     audio = Column(JSON, nullable=False)  # {"sfx": "clock_ticking", "narration": "long term insomnia?"}
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, server_default=utcnow())
 
-    def to_dict(self) -> dict:
-        """Convert shot model to dictionary"""
-        return {
-            "shot_id": self.shot_id,
-            "duration_s": self.duration_s,
-            "camera": self.camera,
-            "visual": self.visual,
-            "camera_motion": self.camera_motion,
-            "audio": self.audio,
-        }
+    # Serialized columns (to_dict)
+    _dict_fields = ("shot_id", "duration_s", "camera", "visual", "camera_motion", "audio")
 
 
-class ShotPlanModel(Base):
+class ShotPlanModel(ColumnSerializerMixin, Base):
     """
     Shot Plan - Template instantiation result with concrete shot details
     """
@@ -58,23 +49,18 @@ class ShotPlanModel(Base):
     global_style = Column(JSON, nullable=False)  # {"style": "cinematic", "lighting": "low", "color_tone": "cool", "pacing": "slow"}
 
     # Timestamps
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, server_default=utcnow())
 
-    def to_dict(self) -> dict:
-        """Convert shot plan model to dictionary"""
-        return {
-            "template_id": self.template_id,
-            "template_version": self.template_version,
-            "duration_s": self.duration_s,
-            "subtitle_policy": self.subtitle_policy,
-            "shots": self.shots,
-            "global": self.global_style,
-        }
+    # Serialized columns (to_dict)
+    _dict_fields = ("template_id", "template_version", "duration_s", "subtitle_policy", "shots", "global_style")
+    _dict_aliases = {"global_style": "global"}
 
 
 class ShotPlan(BaseModel):
     """Pydantic shot plan model for tests."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     template_id: str
     template_version: str
     duration_s: int
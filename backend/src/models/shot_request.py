@@ -2,15 +2,14 @@
 Shot Request Model
 """
 
-from datetime import datetime
 from typing import Any, Dict
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from sqlalchemy import Column, Integer, String, JSON, DateTime, Float
 
-from src.models import Base
+from src.models import Base, ColumnSerializerMixin, utcnow
 
 
-class ShotRequestModel(Base):
+class ShotRequestModel(ColumnSerializerMixin, Base):
     """
     Shot Request - Per-shot compiled prompt and generation parameters
     """
@@ -33,21 +32,17 @@ class ShotRequestModel(Base):
     prompt_extend = Column(JSON, nullable=False)  # Stores prompt_extend configuration
 
     # Timestamps
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, server_default=utcnow())
 
-    def to_dict(self) -> dict:
-        """Convert shot request model to dictionary"""
-        return {
-            "shot_id": self.shot_id,
-            "compiled_prompt": self.compiled_prompt,
-            "compiled_negative_prompt": self.compiled_negative_prompt,
-            "params": self.params,
-        }
+    # Serialized columns (to_dict)
+    _dict_fields = ("shot_id", "compiled_prompt", "compiled_negative_prompt", "params")
 
 
 class ShotRequest(BaseModel):
     """Pydantic shot request model for tests."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     shot_id: int
     compiled_prompt: str
     compiled_negative_prompt: str
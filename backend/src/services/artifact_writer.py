@@ -0,0 +1,77 @@
+"""
+Artifact Writer - Write non-critical job artifacts off the request path
+"""
+
+import asyncio
+import weakref
+from typing import Dict, Any, Optional
+
+from src.services.asset_storage import AssetStorage
+from src.services.observability import logger
+
+
+class AsyncArtifactWriter:
+    """
+    Background writer for job metadata JSON
+
+    Metadata is a derived artifact (the database holds the job state), so
+    workflows hand it off here and move on instead of waiting for the
+    fsynced write. Documents queued for the same job before the writer gets
+    to them are coalesced and only the latest is written. State transitions
+    stay synchronous in the database and never go through this queue.
+    """
+
+    # Live writers, so shutdown can flush every pending write
+    _writers: "weakref.WeakSet[AsyncArtifactWriter]" = weakref.WeakSet()
+
+    def __init__(self, asset_storage: AssetStorage):
+        """Initialize artifact writer"""
+        self.asset_storage = asset_storage
+        # job_id -> latest metadata not yet written (insertion ordered)
+        self._pending: Dict[str, Dict[str, Any]] = {}
+        self._drain_task: Optional[asyncio.Task] = None
+        AsyncArtifactWriter._writers.add(self)
+
+    async def enqueue(self, job_id: str, metadata: Dict[str, Any]) -> None:
+        """
+        Queue job metadata for writing and return immediately
+
+        Args:
+            job_id: Job identifier
+            metadata: Job metadata dictionary
+        """
+        self._pending.pop(job_id, None)
+        self._pending[job_id] = metadata
+        if self._drain_task is None or self._drain_task.done():
+            # The worker exits once the queue is empty; JobManager (and this
+            # writer) is created per request, so no task is left parked
+            self._drain_task = asyncio.create_task(self._drain_loop())
+
+    async def _drain_loop(self) -> None:
+        while self._pending:
+            job_id = next(iter(self._pending))
+            metadata = self._pending.pop(job_id)
+            try:
+                await self.asset_storage.write_job_metadata_async(job_id, metadata)
+            except Exception as e:
+                logger.error(
+                    "artifact_write_failed",
+                    job_id=job_id,
+                    error=str(e),
+                )
+
+    async def flush(self) -> None:
+        """
+        Wait until every queued artifact has been written
+        """
+        task = self._drain_task
+        if task is not None and not task.done():
+            await task
+
+    @classmethod
+    async def flush_all(cls) -> None:
+        """
+        Flush every live writer (application shutdown)
+        """
+        for writer in list(cls._writers):
+            await writer.flush()
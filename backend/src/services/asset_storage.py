@@ -2,13 +2,68 @@
 Asset Storage Service - Manages video, audio, and metadata file paths
 """
 
+import asyncio
 import os
 import json
-from datetime import datetime
-from typing import Dict, Any, List, Optional
+import tempfile
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Set, Tuple
 from pathlib import Path
 
 from src.config.settings import settings
+from src.config.constants import JOB_RETENTION_DAYS
+
+try:
+    import orjson
+except Exception:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+def _dump_metadata(metadata: Dict[str, Any]) -> bytes:
+    """Serialize job metadata as indented UTF-8 JSON"""
+    if orjson is None:
+        return json.dumps(metadata, indent=2, default=str).encode()
+    # datetime/UUID are native to orjson; default=str keeps the stdlib
+    # fallback for anything else
+    return orjson.dumps(
+        metadata,
+        default=str,
+        option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+    )
+
+
+def _load_metadata(data: bytes) -> Dict[str, Any]:
+    if orjson is None:
+        return json.loads(data)
+    return orjson.loads(data)
+
+
+def _asset_rows(table: Any) -> Any:
+    """
+    Restore shot assets from metadata written as {"columns": [...], "rows": [...]}
+
+    The public metadata file stores shot_assets as a list of objects; this only
+    keeps documents written in the earlier columnar form readable. Lists pass
+    through unchanged.
+    """
+    if isinstance(table, dict) and "columns" in table and "rows" in table:
+        columns = table["columns"]
+        return [dict(zip(columns, row)) for row in table["rows"]]
+    return table
+
+
+# Metadata locations are pure functions of the job id and storage settings,
+# and are looked up on every status query
+@lru_cache(maxsize=4096)
+def _metadata_path(metadata_dir: str, job_id: str) -> str:
+    return os.path.join(metadata_dir, f"{job_id}.json")
+
+
+@lru_cache(maxsize=4096)
+def _metadata_url(url_prefix: str, metadata_subdir: str, job_id: str) -> str:
+    return f"{url_prefix}/{metadata_subdir}/{job_id}.json"
 
 
 class AssetStorage:
@@ -16,6 +71,9 @@ class AssetStorage:
     Manages storage paths and URLs for video, audio, and metadata files
     """
 
+    # Parsed metadata documents kept in memory (least recently read evicted)
+    METADATA_CACHE_SIZE = 512
+
     def __init__(self):
         """Initialize asset storage"""
         self.static_root = settings.static_root
@@ -26,14 +84,70 @@ class AssetStorage:
         self.video_subdir = settings.static_video_subdir
         self.audio_subdir = settings.static_audio_subdir
         self.metadata_subdir = settings.static_metadata_subdir
+        # Downloads land next to the static root: usually the same filesystem,
+        # so moving them into place is a rename, but outside the tree served
+        # under /static, so partial or leftover files are never public
+        self.download_dir = f"{os.path.normpath(self.static_root)}-downloads"
+        # Current UTC date directory ("%Y/%m/%d") and the epoch second it expires
+        self._date_cache: Tuple[float, str] = (0.0, "")
+        # (date_str, video day dir, audio day dir); the dirs exist on disk
+        self._day_dirs_cache: Tuple[str, str, str] = ("", "", "")
+        # job_id -> (mtime_ns, size, parsed metadata)
+        self._metadata_cache: "OrderedDict[str, Tuple[int, int, Dict[str, Any]]]" = OrderedDict()
 
         # Ensure directories exist
         self._ensure_directories()
 
     def _ensure_directories(self):
         """Create storage directories if they don't exist"""
-        for directory in [self.video_dir, self.audio_dir, self.metadata_dir]:
-            Path(directory).mkdir(parents=True, exist_ok=True)
+        Path(self.metadata_dir).mkdir(parents=True, exist_ok=True)
+        Path(self.download_dir).mkdir(parents=True, exist_ok=True)
+        # Today's video/audio trees (and their roots) are created up front,
+        # so the first asset of the process skips the mkdir calls
+        self._day_dirs()
+
+    def _today_str(self) -> str:
+        """UTC date directory for new assets, recomputed once per UTC day"""
+        now = time.time()
+        expires, date_str = self._date_cache
+        # Also recompute if the clock stepped back before the cached day
+        if now >= expires or now < expires - 86400:
+            date_str = time.strftime("%Y/%m/%d", time.gmtime(now))
+            # Epoch days are UTC days, so the next boundary is a multiple of 86400
+            self._date_cache = ((now // 86400 + 1) * 86400, date_str)
+        return date_str
+
+    def _day_dirs(self) -> Tuple[str, str, str]:
+        """Today's (date_str, video dir, audio dir), created and joined once per day"""
+        today = self._today_str()
+        cached = self._day_dirs_cache
+        if cached[0] != today:
+            video_day_dir, audio_day_dir = self._ensure_day_dirs(today)
+            cached = self._day_dirs_cache = (today, video_day_dir, audio_day_dir)
+        return cached
+
+    def _ensure_day_dirs(self, date_str: str) -> Tuple[str, str]:
+        """Create the video and audio directories for one date in two makedirs calls"""
+        video_day_dir = os.path.join(self.video_dir, date_str)
+        audio_day_dir = os.path.join(self.audio_dir, date_str)
+        os.makedirs(video_day_dir, exist_ok=True)
+        os.makedirs(audio_day_dir, exist_ok=True)
+        return video_day_dir, audio_day_dir
+
+    @staticmethod
+    def _asset_name(job_id: str, shot_id: int, extension: str, suffix: Optional[str] = None) -> str:
+        base = f"{job_id}_shot_{shot_id}_{suffix}" if suffix else f"{job_id}_shot_{shot_id}"
+        return f"{base}.{extension}"
+
+    def _relpath(
+        self,
+        job_id: str,
+        shot_id: int,
+        extension: str,
+        suffix: Optional[str] = None,
+    ) -> str:
+        """Date-relative asset location used in URLs (e.g. 2025/01/02/<job>_shot_3.mp4)"""
+        return f"{self._today_str()}/{self._asset_name(job_id, shot_id, extension, suffix)}"
 
     def get_video_storage_path(
         self,
@@ -53,17 +167,7 @@ class AssetStorage:
         Returns:
             Absolute file path for video storage
         """
-        date_str = datetime.utcnow().strftime("%Y/%m/%d")
-        base = f"{job_id}_shot_{shot_id}"
-        if suffix:
-            base = f"{base}_{suffix}"
-        filename = f"{base}.{extension}"
-        path = os.path.join(self.video_dir, date_str, filename)
-
-        # Ensure date directory exists
-        Path(os.path.dirname(path)).mkdir(parents=True, exist_ok=True)
-
-        return path
+        return f"{self._day_dirs()[1]}/{self._asset_name(job_id, shot_id, extension, suffix)}"
 
     def get_audio_storage_path(
         self,
@@ -83,17 +187,7 @@ class AssetStorage:
         Returns:
             Absolute file path for audio storage
         """
-        date_str = datetime.utcnow().strftime("%Y/%m/%d")
-        base = f"{job_id}_shot_{shot_id}"
-        if suffix:
-            base = f"{base}_{suffix}"
-        filename = f"{base}.{extension}"
-        path = os.path.join(self.audio_dir, date_str, filename)
-
-        # Ensure date directory exists
-        Path(os.path.dirname(path)).mkdir(parents=True, exist_ok=True)
-
-        return path
+        return f"{self._day_dirs()[2]}/{self._asset_name(job_id, shot_id, extension, suffix)}"
 
     def get_metadata_storage_path(self, job_id: str) -> str:
         """
@@ -105,9 +199,7 @@ class AssetStorage:
         Returns:
             Absolute file path for metadata storage
         """
-        filename = f"{job_id}.json"
-        path = os.path.join(self.metadata_dir, filename)
-        return path
+        return _metadata_path(self.metadata_dir, job_id)
 
     def get_video_url(
         self,
@@ -127,12 +219,7 @@ class AssetStorage:
         Returns:
             URL path for video file
         """
-        date_str = datetime.utcnow().strftime("%Y/%m/%d")
-        base = f"{job_id}_shot_{shot_id}"
-        if suffix:
-            base = f"{base}_{suffix}"
-        filename = f"{base}.{extension}"
-        return f"{self.static_url_prefix}/{self.video_subdir}/{date_str}/{filename}"
+        return f"{self.static_url_prefix}/{self.video_subdir}/{self._relpath(job_id, shot_id, extension, suffix)}"
 
     def get_audio_url(
         self,
@@ -152,12 +239,50 @@ class AssetStorage:
         Returns:
             URL path for audio file
         """
-        date_str = datetime.utcnow().strftime("%Y/%m/%d")
-        base = f"{job_id}_shot_{shot_id}"
-        if suffix:
-            base = f"{base}_{suffix}"
-        filename = f"{base}.{extension}"
-        return f"{self.static_url_prefix}/{self.audio_subdir}/{date_str}/{filename}"
+        return f"{self.static_url_prefix}/{self.audio_subdir}/{self._relpath(job_id, shot_id, extension, suffix)}"
+
+    def get_video_path_and_url(
+        self,
+        job_id: str,
+        shot_id: int,
+        extension: str = "mp4",
+        suffix: Optional[str] = None,
+    ) -> Tuple[str, str]:
+        """
+        Get storage path and URL for the same video file
+
+        Both use the same date, so they always agree on the day directory
+        even when called across UTC midnight.
+
+        Returns:
+            (absolute file path, URL path)
+        """
+        today, video_day_dir, _ = self._day_dirs()
+        name = self._asset_name(job_id, shot_id, extension, suffix)
+        return (
+            f"{video_day_dir}/{name}",
+            f"{self.static_url_prefix}/{self.video_subdir}/{today}/{name}",
+        )
+
+    def get_audio_path_and_url(
+        self,
+        job_id: str,
+        shot_id: int,
+        extension: str = "mp3",
+        suffix: Optional[str] = None,
+    ) -> Tuple[str, str]:
+        """
+        Get storage path and URL for the same audio file
+
+        Returns:
+            (absolute file path, URL path)
+        """
+        today, _, audio_day_dir = self._day_dirs()
+        name = self._asset_name(job_id, shot_id, extension, suffix)
+        return (
+            f"{audio_day_dir}/{name}",
+            f"{self.static_url_prefix}/{self.audio_subdir}/{today}/{name}",
+        )
 
     def get_metadata_url(self, job_id: str) -> str:
         """
@@ -169,8 +294,7 @@ class AssetStorage:
         Returns:
             URL path for metadata file
         """
-        filename = f"{job_id}.json"
-        return f"{self.static_url_prefix}/{self.metadata_subdir}/{filename}"
+        return _metadata_url(self.static_url_prefix, self.metadata_subdir, job_id)
 
     def write_job_metadata(
         self,
@@ -187,12 +311,53 @@ class AssetStorage:
         Returns:
             File path where metadata was written
         """
-        path = self.get_metadata_storage_path(job_id)
+        path, _ = self.write_job_metadata_payload(job_id, metadata)
+        return path
 
-        with open(path, "w") as f:
-            json.dump(metadata, f, indent=2, default=str)
+    def write_job_metadata_payload(
+        self,
+        job_id: str,
+        metadata: Dict[str, Any],
+    ) -> Tuple[str, bytes]:
+        """
+        Atomically write job metadata and return the serialized payload
 
-        return path
+        The JSON is written to a temporary file in the metadata directory,
+        fsynced and moved over the final path with os.replace, so readers
+        never see a partially written file. Callers that also need the JSON
+        body can use the returned bytes instead of reading the file back.
+
+        Args:
+            job_id: Job identifier
+            metadata: Job metadata dictionary
+
+        Returns:
+            Tuple of (file path, serialized JSON bytes)
+        """
+        path = self.get_metadata_storage_path(job_id)
+        if "storage_date" not in metadata:
+            # Date directory of assets written with this document, for deletes
+            metadata = {**metadata, "storage_date": self._today_str()}
+        payload = _dump_metadata(metadata)
+
+        fd, tmp_path = tempfile.mkstemp(dir=self.metadata_dir, prefix=f".{job_id}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                # mkstemp creates 0600; metadata is served as a static file
+                os.fchmod(f.fileno(), 0o644)
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, path)
+            self._metadata_cache.pop(job_id, None)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except FileNotFoundError:
+                pass
+            raise
+
+        return path, payload
 
     def read_job_metadata(self, job_id: str) -> Dict[str, Any]:
         """
@@ -202,15 +367,98 @@ class AssetStorage:
             job_id: Job identifier
 
         Returns:
-            Job metadata dictionary
+            Job metadata dictionary. Parsed documents are cached per file
+            version (mtime, size) and shared between calls, so treat the
+            result as read-only.
         """
         path = self.get_metadata_storage_path(job_id)
 
-        if not os.path.exists(path):
-            raise FileNotFoundError(f"Metadata file not found: {path}")
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            self._metadata_cache.pop(job_id, None)
+            raise FileNotFoundError(f"Metadata file not found: {path}") from None
+
+        cached = self._metadata_cache.get(job_id)
+        if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            self._metadata_cache.move_to_end(job_id)
+            return cached[2]
+
+        with open(path, "rb") as f:
+            metadata = _load_metadata(f.read())
+        if "shot_assets" in metadata:
+            metadata["shot_assets"] = _asset_rows(metadata["shot_assets"])
+
+        self._metadata_cache[job_id] = (st.st_mtime_ns, st.st_size, metadata)
+        self._metadata_cache.move_to_end(job_id)
+        if len(self._metadata_cache) > self.METADATA_CACHE_SIZE:
+            self._metadata_cache.popitem(last=False)
+        return metadata
+
+    async def write_job_metadata_async(
+        self,
+        job_id: str,
+        metadata: Dict[str, Any],
+    ) -> str:
+        """
+        write_job_metadata in a worker thread, keeping the fsync off the event loop
+        """
+        return await asyncio.to_thread(self.write_job_metadata, job_id, metadata)
+
+    async def read_job_metadata_async(self, job_id: str) -> Dict[str, Any]:
+        """
+        read_job_metadata in a worker thread
+        """
+        return await asyncio.to_thread(self.read_job_metadata, job_id)
 
-        with open(path, "r") as f:
-            return json.load(f)
+    def _job_asset_dirs(self, job_id: str) -> Tuple[Set[str], Set[str]]:
+        """
+        Date directories holding a job's video and audio files
+
+        Taken from the storage date and asset paths recorded in the job's
+        metadata, so jobs created on an earlier UTC day are found; today's
+        directories are always included. Without metadata every day in the
+        retention window is checked.
+        """
+        try:
+            metadata = self.read_job_metadata(job_id)
+        except (FileNotFoundError, ValueError):
+            now = time.time()
+            days = [
+                time.strftime("%Y/%m/%d", time.gmtime(now - offset * 86400))
+                for offset in range(JOB_RETENTION_DAYS + 1)
+            ]
+            return (
+                {os.path.join(self.video_dir, day) for day in days},
+                {os.path.join(self.audio_dir, day) for day in days},
+            )
+
+        days = {self._today_str()}
+        if isinstance(metadata.get("storage_date"), str):
+            days.add(metadata["storage_date"])
+        video_dirs = {os.path.join(self.video_dir, day) for day in days}
+        audio_dirs = {os.path.join(self.audio_dir, day) for day in days}
+
+        for asset in metadata.get("shot_assets") or []:
+            if not isinstance(asset, dict):
+                continue
+            if asset.get("video_path"):
+                video_dirs.add(os.path.dirname(asset["video_path"]))
+            if asset.get("audio_path"):
+                audio_dirs.add(os.path.dirname(asset["audio_path"]))
+        return video_dirs, audio_dirs
+
+    @staticmethod
+    def _unlink_matching(directory: str, prefix: str, suffix: str, deleted_paths: List[str]) -> None:
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if name.startswith(prefix) and name.endswith(suffix):
+                        os.unlink(entry.path)
+                        deleted_paths.append(entry.path)
+        except FileNotFoundError:
+            pass
 
     def delete_job_assets(self, job_id: str) -> List[str]:
         """
@@ -222,33 +470,23 @@ class AssetStorage:
         Returns:
             List of deleted file paths
         """
-        deleted_paths = []
+        deleted_paths: List[str] = []
+        prefix = f"{job_id}_shot_"
+        video_dirs, audio_dirs = self._job_asset_dirs(job_id)
 
         # Delete video files
-        date_str = datetime.utcnow().strftime("%Y/%m/%d")
-        video_pattern = f"{job_id}_shot_"
-        video_dir = os.path.join(self.video_dir, date_str)
-
-        if os.path.exists(video_dir):
-            for filename in os.listdir(video_dir):
-                if filename.startswith(video_pattern) and filename.endswith(".mp4"):
-                    path = os.path.join(video_dir, filename)
-                    os.remove(path)
-                    deleted_paths.append(path)
+        for video_dir in video_dirs:
+            self._unlink_matching(video_dir, prefix, ".mp4", deleted_paths)
 
         # Delete audio files
-        audio_dir = os.path.join(self.audio_dir, date_str)
-        if os.path.exists(audio_dir):
-            for filename in os.listdir(audio_dir):
-                if filename.startswith(video_pattern) and filename.endswith(".mp3"):
-                    path = os.path.join(audio_dir, filename)
-                    os.remove(path)
-                    deleted_paths.append(path)
+        for audio_dir in audio_dirs:
+            self._unlink_matching(audio_dir, prefix, ".mp3", deleted_paths)
 
         # Delete metadata file
+        self._metadata_cache.pop(job_id, None)
         metadata_path = self.get_metadata_storage_path(job_id)
         if os.path.exists(metadata_path):
-            os.remove(metadata_path)
+            os.unlink(metadata_path)
             deleted_paths.append(metadata_path)
 
         return deleted_paths
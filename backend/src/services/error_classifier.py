@@ -2,10 +2,101 @@
 Error Classifier - Classify errors as retryable or non-retryable
 """
 
-from typing import Dict, Any
+from types import MappingProxyType
+from typing import Dict, Any, Callable, Mapping, Sequence, Tuple
 import httpx
 
 
+def _classification(
+    code: str,
+    message: str,
+    retryable: bool,
+    suggested_modifications: Sequence[str] = (),
+) -> Dict[str, Any]:
+    return {
+        "code": code,
+        "message": message,
+        "classification": "retryable" if retryable else "non_retryable",
+        "retryable": retryable,
+        "suggested_modifications": list(suggested_modifications),
+    }
+
+
+def _template(*args: Any) -> Mapping[str, Any]:
+    return MappingProxyType(_classification(*args))
+
+
+def _from_template(template: Mapping[str, Any]) -> Dict[str, Any]:
+    """Fresh, JSON-serializable copy of a shared result template"""
+    result = dict(template)
+    result["suggested_modifications"] = list(template["suggested_modifications"])
+    return result
+
+
+# Results that never depend on the error instance; read-only templates that
+# classify() copies, so callers can store or mutate what they get back
+_NETWORK_TIMEOUT = _template(
+    "NETWORK_TIMEOUT",
+    "Network timeout while connecting to video generation service",
+    True,
+)
+_NETWORK_ERROR = _template("NETWORK_ERROR", "Network error occurred", True)
+_DASHSCOPE_AUTH = _template(
+    "DASHSCOPE_AUTH",
+    "Authentication failed. Please check API credentials",
+    False,
+    ("Verify DASHSCOPE_API_KEY is correct",),
+)
+_DASHSCOPE_RATE_LIMIT = _template(
+    "DASHSCOPE_RATE_LIMIT",
+    "Rate limit exceeded for video generation service",
+    True,
+    ("Wait a few minutes and try again",),
+)
+_DASHSCOPE_UNAVAILABLE = _template(
+    "DASHSCOPE_TIMEOUT",
+    "Video generation service temporarily unavailable",
+    True,
+    ("Try again in a few minutes",),
+)
+_UNKNOWN_SUGGESTIONS = ("Please try again or contact support",)
+
+
+# HTTP statuses with a dedicated result; other 4xx/5xx fall back by class
+_STATUS_TEMPLATES: Dict[int, Mapping[str, Any]] = {
+    401: _DASHSCOPE_AUTH,
+    429: _DASHSCOPE_RATE_LIMIT,
+}
+
+_FFMPEG_SUGGESTIONS: Dict[str, Tuple[str, ...]] = {
+    "FFMPEG_NOT_FOUND": (
+        "FFmpeg is not installed on the server",
+        "Contact system administrator",
+    ),
+    "INPUT_FILE_NOT_FOUND": (
+        "Generated video file not found",
+        "Try regenerating the video",
+    ),
+    "EXTRACTION_FAILED": (
+        "Video processing failed",
+        "The video may be corrupted",
+        "Try regenerating with different parameters",
+    ),
+    "AUDIO_STREAM_MISSING": (
+        "The generated video has no audio track",
+        "Try regenerating with audio enabled",
+    ),
+}
+_FFMPEG_DEFAULT_SUGGESTIONS = ("Video processing error",)
+
+# (substring of the lowercased error message, suggestion), checked in order
+_VALIDATION_RULES: Tuple[Tuple[str, str], ...] = (
+    ("duration", "Adjust video duration to be between 2-15 seconds"),
+    ("resolution", "Use supported resolution: 1280x720 or 1920x1080"),
+    ("subtitle", "Review subtitle policy requirements"),
+)
+
+
 class ErrorClassifier:
     """
     Classify errors for retry logic and user-facing messages
@@ -27,6 +118,9 @@ class ErrorClassifier:
     ERROR_JOB_TIMEOUT = "JOB_TIMEOUT"
     ERROR_UNKNOWN = "UNKNOWN_ERROR"
 
+    # Exception type -> handler, filled in the first time each type is seen
+    _handlers: Dict[type, Callable[["ErrorClassifier", Exception], Dict[str, Any]]] = {}
+
     def classify(self, error: Exception) -> Dict[str, Any]:
         """
         Classify error with user-facing message
@@ -37,97 +131,97 @@ class ErrorClassifier:
         Returns:
             Dict with code, message, classification, retryable, suggested_modifications
         """
-        if isinstance(error, httpx.TimeoutException):
-            return {
-                "code": self.ERROR_NETWORK_TIMEOUT,
-                "message": "Network timeout while connecting to video generation service",
-                "classification": "retryable",
-                "retryable": True,
-                "suggested_modifications": [],
-            }
-
-        elif isinstance(error, httpx.NetworkError):
-            return {
-                "code": self.ERROR_NETWORK_ERROR,
-                "message": "Network error occurred",
-                "classification": "retryable",
-                "retryable": True,
-                "suggested_modifications": [],
-            }
-
-        elif isinstance(error, httpx.HTTPStatusError):
-            status = error.response.status_code
-
-            if status == 401:
-                return {
-                    "code": self.ERROR_DASHSCOPE_AUTH,
-                    "message": "Authentication failed. Please check API credentials",
-                    "classification": "non_retryable",
-                    "retryable": False,
-                    "suggested_modifications": ["Verify DASHSCOPE_API_KEY is correct"],
-                }
-
-            elif status == 429:
-                return {
-                    "code": self.ERROR_DASHSCOPE_RATE_LIMIT,
-                    "message": "Rate limit exceeded for video generation service",
-                    "classification": "retryable",
-                    "retryable": True,
-                    "suggested_modifications": ["Wait a few minutes and try again"],
-                }
-
-            elif 400 <= status < 500:
-                # Client error - non-retryable
-                return {
-                    "code": self.ERROR_DASHSCOPE_INVALID_PARAM,
-                    "message": f"Invalid request parameters: {error.response.text}",
-                    "classification": "non_retryable",
-                    "retryable": False,
-                    "suggested_modifications": ["Check request parameters and try again"],
-                }
-
-            elif 500 <= status < 600:
-                # Server error - retryable
-                return {
-                    "code": self.ERROR_DASHSCOPE_TIMEOUT,
-                    "message": "Video generation service temporarily unavailable",
-                    "classification": "retryable",
-                    "retryable": True,
-                    "suggested_modifications": ["Try again in a few minutes"],
-                }
+        error_type = type(error)
+        handler = self._handlers.get(error_type)
+        if handler is None:
+            handler = self._handlers[error_type] = self._resolve_handler(error_type)
+        return handler(self, error)
+
+    @classmethod
+    def _resolve_handler(
+        cls,
+        error_type: type,
+    ) -> Callable[["ErrorClassifier", Exception], Dict[str, Any]]:
+        """
+        Pick the handler for an exception type (once per type)
+
+        Args:
+            error_type: Concrete exception class
+
+        Returns:
+            Unbound handler taking (classifier, error)
+        """
+        if issubclass(error_type, httpx.TimeoutException):
+            return cls._classify_timeout
+        if issubclass(error_type, httpx.NetworkError):
+            return cls._classify_network
+        if issubclass(error_type, httpx.HTTPStatusError):
+            return cls._classify_http_status
 
         # FFmpeg errors
-        if "FFmpegError" in type(error).__name__:
+        name = error_type.__name__
+        if "FFmpegError" in name:
             from src.services.ffmpeg_splitter import FFmpegError
-            if isinstance(error, FFmpegError):
-                return {
-                    "code": error.code,
-                    "message": error.message,
-                    "classification": "non_retryable",
-                    "retryable": False,
-                    "suggested_modifications": self._get_ffmpeg_suggestions(error.code),
-                }
+            if issubclass(error_type, FFmpegError):
+                return cls._classify_ffmpeg
 
         # Validation errors
-        if "ValidationError" in type(error).__name__ or "ValueError" in type(error).__name__:
-            return {
-                "code": self.ERROR_VALIDATION_FAILED,
-                "message": str(error),
-                "classification": "non_retryable",
-                "retryable": False,
-                "suggested_modifications": self._extract_validation_suggestions(error),
-            }
-
-        # Default - unknown error
-        return {
-            "code": self.ERROR_UNKNOWN,
-            "message": f"An unexpected error occurred: {str(error)}",
-            "classification": "non_retryable",
-            "retryable": False,
-            "suggested_modifications": ["Please try again or contact support"],
-        }
-
-    def _get_ffmpeg_suggestions(self, error_code: str) -> list:
+        if "ValidationError" in name or "ValueError" in name:
+            return cls._classify_validation
+
+        return cls._classify_unknown
+
+    def _classify_timeout(self, error: Exception) -> Dict[str, Any]:
+        return _from_template(_NETWORK_TIMEOUT)
+
+    def _classify_network(self, error: Exception) -> Dict[str, Any]:
+        return _from_template(_NETWORK_ERROR)
+
+    def _classify_http_status(self, error: httpx.HTTPStatusError) -> Dict[str, Any]:
+        status = error.response.status_code
+        template = _STATUS_TEMPLATES.get(status)
+        if template is not None:
+            return _from_template(template)
+
+        status_class = status // 100
+        if status_class == 4:
+            # Client error - non-retryable
+            return _classification(
+                self.ERROR_DASHSCOPE_INVALID_PARAM,
+                f"Invalid request parameters: {error.response.text}",
+                False,
+                ("Check request parameters and try again",),
+            )
+        if status_class == 5:
+            # Server error - retryable
+            return _from_template(_DASHSCOPE_UNAVAILABLE)
+        return self._classify_unknown(error)
+
+    def _classify_ffmpeg(self, error: Exception) -> Dict[str, Any]:
+        return _classification(
+            error.code,
+            error.message,
+            False,
+            self._get_ffmpeg_suggestions(error.code),
+        )
+
+    def _classify_validation(self, error: Exception) -> Dict[str, Any]:
+        return _classification(
+            self.ERROR_VALIDATION_FAILED,
+            str(error),
+            False,
+            self._extract_validation_suggestions(error),
+        )
+
+    def _classify_unknown(self, error: Exception) -> Dict[str, Any]:
+        return _classification(
+            self.ERROR_UNKNOWN,
+            f"An unexpected error occurred: {str(error)}",
+            False,
+            _UNKNOWN_SUGGESTIONS,
+        )
+
+    def _get_ffmpeg_suggestions(self, error_code: str) -> Tuple[str, ...]:
         """
         Get user-facing suggestions for FFmpeg errors
 
@@ -135,29 +229,9 @@ class ErrorClassifier:
             error_code: FFmpeg error code
 
         Returns:
-            List of suggestion strings
+            Tuple of suggestion strings
         """
-        suggestions_map = {
-            "FFMPEG_NOT_FOUND": [
-                "FFmpeg is not installed on the server",
-                "Contact system administrator",
-            ],
-            "INPUT_FILE_NOT_FOUND": [
-                "Generated video file not found",
-                "Try regenerating the video",
-            ],
-            "EXTRACTION_FAILED": [
-                "Video processing failed",
-                "The video may be corrupted",
-                "Try regenerating with different parameters",
-            ],
-            "AUDIO_STREAM_MISSING": [
-                "The generated video has no audio track",
-                "Try regenerating with audio enabled",
-            ],
-        }
-
-        return suggestions_map.get(error_code, ["Video processing error"])
+        return _FFMPEG_SUGGESTIONS.get(error_code, _FFMPEG_DEFAULT_SUGGESTIONS)
 
     def _extract_validation_suggestions(self, error: Exception) -> list:
         """
@@ -169,22 +243,10 @@ class ErrorClassifier:
         Returns:
             List of suggestion strings
         """
-        suggestions = []
-
-        # Check if error has suggested_modifications attribute
-        if hasattr(error, "suggested_modifications"):
-            suggestions.extend(error.suggested_modifications)
-
-        # Check error message for common patterns
+        # Suggestions carried by the error come first, then message patterns
+        suggestions = list(getattr(error, "suggested_modifications", ()))
         error_msg = str(error).lower()
-
-        if "duration" in error_msg:
-            suggestions.append("Adjust video duration to be between 2-15 seconds")
-
-        if "resolution" in error_msg:
-            suggestions.append("Use supported resolution: 1280x720 or 1920x1080")
-
-        if "subtitle" in error_msg:
-            suggestions.append("Review subtitle policy requirements")
-
+        suggestions.extend(
+            suggestion for keyword, suggestion in _VALIDATION_RULES if keyword in error_msg
+        )
         return suggestions
@@ -2,10 +2,14 @@
 FFmpeg Splitter - Split video into video-only and audio-only files
 """
 
+import asyncio
 import subprocess
 import shutil
 import os
 import tempfile
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from typing import Tuple, Optional, Dict, Any
 from pathlib import Path
 
@@ -15,9 +19,27 @@ from src.config.constants import (
     FFMPEG_AUDIO_CODEC,
     FFMPEG_VIDEO_BITRATE,
     FFMPEG_AUDIO_BITRATE,
+    FFMPEG_VIDEO_COPY_CODECS,
+    FFMPEG_AUDIO_COPY_CODECS,
+    FFMPEG_STDERR_TAIL_LINES,
 )
 from src.services.observability import logger
 
+try:
+    import orjson
+except Exception:  # pragma: no cover - optional dependency
+    orjson = None
+
+# Parent environment variables ffmpeg/ffprobe may need; everything else is
+# left out so each spawn copies a small environment
+_FFMPEG_ENV_KEYS = ("PATH", "HOME", "TMPDIR", "LD_LIBRARY_PATH", "FONTCONFIG_PATH")
+
+
+def _ffmpeg_env() -> Dict[str, str]:
+    env = {key: os.environ[key] for key in _FFMPEG_ENV_KEYS if key in os.environ}
+    env["LANG"] = "C"
+    return env
+
 
 class FFmpegError(Exception):
     """FFmpeg processing error"""
@@ -43,10 +65,20 @@ class FFmpegSplitter:
     def __init__(self):
         """Initialize FFmpeg splitter"""
         self.ffmpeg_path = settings.ffmpeg_path
+        # The binary cannot appear or vanish mid-process, so it is located
+        # once and every ffmpeg run execs the absolute path directly
+        self._ffmpeg_abspath = self._resolve_ffmpeg_path()
+        self._ffmpeg_exe = self._ffmpeg_abspath or self.ffmpeg_path
         self.video_codec = FFMPEG_VIDEO_CODEC  # libx264
         self.audio_codec = FFMPEG_AUDIO_CODEC  # mp3
         self.video_bitrate = FFMPEG_VIDEO_BITRATE  # 2M
         self.audio_bitrate = FFMPEG_AUDIO_BITRATE  # 192k
+        # Resolved once so each probe skips the PATH search
+        self.ffprobe_path = shutil.which("ffprobe") or "ffprobe"
+        # Python's own fds are non-inheritable (PEP 446), so skipping the fd
+        # close pass is safe and, with an absolute executable, lets
+        # subprocess use posix_spawn instead of fork+exec
+        self._spawn_kwargs: Dict[str, Any] = {"close_fds": False, "env": _ffmpeg_env()}
 
     def split_video_audio(
         self,
@@ -86,17 +118,43 @@ class FFmpegSplitter:
         Path(audio_output_path).parent.mkdir(parents=True, exist_ok=True)
 
         try:
-            # Extract video-only stream
-            logger.info(
-                "video_extraction_start",
-                input_path=input_path,
-                output_path=video_output_path,
-            )
+            # One probe gives both the audio check and the codecs deciding
+            # whether each track can be stream-copied
+            codecs = self._probe_stream_codecs(input_path)
+            has_audio = codecs is None or "audio" in codecs
+            video_codec = codecs.get("video") if codecs else None
+            audio_codec = codecs.get("audio") if codecs else None
+
+            # Both extractions read the same input independently, so the audio
+            # ffmpeg runs in a helper thread while the video one runs here
+            with ThreadPoolExecutor(max_workers=1, thread_name_prefix="ffmpeg-audio") as pool:
+                audio_future = None
+                if has_audio:
+                    logger.info(
+                        "audio_extraction_start",
+                        input_path=input_path,
+                        output_path=audio_output_path,
+                    )
+                    audio_future = pool.submit(
+                        self._extract_audio,
+                        input_path,
+                        audio_output_path,
+                        source_codec=audio_codec,
+                    )
 
-            video_result = self._extract_video(
-                input_path,
-                video_output_path,
-            )
+                # Extract video-only stream
+                logger.info(
+                    "video_extraction_start",
+                    input_path=input_path,
+                    output_path=video_output_path,
+                )
+
+                video_result = self._extract_video(
+                    input_path,
+                    video_output_path,
+                    source_codec=video_codec,
+                )
+                audio_result = audio_future.result() if audio_future is not None else None
 
             if video_result.returncode != 0:
                 error_msg = video_result.stderr.decode('utf-8', errors='ignore')
@@ -106,15 +164,20 @@ class FFmpegSplitter:
                     details=error_msg,
                 )
 
+            # ffmpeg already reported the output duration on its progress
+            # stream; ffprobe is only spawned when that is unavailable
+            video_duration = self._progress_duration(video_result.stdout)
+            if video_duration is None:
+                video_duration = self._get_video_duration(video_output_path)
+
             # Extract audio-only stream (fallback to silent audio when missing)
-            if not self._has_audio_stream(input_path):
+            if audio_result is None:
                 logger.warning(
                     "audio_stream_missing",
                     input_path=input_path,
                 )
-                duration = self._get_video_duration(video_output_path)
                 audio_result = self._generate_silent_audio(
-                    duration_s=duration,
+                    duration_s=video_duration,
                     output_path=audio_output_path,
                 )
                 if audio_result.returncode != 0:
@@ -124,28 +187,15 @@ class FFmpegSplitter:
                         self.ERROR_AUDIO_STREAM_MISSING,
                         details=error_msg,
                     )
-            else:
-                logger.info(
-                    "audio_extraction_start",
-                    input_path=input_path,
-                    output_path=audio_output_path,
-                )
-
-                audio_result = self._extract_audio(
-                    input_path,
-                    audio_output_path,
+            elif audio_result.returncode != 0:
+                error_msg = audio_result.stderr.decode('utf-8', errors='ignore')
+                raise FFmpegError(
+                    f"Audio extraction failed: {error_msg}",
+                    self.ERROR_EXTRACTION_FAILED,
+                    details=error_msg,
                 )
 
-                if audio_result.returncode != 0:
-                    error_msg = audio_result.stderr.decode('utf-8', errors='ignore')
-                    raise FFmpegError(
-                        f"Audio extraction failed: {error_msg}",
-                        self.ERROR_EXTRACTION_FAILED,
-                        details=error_msg,
-                    )
-
             # Get file info
-            video_duration = self._get_video_duration(video_output_path)
             video_size = os.path.getsize(video_output_path)
             audio_size = os.path.getsize(audio_output_path)
 
@@ -181,76 +231,115 @@ class FFmpegSplitter:
                 details=str(e),
             )
 
-    def _is_ffmpeg_available(self) -> bool:
+    async def split_video_audio_async(
+        self,
+        input_path: str,
+        video_output_path: str,
+        audio_output_path: str,
+    ) -> Dict[str, Any]:
+        """
+        Run split_video_audio in a worker thread so the event loop stays free
+
+        Args:
+            input_path: Path to input video file
+            video_output_path: Path for video-only output
+            audio_output_path: Path for audio-only output
+
+        Returns:
+            Same result dict as split_video_audio
+        """
+        return await asyncio.to_thread(
+            self.split_video_audio,
+            input_path,
+            video_output_path,
+            audio_output_path,
+        )
+
+    def _resolve_ffmpeg_path(self) -> Optional[str]:
         if os.path.isabs(self.ffmpeg_path) or os.sep in self.ffmpeg_path:
-            return os.path.exists(self.ffmpeg_path) and os.access(self.ffmpeg_path, os.X_OK)
-        return shutil.which(self.ffmpeg_path) is not None
+            if os.path.exists(self.ffmpeg_path) and os.access(self.ffmpeg_path, os.X_OK):
+                return os.path.abspath(self.ffmpeg_path)
+            return None
+        return shutil.which(self.ffmpeg_path)
+
+    def _is_ffmpeg_available(self) -> bool:
+        return self._ffmpeg_abspath is not None
 
     def _extract_video(
         self,
         input_path: str,
         output_path: str,
+        source_codec: Optional[str] = None,
     ) -> subprocess.CompletedProcess:
         """
         Extract video-only stream (no audio)
 
+        H.264/HEVC sources (what DashScope returns) are remuxed with
+        ``-c:v copy``; anything else is re-encoded with libx264. Progress is
+        written to stdout so the output duration can be read back with
+        ``_progress_duration``.
+
         Args:
             input_path: Input video file path
             output_path: Output video file path
+            source_codec: Input video codec name from ffprobe, if known
 
         Returns:
             subprocess result
         """
+        if source_codec in FFMPEG_VIDEO_COPY_CODECS:
+            codec_args = ["-c:v", "copy"]
+        else:
+            codec_args = ["-c:v", self.video_codec, "-b:v", self.video_bitrate]
+
         cmd = [
-            self.ffmpeg_path,
+            self._ffmpeg_exe,
             "-i", input_path,
-            "-c:v", self.video_codec,
-            "-b:v", self.video_bitrate,
+            *codec_args,
             "-an",  # No audio
+            "-movflags", "+faststart",
+            "-progress", "pipe:1",  # Key=value progress on stdout
+            "-nostats",
             "-y",  # Overwrite output file
             output_path,
         ]
 
-        result = subprocess.run(
-            cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-        )
-
-        return result
+        return self._run_ffmpeg(cmd, read_progress=True)
 
     def _extract_audio(
         self,
         input_path: str,
         output_path: str,
+        source_codec: Optional[str] = None,
     ) -> subprocess.CompletedProcess:
         """
         Extract audio-only stream (no video)
 
+        MP3 sources are copied as-is; anything else is encoded to MP3.
+
         Args:
             input_path: Input video file path
             output_path: Output audio file path
+            source_codec: Input audio codec name from ffprobe, if known
 
         Returns:
             subprocess result
         """
+        if source_codec in FFMPEG_AUDIO_COPY_CODECS:
+            codec_args = ["-c:a", "copy"]
+        else:
+            codec_args = ["-c:a", self.audio_codec, "-b:a", self.audio_bitrate]
+
         cmd = [
-            self.ffmpeg_path,
+            self._ffmpeg_exe,
             "-i", input_path,
             "-vn",  # No video
-            "-c:a", self.audio_codec,
-            "-b:a", self.audio_bitrate,
+            *codec_args,
             "-y",  # Overwrite output file
             output_path,
         ]
 
-        result = subprocess.run(
-            cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-        )
-
-        return result
+        return self._run_ffmpeg(cmd)
 
     def _generate_silent_audio(
         self,
@@ -269,7 +358,7 @@ class FFmpegSplitter:
         """
         duration = max(float(duration_s or 0), 0.1)
         cmd = [
-            self.ffmpeg_path,
+            self._ffmpeg_exe,
             "-f", "lavfi",
             "-i", "anullsrc=r=48000:cl=stereo",
             "-t", f"{duration:.3f}",
@@ -279,21 +368,67 @@ class FFmpegSplitter:
             output_path,
         ]
 
-        return subprocess.run(
+        return self._run_ffmpeg(cmd)
+
+    def _run_ffmpeg(
+        self,
+        cmd: list,
+        read_progress: bool = False,
+    ) -> subprocess.CompletedProcess:
+        """
+        Run ffmpeg keeping only a bounded tail of its output
+
+        ffmpeg logs can run to megabytes on long inputs, but only the last
+        lines are useful in an error message, so stderr is drained into a
+        fixed-size ring buffer instead of being held in full.
+
+        Args:
+            cmd: ffmpeg command line
+            read_progress: Collect ``out_time_ms`` lines written by
+                ``-progress pipe:1``; stdout is discarded otherwise
+
+        Returns:
+            subprocess result with the stderr tail and any progress lines
+        """
+        stderr_tail: deque = deque(maxlen=FFMPEG_STDERR_TAIL_LINES)
+        progress: deque = deque(maxlen=FFMPEG_STDERR_TAIL_LINES)
+
+        with subprocess.Popen(
             cmd,
-            stdout=subprocess.PIPE,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE if read_progress else subprocess.DEVNULL,
             stderr=subprocess.PIPE,
+            **self._spawn_kwargs,
+        ) as process:
+            # Both pipes must be drained concurrently or ffmpeg can block on a
+            # full one; stderr gets a reader thread, stdout is read here
+            reader = threading.Thread(target=stderr_tail.extend, args=(process.stderr,), daemon=True)
+            reader.start()
+            if read_progress:
+                progress.extend(
+                    line for line in process.stdout if line.startswith(b"out_time_ms=")
+                )
+            returncode = process.wait()
+            reader.join()
+
+        return subprocess.CompletedProcess(
+            args=cmd,
+            returncode=returncode,
+            stdout=b"".join(progress),
+            stderr=b"".join(stderr_tail),
         )
 
-    def _has_audio_stream(self, input_path: str) -> bool:
+    def _probe_stream_codecs(self, input_path: str) -> Optional[Dict[str, str]]:
         """
-        Check if input file has an audio stream using ffprobe.
+        Map each stream type in the input to its first codec using ffprobe.
+
+        Returns:
+            e.g. {"video": "h264", "audio": "aac"}, or None if the probe fails
         """
         cmd = [
-            "ffprobe",
+            self.ffprobe_path,
             "-v", "error",
-            "-select_streams", "a",
-            "-show_entries", "stream=index",
+            "-show_entries", "stream=codec_type,codec_name",
             "-of", "csv=p=0",
             input_path,
         ]
@@ -303,18 +438,65 @@ class FFmpegSplitter:
                 cmd,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
+                **self._spawn_kwargs,
                 text=True,
             )
-            if result.returncode != 0:
-                return True  # Fallback: assume audio exists if probe fails
-            return bool(result.stdout.strip())
         except Exception:
-            return True
+            return None
+        if result.returncode != 0:
+            return None
+
+        codecs: Dict[str, str] = {}
+        for line in result.stdout.splitlines():
+            codec_name, _, codec_type = line.strip().partition(",")
+            if codec_type:
+                codecs.setdefault(codec_type, codec_name)
+        return codecs
+
+    def _has_audio_stream(self, input_path: str) -> bool:
+        """
+        Check if input file has an audio stream using ffprobe.
+        """
+        codecs = self._probe_stream_codecs(input_path)
+        if codecs is None:
+            return True  # Fallback: assume audio exists if probe fails
+        return "audio" in codecs
+
+    @staticmethod
+    def _progress_duration(progress: Optional[bytes]) -> Optional[float]:
+        """
+        Read the output duration from ffmpeg ``-progress`` output
+
+        Args:
+            progress: stdout of an ffmpeg run with ``-progress pipe:1``
+
+        Returns:
+            Duration in seconds from the last ``out_time_ms`` entry, or None
+        """
+        if not progress:
+            return None
+        marker = b"out_time_ms="
+        end = len(progress)
+        while True:
+            start = progress.rfind(marker, 0, end)
+            if start < 0:
+                return None
+            line_end = progress.find(b"\n", start)
+            value = progress[start + len(marker):line_end if line_end >= 0 else None]
+            try:
+                # Despite the name, ffmpeg reports out_time_ms in microseconds
+                micros = int(value.strip())
+            except ValueError:
+                end = start  # "N/A" before the first frame; try an earlier entry
+                continue
+            return micros / 1_000_000 if micros > 0 else None
 
     def _get_video_duration(self, video_path: str) -> float:
         """
         Get video duration in seconds using ffprobe
 
+        Fallback for when ffmpeg progress output carried no duration.
+
         Args:
             video_path: Path to video file
 
@@ -322,7 +504,7 @@ class FFmpegSplitter:
             Duration in seconds
         """
         cmd = [
-            "ffprobe",
+            self.ffprobe_path,
             "-v", "error",
             "-show_entries", "format=duration",
             "-of", "default=noprint_wrappers=1:nokey=1",
@@ -334,10 +516,11 @@ class FFmpegSplitter:
                 cmd,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
-                text=True,
+                **self._spawn_kwargs,
             )
 
             if result.returncode == 0:
+                # float() parses the ASCII bytes directly; no decode needed
                 duration = float(result.stdout.strip())
                 return duration
             else:
@@ -364,7 +547,7 @@ class FFmpegSplitter:
             Dict with video metadata
         """
         cmd = [
-            "ffprobe",
+            self.ffprobe_path,
             "-v", "quiet",
             "-print_format", "json",
             "-show_format",
@@ -377,13 +560,14 @@ class FFmpegSplitter:
                 cmd,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
-                text=True,
+                **self._spawn_kwargs,
             )
 
             if result.returncode == 0:
+                if orjson is not None:
+                    return orjson.loads(result.stdout)
                 import json
-                metadata = json.loads(result.stdout)
-                return metadata
+                return json.loads(result.stdout)
             else:
                 return {}
 
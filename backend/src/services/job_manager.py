@@ -3,18 +3,22 @@ Job Manager - Orchestrate per-shot generation workflow
 """
 
 import asyncio
+import copy
 import os
 import re
 import shutil
-from datetime import datetime, timedelta
+import threading
+import time
+from collections import OrderedDict
 from typing import Dict, Any, List, Optional, Tuple
 from sqlalchemy.orm import Session
 
 from src.models.job import JobModel
-from src.services.job_state import transition_state, is_terminal_state
-from src.services.storage import JobDB
+from src.services.job_state import transition_state, transition_states, is_terminal_state
+from src.services.storage import JobDB, TemplateDB
 from src.services.rate_limiter import RateLimiter
 from src.services.asset_storage import AssetStorage
+from src.services.artifact_writer import AsyncArtifactWriter
 from src.services.observability import (
     logger,
     log_template_hit,
@@ -26,21 +30,45 @@ from src.core.llm_orchestrator import LLMOrchestrator
 from src.core.template_router import TemplateRouter
 from src.core.validator import Validator
 from src.core.prompt_compiler import PromptCompiler
-from src.core.wan26_adapter import Wan26RetryAdapter
+from src.core.wan26_adapter import Wan26RetryAdapter, ShotGenerationRequest
 from src.services.wan26_downloader import Wan26Downloader
 from src.services.ffmpeg_splitter import FFmpegSplitter, FFmpegError
 from src.config.constants import (
     QUALITY_MODES,
     JOB_TIMEOUT_MINUTES,
     MAX_RETRY_ATTEMPTS,
+    PLAN_CACHE_SIZE,
+    PLAN_CACHE_TTL_S,
+    SHOT_GENERATION_CONCURRENCY,
 )
 
+# First run of digits in free-form durations such as "5s" or "about 8 seconds"
+_DIGITS_RE = re.compile(r"(\d+)")
+
+# Shot fields an LLM plan may carry the duration in, in order of preference
+_SHOT_DURATION_KEYS = ("duration_s", "duration", "length_s")
+
+# DashScope seeds are positive 31-bit integers
+_MAX_SEED = 2**31 - 1
+
+
+def _candidate_seed(seed: int, index: int) -> int:
+    """Seed for the index-th preview candidate of a shot (index 0 keeps seed)"""
+    return (seed + index - 1) % _MAX_SEED + 1
+
 
 class JobManager:
     """
     Orchestrate end-to-end per-shot generation workflow
     """
 
+    # Routes and render workers build a JobManager per request, so the plan
+    # cache lives on the class: (input_hash, quality_mode) -> (monotonic
+    # expiry, (ir_dict, template, shot_plan_dict)); skips the LLM calls for
+    # repeat inputs. Render workers use threads, hence the lock.
+    _plan_cache: "OrderedDict[Tuple[str, str], Tuple[float, Tuple[Any, ...]]]" = OrderedDict()
+    _plan_cache_lock = threading.Lock()
+
     def __init__(self):
         """Initialize job manager"""
         self.input_processor = InputProcessor()
@@ -49,9 +77,10 @@ class JobManager:
         self.validator = Validator()
         self.prompt_compiler = PromptCompiler()
         self.wan26_adapter = Wan26RetryAdapter()
-        self.downloader = Wan26Downloader()
-        self.ffmpeg_splitter = FFmpegSplitter()
         self.asset_storage = AssetStorage()
+        self.downloader = Wan26Downloader(temp_dir=self.asset_storage.download_dir)
+        self.ffmpeg_splitter = FFmpegSplitter()
+        self.artifact_writer = AsyncArtifactWriter(self.asset_storage)
         self.rate_limiter = RateLimiter()
 
     async def execute_generation_workflow(
@@ -79,122 +108,23 @@ class JobManager:
             ValueError: If validation fails
             Exception: If workflow fails
         """
-        start_time = datetime.utcnow()
-
-        # Check rate limits
-        rate_limit_result = self.rate_limiter.check_rate_limit(client_ip)
-        if not rate_limit_result["allowed"]:
-            raise ValueError(f"Rate limit exceeded. Try again at {rate_limit_result['reset_at']}")
-
-        concurrent_result = self.rate_limiter.check_concurrent_jobs(client_ip)
-        if not concurrent_result["allowed"]:
-            raise ValueError(f"Concurrent job limit reached. Current: {concurrent_result['current']}, Max: {concurrent_result['max']}")
-
-        # Step 1: Process input (redaction, language detection)
-        logger.info("workflow_step_1", step="input_processing")
-        processed = self.input_processor.process_input(
-            user_input,
-            auto_translate=False,  # TODO: Use AUTO_TRANSLATE constant
-            align_bilingual=True,
-            align_target_language="en-US",
-        )
-
-        # Step 2: Parse IR
-        logger.info("workflow_step_2", step="ir_parsing")
-        ir_input = processed.get("aligned_text") or processed["redacted_text"]
-        ir = self.llm_orchestrator.parse_ir(
-            ir_input,
-            quality_mode,
-        )
-        ir_dict = ir.dict()
-
-        # Step 3: Match template
-        logger.info("workflow_step_3", step="template_matching")
-        template_match = self.template_router.match_template(
-            ir_dict,
-            db,
-        )
-
-        if not template_match:
-            # Trigger clarification
-            logger.warning("template_match_failed", trigger_clarification=True)
-            # TODO: Create clarification job
-            raise ValueError("No matching template found. Please provide more details.")
+        start_perf = time.perf_counter()
 
-        template = template_match.template
-
-        # Log template hit
-        log_template_hit(
-            template_id=template["template_id"],
-            confidence=template_match.confidence,
-            confidence_components=template_match.confidence_components,
-        )
-
-        # Step 4: Instantiate template
-        logger.info("workflow_step_4", step="template_instantiation")
-        shot_plan = self.llm_orchestrator.instantiate_template(
-            ir,
-            template,
-        )
-        shot_plan_dict = shot_plan.dict()
-        shot_plan_dict = self._normalize_shot_plan(shot_plan_dict, template)
-
-        # Step 5: Validate parameters
-        logger.info("workflow_step_5", step="validation")
-        is_valid, suggestions = self.validator.validate_parameters(
-            ir_dict,
-            shot_plan_dict,
-            quality_mode,
-        )
-
-        if not is_valid:
-            logger.warning("validation_failed", suggestions=suggestions)
-            # TODO: Apply auto-fix or trigger clarification
-            raise ValueError(f"Validation failed: {suggestions}")
-
-        # Step 6: Compile prompts per shot
-        logger.info("workflow_step_6", step="prompt_compilation")
-        shot_requests = []
-        external_task_ids = []
-
-        for shot in shot_plan_dict["shots"]:
-            compiled = self.prompt_compiler.compile_shot_prompt(
-                shot=shot,
-                shot_plan=shot_plan_dict,
-                ir=ir_dict,
-                negative_prompt_base=template["negative_prompt_base"],
-                prompt_extend=False,  # Default to false
-            )
-
-            shot_request = {
-                "shot_id": shot["shot_id"],
-                "compiled_prompt": compiled.compiled_prompt,
-                "compiled_negative_prompt": compiled.compiled_negative_prompt,
-                "params": compiled.params,
-            }
-            shot_requests.append(shot_request)
-
-        # Step 7: Create job record
-        logger.info("workflow_step_7", step="job_creation")
-        job = JobDB.create_job(
+        job, shot_requests = self._prepare_job(
             db=db,
-            user_input_redacted=processed["redacted_text"],
-            user_input_hash=processed["input_hash"],
-            pii_flags=processed["pii_flags"],
-            template_id=template["template_id"],
-            template_version=template["version"],
+            user_input=user_input,
             quality_mode=quality_mode,
-            ir=ir_dict,
-            shot_plan=shot_plan_dict,
-            shot_requests=shot_requests,
-            external_task_ids=[],
-            total_duration_s=shot_plan_dict["duration_s"],
+            client_ip=client_ip,
             resolution=resolution,
+            event_prefix="workflow",
         )
 
         # Step 8: Submit to RUNNING state
-        transition_state(db, job.job_id, "SUBMITTED", "workflow_submitted")
-        transition_state(db, job.job_id, "RUNNING", "generation_started")
+        transition_states(
+            db,
+            job.job_id,
+            [("SUBMITTED", "workflow_submitted"), ("RUNNING", "generation_started")],
+        )
 
         # Increment concurrent job counter
         self.rate_limiter.increment_concurrent_jobs(client_ip)
@@ -214,12 +144,12 @@ class JobManager:
 
             # Step 11: Write metadata
             logger.info("workflow_step_11", step="write_metadata")
-            self._write_job_metadata(job, shot_assets)
+            await self._write_job_metadata(job, shot_assets)
 
             # Step 12: Transition to SUCCEEDED
             transition_state(db, job.job_id, "SUCCEEDED", "generation_complete")
 
-            duration_s = (datetime.utcnow() - start_time).total_seconds()
+            duration_s = time.perf_counter() - start_perf
             log_generation_duration(
                 job_id=job.job_id,
                 duration_s=duration_s,
@@ -277,6 +207,80 @@ class JobManager:
         Returns:
             JobModel with planning results (shot_plan/shot_requests)
         """
+        job, _shot_requests = self._prepare_job(
+            db=db,
+            user_input=user_input,
+            quality_mode=quality_mode,
+            client_ip=client_ip,
+            resolution=resolution,
+            event_prefix="planning",
+        )
+
+        # Step 8: Transition through planning states
+        transition_states(
+            db,
+            job.job_id,
+            [("SUBMITTED", "planning_submitted"), ("RUNNING", "planning_started")],
+        )
+
+        try:
+            # Step 9: Write metadata (no assets yet)
+            logger.info("planning_step_9", step="write_metadata")
+            await self._write_job_metadata(job, [])
+
+            # Step 10: Mark planning complete
+            transition_state(db, job.job_id, "SUCCEEDED", "planning_complete")
+
+            return job
+        except Exception as e:
+            logger.error("planning_failed", job_id=job.job_id, error=str(e))
+            transition_state(db, job.job_id, "FAILED", "planning_failed")
+
+            error_classification = self._classify_error(e)
+            log_failure_classification(
+                error_code=error_classification["code"],
+                classification=error_classification["classification"],
+                retryable=error_classification["retryable"],
+                job_id=job.job_id,
+            )
+            JobDB.update_job_error(
+                db=db,
+                job_id=job.job_id,
+                error_details=error_classification,
+            )
+            raise
+
+    def _prepare_job(
+        self,
+        db: Session,
+        user_input: str,
+        quality_mode: str,
+        client_ip: str,
+        resolution: str,
+        event_prefix: str,
+    ) -> Tuple[JobModel, List[Dict[str, Any]]]:
+        """
+        Shared front half of the generation and planning workflows
+
+        Checks rate limits, then runs steps 1-7: input processing, IR parsing,
+        template matching and instantiation, validation, prompt compilation
+        and job creation. Steps 2-5 come from the plan cache when possible.
+
+        Args:
+            db: Database session
+            user_input: Raw user input
+            quality_mode: Quality mode (fast, balanced, high)
+            client_ip: Client IP address for rate limiting
+            resolution: Video resolution
+            event_prefix: Log event prefix of the calling workflow
+
+        Returns:
+            Tuple of (created job in CREATED state, compiled shot requests)
+
+        Raises:
+            ValueError: If rate limited, the input is empty, no template
+                matches or validation fails
+        """
         # Check rate limits
         rate_limit_result = self.rate_limiter.check_rate_limit(client_ip)
         if not rate_limit_result["allowed"]:
@@ -290,7 +294,7 @@ class JobManager:
             )
 
         # Step 1: Process input (redaction, language detection)
-        logger.info("planning_step_1", step="input_processing")
+        logger.info(f"{event_prefix}_step_1", step="input_processing")
         processed = self.input_processor.process_input(
             user_input,
             auto_translate=False,  # TODO: Use AUTO_TRANSLATE constant
@@ -298,69 +302,93 @@ class JobManager:
             align_target_language="en-US",
         )
 
-        # Step 2: Parse IR
-        logger.info("planning_step_2", step="ir_parsing")
+        # Nothing left to parse; fail before spending an LLM round trip
         ir_input = processed.get("aligned_text") or processed["redacted_text"]
-        ir = self.llm_orchestrator.parse_ir(
-            ir_input,
-            quality_mode,
-        )
-        ir_dict = ir.dict()
+        if not ir_input.strip():
+            raise ValueError("Empty input after redaction")
+
+        # Steps 2-5 depend only on the input and quality mode; reuse a recent
+        # plan for the same input instead of calling the LLM again. Prompts
+        # are still compiled per job so every job draws its own seeds.
+        plan_cache_key = (processed["input_hash"], quality_mode)
+        cached_plan = self._get_cached_plan(plan_cache_key)
+        if cached_plan is not None:
+            logger.info(f"{event_prefix}_plan_cache_hit", input_hash=processed["input_hash"])
+            ir_dict, template, shot_plan_dict = cached_plan
+        else:
+            # Step 2: Parse IR
+            logger.info(f"{event_prefix}_step_2", step="ir_parsing")
+            ir = self.llm_orchestrator.parse_ir(
+                ir_input,
+                quality_mode,
+            )
+            ir_dict = ir.model_dump()
 
-        # Step 3: Match template
-        logger.info("planning_step_3", step="template_matching")
-        template_match = self.template_router.match_template(
-            ir_dict,
-            db,
-        )
+            # Step 3: Match template
+            logger.info(f"{event_prefix}_step_3", step="template_matching")
+            template_match = self.template_router.match_template(
+                ir_dict,
+                db,
+            )
 
-        if not template_match:
-            logger.warning("template_match_failed", trigger_clarification=True)
-            raise ValueError("No matching template found. Please provide more details.")
+            if not template_match:
+                # Trigger clarification
+                logger.warning("template_match_failed", trigger_clarification=True)
+                # TODO: Create clarification job
+                raise ValueError("No matching template found. Please provide more details.")
 
-        template = template_match.template
+            template = template_match.template
 
-        # Log template hit
-        log_template_hit(
-            template_id=template["template_id"],
-            confidence=template_match.confidence,
-            confidence_components=template_match.confidence_components,
-        )
+            # Log template hit
+            log_template_hit(
+                template_id=template["template_id"],
+                confidence=template_match.confidence,
+                confidence_components=template_match.confidence_components,
+            )
 
-        # Step 4: Instantiate template
-        logger.info("planning_step_4", step="template_instantiation")
-        shot_plan = self.llm_orchestrator.instantiate_template(
-            ir,
-            template,
-        )
-        shot_plan_dict = shot_plan.dict()
-        shot_plan_dict = self._normalize_shot_plan(shot_plan_dict, template)
+            # Step 4: Instantiate template
+            logger.info(f"{event_prefix}_step_4", step="template_instantiation")
+            shot_plan = self.llm_orchestrator.instantiate_template(
+                ir,
+                template,
+            )
+            shot_plan_dict = shot_plan.model_dump()
+            shot_plan_dict = self._normalize_shot_plan(shot_plan_dict, template)
+
+            # Step 5: Validate parameters
+            logger.info(f"{event_prefix}_step_5", step="validation")
+            is_valid, suggestions = self.validator.validate_parameters(
+                ir_dict,
+                shot_plan_dict,
+                quality_mode,
+            )
 
-        # Step 5: Validate parameters
-        logger.info("planning_step_5", step="validation")
-        is_valid, suggestions = self.validator.validate_parameters(
-            ir_dict,
-            shot_plan_dict,
-            quality_mode,
-        )
+            if not is_valid:
+                # Generation has always logged the bare event name
+                validation_event = (
+                    "validation_failed"
+                    if event_prefix == "workflow"
+                    else f"{event_prefix}_validation_failed"
+                )
+                logger.warning(validation_event, suggestions=suggestions)
+                # TODO: Apply auto-fix or trigger clarification
+                raise ValueError(f"Validation failed: {suggestions}")
 
-        if not is_valid:
-            logger.warning("planning_validation_failed", suggestions=suggestions)
-            raise ValueError(f"Validation failed: {suggestions}")
+            self._cache_plan(plan_cache_key, (ir_dict, template, shot_plan_dict))
 
         # Step 6: Compile prompts per shot
-        logger.info("planning_step_6", step="prompt_compilation")
+        logger.info(f"{event_prefix}_step_6", step="prompt_compilation")
         shot_requests = []
 
-        for shot in shot_plan_dict["shots"]:
-            compiled = self.prompt_compiler.compile_shot_prompt(
-                shot=shot,
-                shot_plan=shot_plan_dict,
-                ir=ir_dict,
-                negative_prompt_base=template["negative_prompt_base"],
-                prompt_extend=False,
-            )
+        compiled_list = self.prompt_compiler.compile_shot_prompts_batch(
+            shots=shot_plan_dict["shots"],
+            shot_plan=shot_plan_dict,
+            ir=ir_dict,
+            negative_prompt_base=template["negative_prompt_base"],
+            prompt_extend=False,  # Default to false
+        )
 
+        for shot, compiled in zip(shot_plan_dict["shots"], compiled_list):
             shot_request = {
                 "shot_id": shot["shot_id"],
                 "compiled_prompt": compiled.compiled_prompt,
@@ -370,7 +398,7 @@ class JobManager:
             shot_requests.append(shot_request)
 
         # Step 7: Create job record
-        logger.info("planning_step_7", step="job_creation")
+        logger.info(f"{event_prefix}_step_7", step="job_creation")
         job = JobDB.create_job(
             db=db,
             user_input_redacted=processed["redacted_text"],
@@ -387,36 +415,7 @@ class JobManager:
             resolution=resolution,
         )
 
-        # Step 8: Transition through planning states
-        transition_state(db, job.job_id, "SUBMITTED", "planning_submitted")
-        transition_state(db, job.job_id, "RUNNING", "planning_started")
-
-        try:
-            # Step 9: Write metadata (no assets yet)
-            logger.info("planning_step_9", step="write_metadata")
-            self._write_job_metadata(job, [])
-
-            # Step 10: Mark planning complete
-            transition_state(db, job.job_id, "SUCCEEDED", "planning_complete")
-
-            return job
-        except Exception as e:
-            logger.error("planning_failed", job_id=job.job_id, error=str(e))
-            transition_state(db, job.job_id, "FAILED", "planning_failed")
-
-            error_classification = self._classify_error(e)
-            log_failure_classification(
-                error_code=error_classification["code"],
-                classification=error_classification["classification"],
-                retryable=error_classification["retryable"],
-                job_id=job.job_id,
-            )
-            JobDB.update_job_error(
-                db=db,
-                job_id=job.job_id,
-                error_details=error_classification,
-            )
-            raise
+        return job, shot_requests
 
     async def execute_generation_from_job(
         self,
@@ -450,9 +449,11 @@ class JobManager:
             raise ValueError("Job already has generated assets")
 
         if not skip_rate_limit:
-            rate_limit_result = self.rate_limiter.check_rate_limit(client_ip)
-            if not rate_limit_result["allowed"]:
-                raise ValueError(f"Rate limit exceeded. Try again at {rate_limit_result['reset_at']}")
+            # Planning already counted a fresh job against the rate limit
+            if not self.rate_limiter.planned_within_grace(job.created_at):
+                rate_limit_result = self.rate_limiter.check_rate_limit(client_ip)
+                if not rate_limit_result["allowed"]:
+                    raise ValueError(f"Rate limit exceeded. Try again at {rate_limit_result['reset_at']}")
 
             concurrent_result = self.rate_limiter.check_concurrent_jobs(client_ip)
             if not concurrent_result["allowed"]:
@@ -463,15 +464,18 @@ class JobManager:
 
         # Transition to RUNNING
         if job.state == "CREATED":
-            transition_state(db, job.job_id, "SUBMITTED", "generation_submitted")
-            transition_state(db, job.job_id, "RUNNING", "generation_started")
+            transition_states(
+                db,
+                job.job_id,
+                [("SUBMITTED", "generation_submitted"), ("RUNNING", "generation_started")],
+            )
         else:
             transition_state(db, job.job_id, "RUNNING", "generation_started")
 
         # Increment concurrent job counter
         self.rate_limiter.increment_concurrent_jobs(client_ip)
 
-        start_time = datetime.utcnow()
+        start_perf = time.perf_counter()
 
         try:
             shot_assets = await self._generate_shots(
@@ -481,11 +485,11 @@ class JobManager:
             )
 
             JobDB.update_job_assets(db, job.job_id, shot_assets)
-            self._write_job_metadata(job, shot_assets)
+            await self._write_job_metadata(job, shot_assets)
 
             transition_state(db, job.job_id, "SUCCEEDED", "generation_complete")
 
-            duration_s = (datetime.utcnow() - start_time).total_seconds()
+            duration_s = time.perf_counter() - start_perf
             log_generation_duration(
                 job_id=job.job_id,
                 duration_s=duration_s,
@@ -562,127 +566,186 @@ class JobManager:
         async def _generate_shot_candidates(
             shot_request: Dict[str, Any],
         ) -> Tuple[List[Dict[str, Any]], List[str]]:
+            """
+            Generate preview candidates for one shot as a pipelined workflow
+
+            Every seed is submitted up front; the downloader fetches each video
+            as soon as its task succeeds and the splitter runs ffmpeg on
+            finished downloads, so download and split time overlap the
+            polling of the remaining seeds.
+            """
             shot_id = shot_request["shot_id"]
             output_suffix = shot_request.get("output_suffix")
-            shot_candidates: List[Dict[str, Any]] = []
-            task_ids: List[str] = []
             preview_seeds = shot_request.get("preview_seeds", default_preview_seeds)
+            # Indexed by seed position so results keep submission order
+            task_id_slots: List[Optional[str]] = [None] * preview_seeds
+            candidate_slots: List[Optional[Dict[str, Any]]] = [None] * preview_seeds
+            submitted_q: asyncio.Queue = asyncio.Queue()
+            downloaded_q: asyncio.Queue = asyncio.Queue()
 
-            # Generate multiple preview candidates
-            for _ in range(preview_seeds):
-                try:
-                    # Submit shot request
-                    from src.core.wan26_adapter import ShotGenerationRequest
-
-                    gen_request = ShotGenerationRequest(
-                        prompt=shot_request["compiled_prompt"],
-                        negative_prompt=shot_request["compiled_negative_prompt"],
-                        size=shot_request["params"]["size"],
-                        duration=shot_request["params"]["duration"],
-                        seed=shot_request["params"]["seed"],
-                        prompt_extend=shot_request["params"]["prompt_extend"],
-                        watermark=shot_request["params"]["watermark"],
-                    )
+            def _log_workflow_error(e: Exception) -> None:
+                logger.error(
+                    "shot_workflow_error",
+                    shot_id=shot_id,
+                    error=str(e),
+                )
 
+            async def _submit_and_poll(index: int, gen_request: ShotGenerationRequest) -> None:
+                try:
                     submit_response = await self.wan26_adapter.submit_shot_request_with_retry(
                         gen_request,
                     )
-                    task_ids.append(submit_response.task_id)
+                    task_id_slots[index] = submit_response.task_id
 
                     # Poll for completion
                     status_response = await self.wan26_adapter.poll_task_status(
                         submit_response.task_id,
                     )
+                except Exception as e:
+                    _log_workflow_error(e)
+                    return
 
-                    if status_response.status == "succeeded" and status_response.video_url:
-                        # Download video
-                        temp_video_path = await self.downloader.download_video(
-                            status_response.video_url,
-                        )
+                if status_response.status == "succeeded" and status_response.video_url:
+                    await submitted_q.put((index, status_response))
+                else:
+                    # Generation failed
+                    logger.error(
+                        "shot_generation_failed",
+                        shot_id=shot_id,
+                        task_id=status_response.task_id,
+                        error=status_response.error,
+                    )
 
-                        # Split video/audio
-                        video_path = self.asset_storage.get_video_storage_path(
-                            job.job_id,
-                            shot_id,
-                            suffix=output_suffix,
-                        )
-                        audio_path = self.asset_storage.get_audio_storage_path(
-                            job.job_id,
-                            shot_id,
-                            suffix=output_suffix,
+            async def _submitter() -> None:
+                try:
+                    # Each candidate gets its own seed (the compiled seed plus
+                    # its index), so the previews are distinct renders
+                    params = shot_request["params"]
+                    gen_requests = [
+                        ShotGenerationRequest(
+                            prompt=shot_request["compiled_prompt"],
+                            negative_prompt=shot_request["compiled_negative_prompt"],
+                            size=params["size"],
+                            duration=params["duration"],
+                            seed=_candidate_seed(params["seed"], i),
+                            prompt_extend=params["prompt_extend"],
+                            watermark=params["watermark"],
                         )
+                        for i in range(preview_seeds)
+                    ]
+                except Exception as e:
+                    _log_workflow_error(e)
+                    await submitted_q.put(None)
+                    return
 
-                        try:
-                            split_result = await asyncio.to_thread(
-                                self.ffmpeg_splitter.split_video_audio,
-                                temp_video_path,
-                                video_path,
-                                audio_path,
-                            )
-
-                            audio_url = self.asset_storage.get_audio_url(
-                                job.job_id,
-                                shot_id,
-                                suffix=output_suffix,
-                            )
-                            duration_s = split_result["duration_s"]
-
-                            # Clean up temp file
-                            os.remove(temp_video_path)
-                        except FFmpegError as exc:
-                            logger.warning(
-                                "ffmpeg_fallback_video_only",
-                                shot_id=shot_id,
-                                error=str(exc),
-                            )
-                            # Store raw video when ffmpeg isn't available.
-                            shutil.move(temp_video_path, video_path)
-                            audio_path = ""
-                            audio_url = ""
-                            duration_s = int(shot_request["params"]["duration"])
-
-                        # Create asset record
-                        asset = {
-                            "shot_id": shot_id,
-                            "seed": shot_request["params"]["seed"],
-                            "model_task_id": status_response.task_id,
-                            "raw_video_url": status_response.video_url,
-                            "video_url": self.asset_storage.get_video_url(
-                                job.job_id,
-                                shot_id,
-                                suffix=output_suffix,
-                            ),
-                            "audio_url": audio_url,
-                            "video_path": video_path,
-                            "audio_path": audio_path,
-                            "duration_s": duration_s,
-                            "resolution": job.resolution,
-                        }
-
-                        shot_candidates.append(asset)
-                        await _append_and_persist(asset)
-
-                    else:
-                        # Generation failed
-                        logger.error(
-                            "shot_generation_failed",
-                            shot_id=shot_id,
-                            task_id=status_response.task_id,
-                            error=status_response.error,
-                        )
+                try:
+                    await asyncio.gather(
+                        *(_submit_and_poll(i, gen_request) for i, gen_request in enumerate(gen_requests))
+                    )
+                finally:
+                    await submitted_q.put(None)
 
+            async def _download(index: int, status_response: Any) -> None:
+                try:
+                    temp_video_path = await self.downloader.download_video(
+                        status_response.video_url,
+                    )
                 except Exception as e:
-                    logger.error(
-                        "shot_workflow_error",
+                    _log_workflow_error(e)
+                    return
+                await downloaded_q.put((index, status_response, temp_video_path))
+
+            async def _downloader() -> None:
+                downloads: List[asyncio.Task] = []
+                try:
+                    while (item := await submitted_q.get()) is not None:
+                        downloads.append(asyncio.create_task(_download(*item)))
+                    await asyncio.gather(*downloads)
+                finally:
+                    await downloaded_q.put(None)
+
+            async def _split(index: int, status_response: Any, temp_video_path: str) -> None:
+                seed = _candidate_seed(shot_request["params"]["seed"], index)
+                # Candidates share a shot_id, so each needs its own files
+                candidate_suffix = output_suffix
+                if preview_seeds > 1:
+                    candidate_suffix = "_".join(filter(None, (output_suffix, f"seed_{seed}")))
+
+                # Split video/audio
+                video_path, video_url = self.asset_storage.get_video_path_and_url(
+                    job.job_id,
+                    shot_id,
+                    suffix=candidate_suffix,
+                )
+                audio_path, audio_url = self.asset_storage.get_audio_path_and_url(
+                    job.job_id,
+                    shot_id,
+                    suffix=candidate_suffix,
+                )
+
+                try:
+                    split_result = await self.ffmpeg_splitter.split_video_audio_async(
+                        temp_video_path,
+                        video_path,
+                        audio_path,
+                    )
+
+                    duration_s = split_result["duration_s"]
+
+                    # Clean up temp file
+                    await asyncio.to_thread(os.remove, temp_video_path)
+                except FFmpegError as exc:
+                    logger.warning(
+                        "ffmpeg_fallback_video_only",
                         shot_id=shot_id,
-                        error=str(e),
+                        error=str(exc),
                     )
-                    # Continue with next shot
-                    continue
+                    # Store raw video when ffmpeg isn't available (a rename
+                    # unless the download dir is on another filesystem)
+                    await asyncio.to_thread(shutil.move, temp_video_path, video_path)
+                    audio_path = ""
+                    audio_url = ""
+                    duration_s = int(shot_request["params"]["duration"])
+
+                # Create asset record
+                asset = {
+                    "shot_id": shot_id,
+                    "seed": seed,
+                    "model_task_id": status_response.task_id,
+                    "raw_video_url": status_response.video_url,
+                    "video_url": video_url,
+                    "audio_url": audio_url,
+                    "video_path": video_path,
+                    "audio_path": audio_path,
+                    "duration_s": duration_s,
+                    "resolution": job.resolution,
+                }
+
+                candidate_slots[index] = asset
+                await _append_and_persist(asset)
+
+            async def _splitter() -> None:
+                while (item := await downloaded_q.get()) is not None:
+                    try:
+                        await _split(*item)
+                    except Exception as e:
+                        _log_workflow_error(e)
+
+            await asyncio.gather(_submitter(), _downloader(), _splitter())
 
+            shot_candidates = [asset for asset in candidate_slots if asset is not None]
+            task_ids = [task_id for task_id in task_id_slots if task_id is not None]
             return shot_candidates, task_ids
 
-        tasks = [asyncio.create_task(_generate_shot_candidates(req)) for req in shot_requests]
+        shot_slots = asyncio.Semaphore(SHOT_GENERATION_CONCURRENCY)
+
+        async def _generate_shot_candidates_bounded(
+            shot_request: Dict[str, Any],
+        ) -> Tuple[List[Dict[str, Any]], List[str]]:
+            async with shot_slots:
+                return await _generate_shot_candidates(shot_request)
+
+        tasks = [asyncio.create_task(_generate_shot_candidates_bounded(req)) for req in shot_requests]
         results = await asyncio.gather(*tasks) if tasks else []
 
         for candidates, task_ids in results:
@@ -691,11 +754,10 @@ class JobManager:
         if external_task_ids:
             job.external_task_ids = external_task_ids
             db.commit()
-            db.refresh(job)
 
         return shot_assets
 
-    def _write_job_metadata(
+    async def _write_job_metadata(
         self,
         job: JobModel,
         shot_assets: List[Dict[str, Any]],
@@ -703,6 +765,10 @@ class JobManager:
         """
         Write job metadata to JSON file
 
+        The document is built here, on the event loop thread that owns the
+        session, then queued on the artifact writer; the workflow does not
+        wait for the file write.
+
         Args:
             job: Job model
             shot_assets: List of shot assets
@@ -725,7 +791,34 @@ class JobManager:
             "created_at": job.created_at.isoformat() if job.created_at else None,
         }
 
-        self.asset_storage.write_job_metadata(job.job_id, metadata)
+        await self.artifact_writer.enqueue(job.job_id, metadata)
+
+    def _get_cached_plan(self, key: Tuple[str, str]) -> Optional[Tuple[Any, ...]]:
+        """
+        Look up a cached (ir_dict, template, shot_plan_dict) plan
+
+        Returns:
+            A deep copy of the plan, or None on a miss or expired entry
+        """
+        with self._plan_cache_lock:
+            entry = self._plan_cache.get(key)
+            if entry is None:
+                return None
+            expires, plan = entry
+            if time.monotonic() >= expires:
+                del self._plan_cache[key]
+                return None
+            self._plan_cache.move_to_end(key)
+        # Jobs keep and may later modify these dicts, so each gets its own copy
+        return copy.deepcopy(plan)
+
+    def _cache_plan(self, key: Tuple[str, str], plan: Tuple[Any, ...]) -> None:
+        entry = (time.monotonic() + PLAN_CACHE_TTL_S, copy.deepcopy(plan))
+        with self._plan_cache_lock:
+            self._plan_cache[key] = entry
+            self._plan_cache.move_to_end(key)
+            if len(self._plan_cache) > PLAN_CACHE_SIZE:
+                self._plan_cache.popitem(last=False)
 
     def _coerce_duration(self, value: Any) -> Optional[int]:
         if value is None:
@@ -735,7 +828,11 @@ class JobManager:
         if isinstance(value, (int, float)):
             return int(value)
         if isinstance(value, str):
-            match = re.search(r"(\d+)", value)
+            # Plain numbers ("5") skip the regex; isdecimal matches exactly
+            # the digits \d accepts, so int() cannot fail here
+            if value.isdecimal():
+                return int(value)
+            match = _DIGITS_RE.search(value)
             if match:
                 return int(match.group(1))
         return None
@@ -758,7 +855,8 @@ class JobManager:
             if isinstance(skeleton, dict) and skeleton.get("shot_id") is not None:
                 skeleton_by_id[str(skeleton["shot_id"])] = skeleton
 
-        normalized_shots: List[Dict[str, Any]] = []
+        n_skel = len(skeletons)
+
         def _extract_narration(source: Any) -> Optional[str]:
             if isinstance(source, dict):
                 narration = source.get("narration")
@@ -772,56 +870,51 @@ class JobManager:
                     return cleaned
             return None
 
+        # Callers pass a freshly dumped plan, so shots are normalized in place
         for idx, shot in enumerate(shots):
             if not isinstance(shot, dict):
-                normalized_shots.append(shot)
                 continue
 
-            normalized = dict(shot)
-            shot_id = normalized.get("shot_id")
-            if shot_id is None and idx < len(skeletons):
-                skeleton_id = skeletons[idx].get("shot_id")
+            positional = skeletons[idx] if idx < n_skel else None
+            shot_id = shot.get("shot_id")
+            if shot_id is None and positional is not None:
+                skeleton_id = positional.get("shot_id")
                 if skeleton_id is not None:
-                    normalized["shot_id"] = skeleton_id
+                    shot["shot_id"] = skeleton_id
                     shot_id = skeleton_id
 
             skeleton = None
             if shot_id is not None:
                 skeleton = skeleton_by_id.get(str(shot_id))
-            if skeleton is None and idx < len(skeletons):
-                skeleton = skeletons[idx]
-
-            duration = self._coerce_duration(normalized.get("duration_s"))
-            if duration is None:
-                duration = self._coerce_duration(normalized.get("duration"))
-            if duration is None:
-                duration = self._coerce_duration(normalized.get("length_s"))
-            if duration is None:
-                if isinstance(skeleton, dict):
-                    duration = self._coerce_duration(skeleton.get("duration_s"))
+            if skeleton is None:
+                skeleton = positional
+
+            duration = None
+            for key in _SHOT_DURATION_KEYS:
+                duration = self._coerce_duration(shot.get(key))
+                if duration is not None:
+                    break
+            if duration is None and isinstance(skeleton, dict):
+                duration = self._coerce_duration(skeleton.get("duration_s"))
             if duration is not None:
-                normalized["duration_s"] = duration
+                shot["duration_s"] = duration
 
-            narration = _extract_narration(normalized.get("audio"))
+            narration = _extract_narration(shot.get("audio"))
             if not narration:
-                narration = _extract_narration(normalized.get("narration"))
+                narration = _extract_narration(shot.get("narration"))
             if not narration:
-                narration = _extract_narration(normalized.get("audio_template"))
+                narration = _extract_narration(shot.get("audio_template"))
             if not narration and isinstance(skeleton, dict):
                 narration = _extract_narration(skeleton.get("audio_template"))
 
             if narration:
-                audio = normalized.get("audio")
+                audio = shot.get("audio")
                 if not isinstance(audio, dict):
                     audio = {}
                 audio["narration"] = narration
-                normalized["audio"] = audio
-                if not _extract_narration(normalized.get("narration")):
-                    normalized["narration"] = narration
-
-            normalized_shots.append(normalized)
-
-        shot_plan["shots"] = normalized_shots
+                shot["audio"] = audio
+                if not _extract_narration(shot.get("narration")):
+                    shot["narration"] = narration
 
         total_duration = self._coerce_duration(shot_plan.get("duration_s"))
         if total_duration is None:
@@ -829,7 +922,7 @@ class JobManager:
         if total_duration is None:
             computed_duration = sum(
                 shot.get("duration_s", 0)
-                for shot in normalized_shots
+                for shot in shots
                 if isinstance(shot, dict) and isinstance(shot.get("duration_s"), (int, float))
             )
             if computed_duration:
@@ -908,7 +1001,7 @@ class JobManager:
             JobDB.update_job_assets(db, job_id, final_shot_assets)
 
             # Write metadata
-            self._write_job_metadata(job, final_shot_assets)
+            await self._write_job_metadata(job, final_shot_assets)
 
             # Transition to SUCCEEDED
             transition_state(db, job_id, "SUCCEEDED", "finalization_complete")
@@ -968,33 +1061,22 @@ class JobManager:
         Returns:
             List of final shot asset dicts
         """
-        final_shot_assets: List[Dict[str, Any]] = []
-        shot_requests = job.shot_requests
+        shot_requests = [
+            req for req in (job.shot_requests or []) if req.get("shot_id") in selected_seeds
+        ]
+        # Convert resolution format (1280x720 -> 1280*720)
+        size = target_resolution.replace("x", "*")
 
-        async def _generate_final_shot(
-            shot_request: Dict[str, Any],
-        ) -> Optional[Dict[str, Any]]:
+        async def _submit_final(shot_request: Dict[str, Any]) -> Optional[str]:
             shot_id = shot_request["shot_id"]
-
-            # Skip if shot not in selected seeds
-            if shot_id not in selected_seeds:
-                return None
-
-            selected_seed = selected_seeds[shot_id]
-
             try:
                 # Submit shot request with selected seed at target resolution
-                from src.core.wan26_adapter import ShotGenerationRequest
-
-                # Convert resolution format (1280x720 -> 1280*720)
-                size = target_resolution.replace("x", "*")
-
                 gen_request = ShotGenerationRequest(
                     prompt=shot_request["compiled_prompt"],
                     negative_prompt=shot_request["compiled_negative_prompt"],
                     size=size,
                     duration=shot_request["params"]["duration"],
-                    seed=selected_seed,  # Use selected seed
+                    seed=selected_seeds[shot_id],  # Use selected seed
                     prompt_extend=shot_request["params"]["prompt_extend"],
                     watermark=shot_request["params"]["watermark"],
                 )
@@ -1002,93 +1084,82 @@ class JobManager:
                 submit_response = await self.wan26_adapter.submit_shot_request_with_retry(
                     gen_request,
                 )
-
-                # Poll for completion
-                status_response = await self.wan26_adapter.poll_task_status(
-                    submit_response.task_id,
+                return submit_response.task_id
+            except Exception as e:
+                logger.error(
+                    "final_shot_workflow_error",
+                    job_id=job.job_id,
+                    shot_id=shot_id,
+                    error=str(e),
                 )
+                return None
 
-                if status_response.status == "succeeded" and status_response.video_url:
-                    # Download video
-                    temp_video_path = await self.downloader.download_video(
-                        status_response.video_url,
-                    )
+        async def _finalize_asset(
+            shot_request: Dict[str, Any],
+            status_response: Any,
+        ) -> Optional[Dict[str, Any]]:
+            shot_id = shot_request["shot_id"]
+            selected_seed = selected_seeds[shot_id]
 
-                    # Split video/audio
-                    video_path = self.asset_storage.get_video_storage_path(
-                        job.job_id,
-                        f"{shot_id}_final",
-                    )
-                    audio_path = self.asset_storage.get_audio_storage_path(
-                        job.job_id,
-                        f"{shot_id}_final",
-                    )
+            if isinstance(status_response, BaseException):
+                logger.error(
+                    "final_shot_workflow_error",
+                    job_id=job.job_id,
+                    shot_id=shot_id,
+                    error=str(status_response),
+                )
+                return None
 
-                    try:
-                        split_result = await asyncio.to_thread(
-                            self.ffmpeg_splitter.split_video_audio,
-                            temp_video_path,
-                            video_path,
-                            audio_path,
-                        )
+            if status_response.status != "succeeded" or not status_response.video_url:
+                logger.error(
+                    "final_shot_generation_failed",
+                    job_id=job.job_id,
+                    shot_id=shot_id,
+                    task_id=status_response.task_id,
+                    error=status_response.error,
+                )
+                return None
 
-                        audio_url = self.asset_storage.get_audio_url(
-                            job.job_id,
-                            f"{shot_id}_final",
-                        )
-                        duration_s = split_result["duration_s"]
-
-                        # Clean up temp file
-                        os.remove(temp_video_path)
-                    except FFmpegError as exc:
-                        logger.warning(
-                            "ffmpeg_fallback_video_only",
-                            job_id=job.job_id,
-                            shot_id=shot_id,
-                            error=str(exc),
-                        )
-                        # Store raw video when ffmpeg isn't available.
-                        shutil.move(temp_video_path, video_path)
-                        audio_path = ""
-                        audio_url = ""
-                        duration_s = int(shot_request["params"]["duration"])
-
-                    # Create final asset record
-                    asset = {
-                        "shot_id": shot_id,
-                        "seed": selected_seed,
-                        "model_task_id": status_response.task_id,
-                        "raw_video_url": status_response.video_url,
-                        "video_url": self.asset_storage.get_video_url(
-                            job.job_id,
-                            f"{shot_id}_final",
-                        ),
-                        "audio_url": audio_url,
-                        "video_path": video_path,
-                        "audio_path": audio_path,
-                        "duration_s": duration_s,
-                        "resolution": target_resolution,
-                    }
+            try:
+                # Download video
+                temp_video_path = await self.downloader.download_video(
+                    status_response.video_url,
+                )
 
-                    final_shot_assets.append(asset)
+                # Split video/audio
+                video_path, video_url = self.asset_storage.get_video_path_and_url(
+                    job.job_id,
+                    f"{shot_id}_final",
+                )
+                audio_path, audio_url = self.asset_storage.get_audio_path_and_url(
+                    job.job_id,
+                    f"{shot_id}_final",
+                )
 
-                    logger.info(
-                        "final_shot_generated",
-                        job_id=job.job_id,
-                        shot_id=shot_id,
-                        seed=selected_seed,
-                        resolution=target_resolution,
+                try:
+                    split_result = await self.ffmpeg_splitter.split_video_audio_async(
+                        temp_video_path,
+                        video_path,
+                        audio_path,
                     )
 
-                    return asset
-                else:
-                    logger.error(
-                        "final_shot_generation_failed",
+                    duration_s = split_result["duration_s"]
+
+                    # Clean up temp file
+                    await asyncio.to_thread(os.remove, temp_video_path)
+                except FFmpegError as exc:
+                    logger.warning(
+                        "ffmpeg_fallback_video_only",
                         job_id=job.job_id,
                         shot_id=shot_id,
-                        task_id=status_response.task_id,
-                        error=status_response.error,
+                        error=str(exc),
                     )
+                    # Store raw video when ffmpeg isn't available (a rename
+                    # unless the download dir is on another filesystem)
+                    await asyncio.to_thread(shutil.move, temp_video_path, video_path)
+                    audio_path = ""
+                    audio_url = ""
+                    duration_s = int(shot_request["params"]["duration"])
 
             except Exception as e:
                 logger.error(
@@ -1097,23 +1168,67 @@ class JobManager:
                     shot_id=shot_id,
                     error=str(e),
                 )
-                # Continue with next shot
                 return None
 
-            return None
+            logger.info(
+                "final_shot_generated",
+                job_id=job.job_id,
+                shot_id=shot_id,
+                seed=selected_seed,
+                resolution=target_resolution,
+            )
 
-        tasks = [
-            asyncio.create_task(_generate_final_shot(req))
-            for req in shot_requests
-            if req.get("shot_id") in selected_seeds
+            # Create final asset record
+            return {
+                "shot_id": shot_id,
+                "seed": selected_seed,
+                "model_task_id": status_response.task_id,
+                "raw_video_url": status_response.video_url,
+                "video_url": video_url,
+                "audio_url": audio_url,
+                "video_path": video_path,
+                "audio_path": audio_path,
+                "duration_s": duration_s,
+                "resolution": target_resolution,
+            }
+
+        shot_slots = asyncio.Semaphore(SHOT_GENERATION_CONCURRENCY)
+
+        async def _finalize_asset_bounded(
+            shot_request: Dict[str, Any],
+            status_response: Any,
+        ) -> Optional[Dict[str, Any]]:
+            async with shot_slots:
+                return await _finalize_asset(shot_request, status_response)
+
+        # Submit every shot, then wait on all tasks from one poll loop
+        task_ids = await asyncio.gather(*(_submit_final(req) for req in shot_requests))
+        submitted = [
+            (req, task_id) for req, task_id in zip(shot_requests, task_ids) if task_id is not None
         ]
-        results = await asyncio.gather(*tasks) if tasks else []
+        if not submitted:
+            return []
+        requests_by_task = {task_id: req for req, task_id in submitted}
+        done_q: asyncio.Queue = asyncio.Queue()
 
-        for asset in results:
-            if asset:
-                final_shot_assets.append(asset)
+        async def _poll() -> None:
+            try:
+                await self.wan26_adapter.poll_many(list(requests_by_task), done_q=done_q)
+            finally:
+                await done_q.put(None)
+
+        # Download and split each shot as soon as its task finishes
+        poller = asyncio.create_task(_poll())
+        finalizers: Dict[str, asyncio.Task] = {}
+        while (item := await done_q.get()) is not None:
+            task_id, status_response = item
+            finalizers[task_id] = asyncio.create_task(
+                _finalize_asset_bounded(requests_by_task[task_id], status_response)
+            )
 
-        return final_shot_assets
+        assets = dict(zip(finalizers, await asyncio.gather(*finalizers.values())))
+        await poller
+        return [assets[task_id] for _, task_id in submitted if assets[task_id]]
 
     async def execute_revision_workflow(
         self,
@@ -1163,7 +1278,6 @@ class JobManager:
 
         # Step 3: Re-instantiate template with modified IR
         logger.info("revision_template_instantiation", parent_job_id=parent_job_id)
-        from src.services.storage import TemplateDB
         template_model = TemplateDB.get_template(db, template_id, template_version)
         if not template_model:
             raise ValueError(f"Template not found: {template_id}:{template_version}")
@@ -1180,7 +1294,7 @@ class JobManager:
             ir_model,
             template_dict,
         )
-        shot_plan_dict = shot_plan.dict()
+        shot_plan_dict = shot_plan.model_dump()
         shot_plan_dict = self._normalize_shot_plan(shot_plan_dict, template_dict)
 
         # Step 4: Re-validate parameters
@@ -1198,61 +1312,32 @@ class JobManager:
 
         # Step 5: Re-compile prompts (only for targeted shots if possible)
         logger.info("revision_prompt_compilation", parent_job_id=parent_job_id)
-        shot_requests = []
-
-        for shot in shot_plan_dict["shots"]:
-            # Check if this shot should be modified based on targeted_fields
-            if self._should_modify_shot(shot, targeted_fields):
-                # Compile new prompt for modified shot
-                # Get template from DB
-                from src.services.storage import TemplateDB
-                template = TemplateDB.get_template(db, template_id, template_version)
-                template_dict = template.to_dict() if template else {}
-
-                compiled = self.prompt_compiler.compile_shot_prompt(
-                    shot=shot,
-                    shot_plan=shot_plan_dict,
-                    ir=modified_ir,
-                    negative_prompt_base=template_dict.get("negative_prompt_base", ""),
-                    prompt_extend=False,
-                )
-
-                shot_request = {
-                    "shot_id": shot["shot_id"],
+        original_requests_by_id = {s["shot_id"]: s for s in parent_job.shot_requests or []}
+
+        # Re-use the original request unless the shot is targeted (or has none),
+        # and compile all remaining shots in one pass over the plan
+        shot_requests = [
+            None
+            if self._should_modify_shot(shot, targeted_fields)
+            else original_requests_by_id.get(shot["shot_id"])
+            for shot in shot_plan_dict["shots"]
+        ]
+        to_compile = [i for i, request in enumerate(shot_requests) if not request]
+        if to_compile:
+            compiled_prompts = self.prompt_compiler.compile_shot_prompts_batch(
+                [shot_plan_dict["shots"][i] for i in to_compile],
+                shot_plan=shot_plan_dict,
+                ir=modified_ir,
+                negative_prompt_base=template_dict.get("negative_prompt_base", ""),
+                prompt_extend=False,
+            )
+            for i, compiled in zip(to_compile, compiled_prompts):
+                shot_requests[i] = {
+                    "shot_id": shot_plan_dict["shots"][i]["shot_id"],
                     "compiled_prompt": compiled.compiled_prompt,
                     "compiled_negative_prompt": compiled.compiled_negative_prompt,
                     "params": compiled.params,
                 }
-            else:
-                # Re-use original shot request
-                original_shot = next(
-                    (s for s in parent_job.shot_requests if s["shot_id"] == shot["shot_id"]),
-                    None,
-                )
-                if original_shot:
-                    shot_request = original_shot
-                else:
-                    # Fallback: compile anyway
-                    from src.services.storage import TemplateDB
-                    template = TemplateDB.get_template(db, template_id, template_version)
-                    template_dict = template.to_dict() if template else {}
-
-                    compiled = self.prompt_compiler.compile_shot_prompt(
-                        shot=shot,
-                        shot_plan=shot_plan_dict,
-                        ir=modified_ir,
-                        negative_prompt_base=template_dict.get("negative_prompt_base", ""),
-                        prompt_extend=False,
-                    )
-
-                    shot_request = {
-                        "shot_id": shot["shot_id"],
-                        "compiled_prompt": compiled.compiled_prompt,
-                        "compiled_negative_prompt": compiled.compiled_negative_prompt,
-                        "params": compiled.params,
-                    }
-
-            shot_requests.append(shot_request)
 
         # Step 6: Create new job with revision tracking
         logger.info("revision_job_creation", parent_job_id=parent_job_id)
@@ -1289,8 +1374,11 @@ class JobManager:
         db.refresh(job)
 
         # Step 7: Submit to RUNNING state
-        transition_state(db, job.job_id, "SUBMITTED", "revision_submitted")
-        transition_state(db, job.job_id, "RUNNING", "revision_started")
+        transition_states(
+            db,
+            job.job_id,
+            [("SUBMITTED", "revision_submitted"), ("RUNNING", "revision_started")],
+        )
 
         # Step 8: Generate shots
         logger.info("revision_shot_generation", parent_job_id=parent_job_id)
@@ -1304,7 +1392,7 @@ class JobManager:
         JobDB.update_job_assets(db, job.job_id, shot_assets)
 
         # Step 10: Write metadata
-        self._write_job_metadata(job, shot_assets)
+        await self._write_job_metadata(job, shot_assets)
 
         # Step 11: Transition to SUCCEEDED
         transition_state(db, job.job_id, "SUCCEEDED", "revision_complete")
@@ -1343,25 +1431,34 @@ class JobManager:
         Returns:
             Modified IR
         """
-        import copy
-        modified_ir = copy.deepcopy(ir)
+        # Copy only the branches that get written; the rest stays shared with ir
+        modified_ir = dict(ir)
 
         # Apply modifications based on targeted fields
         for field in targeted_fields:
             if field == "camera":
                 # Modify camera motion in scene or style
                 if "camera_motion" in suggested_modifications:
-                    modified_ir["scene"]["camera_motion"] = suggested_modifications["camera_motion"]
+                    modified_ir["scene"] = {
+                        **modified_ir["scene"],
+                        "camera_motion": suggested_modifications["camera_motion"],
+                    }
 
             elif field == "narration":
                 # Modify narration in audio
                 if "narration" in suggested_modifications:
-                    modified_ir["audio"]["narration_tone"] = suggested_modifications.get("narration_tone", "calm")
+                    modified_ir["audio"] = {
+                        **modified_ir["audio"],
+                        "narration_tone": suggested_modifications.get("narration_tone", "calm"),
+                    }
 
             elif field == "lighting":
                 # Modify lighting in style
                 if "lighting" in suggested_modifications:
-                    modified_ir["style"]["lighting"] = suggested_modifications["lighting"]
+                    modified_ir["style"] = {
+                        **modified_ir["style"],
+                        "lighting": suggested_modifications["lighting"],
+                    }
 
             elif field == "emotion":
                 # Modify emotion curve
@@ -3,7 +3,7 @@ Job State Management Service
 """
 
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional, Tuple
 from sqlalchemy.orm import Session
 
 from src.models.job import JobModel
@@ -51,14 +51,7 @@ def transition_state(
     if not job:
         return None
 
-    current_state = job.state
-
-    # Validate state transition
-    if new_state not in VALID_TRANSITIONS.get(current_state, []):
-        raise JobStateError(
-            f"Invalid state transition: {current_state} -> {new_state}. "
-            f"Valid transitions from {current_state}: {VALID_TRANSITIONS.get(current_state, [])}"
-        )
+    _validate_transition(job.state, new_state)
 
     # Update job state
     updated_job = JobDB.update_job_state(
@@ -72,6 +65,53 @@ def transition_state(
     return updated_job
 
 
+def transition_states(
+    db: Session,
+    job_id: str,
+    transitions: List[Tuple[str, str]],
+) -> Optional[JobModel]:
+    """
+    Apply consecutive state transitions in a single commit
+
+    The whole chain is validated before anything is written, so either every
+    transition is recorded or none is.
+
+    Args:
+        db: Database session
+        job_id: Job identifier
+        transitions: (new_state, event) pairs, in order
+
+    Returns:
+        Updated JobModel or None if job not found
+
+    Raises:
+        JobStateError: If any transition in the chain is invalid
+    """
+    job = JobDB.get_job(db, job_id)
+    if not job:
+        return None
+
+    current_state = job.state
+    for new_state, _event in transitions:
+        _validate_transition(current_state, new_state)
+        current_state = new_state
+
+    return JobDB.update_job_states(
+        db=db,
+        job_id=job_id,
+        transitions=transitions,
+        timestamp=datetime.utcnow(),
+    )
+
+
+def _validate_transition(current_state: str, new_state: str) -> None:
+    if new_state not in VALID_TRANSITIONS.get(current_state, []):
+        raise JobStateError(
+            f"Invalid state transition: {current_state} -> {new_state}. "
+            f"Valid transitions from {current_state}: {VALID_TRANSITIONS.get(current_state, [])}"
+        )
+
+
 def get_current_state(db: Session, job_id: str) -> Optional[str]:
     """
     Get current state of a job
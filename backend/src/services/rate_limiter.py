@@ -4,6 +4,7 @@ Rate Limiting Service
 
 import time
 import redis
+from datetime import datetime
 from typing import Optional, Dict, Any
 from src.config.settings import settings
 from src.config.constants import (
@@ -11,6 +12,7 @@ from src.config.constants import (
     RATE_LIMIT_BURST,
     RATE_LIMIT_WINDOW_S,
     MAX_CONCURRENT_JOBS_PER_IP,
+    RATE_LIMIT_RESUME_GRACE_S,
 )
 
 
@@ -268,6 +270,26 @@ class RateLimiter:
         key = f"concurrent:{ip}"
         return self.redis_client.decr(key)
 
+    @staticmethod
+    def planned_within_grace(
+        created_at: Optional[datetime],
+        grace_s: int = RATE_LIMIT_RESUME_GRACE_S,
+    ) -> bool:
+        """
+        Whether a planned job is recent enough to skip the rate limit on render
+
+        Args:
+            created_at: Job creation time (naive UTC)
+            grace_s: Window after planning in which the check is skipped
+
+        Returns:
+            True if the job was created less than grace_s seconds ago
+        """
+        if created_at is None:
+            return False
+        age_s = (datetime.utcnow() - created_at).total_seconds()
+        return 0 <= age_s < grace_s
+
     def get_job_count(self, ip: str) -> int:
         """Get current concurrent job count."""
         key = f"concurrent:{ip}"
@@ -2,12 +2,17 @@
 Storage Service - Database operations for Templates and Jobs
 """
 
+from sqlalchemy import JSON, DateTime, Integer, MetaData, Select, Table, Uuid, func, inspect, insert, select
+from sqlalchemy.engine import Connection, Engine, Inspector, RowMapping
 from sqlalchemy.orm import Session
-from typing import List, Optional, Dict, Any, Union
-from datetime import datetime
+from sqlalchemy.schema import CreateTable
+from sqlalchemy.sql import column, table
+from typing import List, Optional, Dict, Any, Sequence, Set, Tuple, Union
+from datetime import datetime, timedelta
 import json
+import uuid
 
-from src.models.job import JobModel
+from src.models.job import JobModel, JobRetryModel, JobStateTransitionModel
 from src.models.template import TemplateModel
 
 
@@ -135,7 +140,7 @@ class JobDB:
                 job.total_duration_s = 0
             if not getattr(job, "resolution", None):
                 job.resolution = "1280*720"
-            if not getattr(job, "state_transitions", None):
+            if not job.transitions:
                 state_value = job.state.value if hasattr(job.state, "value") else job.state
                 job.state_transitions = [
                     {
@@ -144,8 +149,6 @@ class JobDB:
                         "event": "job_created",
                     }
                 ]
-            if getattr(job, "retry_count", None) is None:
-                job.retry_count = 0
             if getattr(job, "retry_exhausted", None) is None:
                 job.retry_exhausted = False
         else:
@@ -174,7 +177,6 @@ class JobDB:
                         "event": "job_created",
                     }
                 ],
-                retry_count=0,
                 retry_exhausted=False,
             )
         db.add(job)
@@ -183,9 +185,19 @@ class JobDB:
         return job
 
     @staticmethod
-    def get_job(db: Session, job_id: str) -> Optional[JobModel]:
-        """Get job by ID"""
-        return db.query(JobModel).filter(JobModel.job_id == job_id).first()
+    def get_job(db: Session, job_id: str, for_update: bool = False) -> Optional[JobModel]:
+        """Get job by ID (for_update locks the row until the transaction ends)"""
+        # job_id is a native UUID column on PostgreSQL; a malformed id from a
+        # request path would otherwise fail the cast instead of matching nothing
+        if db.get_bind().dialect.name == "postgresql":
+            try:
+                uuid.UUID(str(job_id))
+            except ValueError:
+                return None
+        query = db.query(JobModel).filter(JobModel.job_id == job_id)
+        if for_update:
+            query = query.with_for_update()
+        return query.first()
 
     @staticmethod
     def update_job_state(
@@ -196,30 +208,40 @@ class JobDB:
         timestamp: Optional[datetime] = None,
     ) -> Optional[JobModel]:
         """Update job state and record transition"""
-        job = JobDB.get_job(db, job_id)
+        return JobDB.update_job_states(db, job_id, [(new_state, event)], timestamp)
+
+    @staticmethod
+    def update_job_states(
+        db: Session,
+        job_id: str,
+        transitions: List[Tuple[Union[str, Any], Optional[str]]],
+        timestamp: Optional[datetime] = None,
+    ) -> Optional[JobModel]:
+        """Apply consecutive state transitions and record them in one commit"""
+        # Lock the job row so concurrent writers (API and worker) take turns
+        # numbering transitions instead of colliding on (job_id, seq)
+        job = JobDB.get_job(db, job_id, for_update=True)
         if job:
-            state_value = new_state.value if hasattr(new_state, "value") else new_state
-            job.state = state_value
             ts = timestamp or datetime.utcnow()
-            transitions = list(job.state_transitions or [])
-            transitions.append(
-                {
-                    "state": state_value,
-                    "timestamp": ts.isoformat(),
-                    "event": event or "state_updated",
-                }
+            # Append-only: one INSERT per transition, the existing history is never rewritten
+            seq = (
+                db.query(func.count(JobStateTransitionModel.id))
+                .filter(JobStateTransitionModel.job_id == job_id)
+                .scalar()
             )
-            job.state_transitions = transitions
-
-            # Update timestamp fields based on state
-            if new_state == "SUBMITTED":
-                job.submitted_at = ts
-            elif new_state == "RUNNING":
-                job.running_at = ts
-            elif new_state == "SUCCEEDED":
-                job.succeeded_at = ts
-            elif new_state == "FAILED":
-                job.failed_at = ts
+            for new_state, event in transitions:
+                state_value = new_state.value if hasattr(new_state, "value") else new_state
+                job.state = state_value
+                db.add(
+                    JobStateTransitionModel(
+                        job_id=job_id,
+                        seq=seq,
+                        state=state_value,
+                        timestamp=ts,
+                        event=event or "state_updated",
+                    )
+                )
+                seq += 1
 
             db.commit()
             db.refresh(job)
@@ -331,11 +353,16 @@ class JobDB:
         last_retry_error: Dict[str, Any],
         retry_exhausted: bool,
     ) -> Optional[JobModel]:
-        """Update job retry information"""
+        """Record a retry attempt and update the exhausted flag"""
         job = JobDB.get_job(db, job_id)
         if job:
-            job.retry_count = retry_count
-            job.last_retry_error = last_retry_error
+            db.add(
+                JobRetryModel(
+                    job_id=job_id,
+                    attempt=retry_count,
+                    error_details=last_retry_error,
+                )
+            )
             job.retry_exhausted = retry_exhausted
             db.commit()
             db.refresh(job)
@@ -358,6 +385,11 @@ class JobDB:
     def delete_old_jobs(db: Session, days: int = 30) -> int:
         """Delete jobs older than specified days"""
         cutoff_date = datetime.utcnow() - timedelta(days=days)
+        # Bulk deletes bypass ORM cascades (and SQLite does not enforce
+        # ON DELETE CASCADE by default), so clear the history tables first
+        old_job_ids: Select[Any] = select(JobModel.job_id).where(JobModel.created_at < cutoff_date)
+        for child in (JobStateTransitionModel, JobRetryModel):
+            db.query(child).filter(child.job_id.in_(old_job_ids)).delete(synchronize_session=False)
         deleted = (
             db.query(JobModel)
             .filter(JobModel.created_at < cutoff_date)
@@ -367,12 +399,185 @@ class JobDB:
         return deleted
 
 
+# Job history as stored on the jobs row before job_state_transitions and
+# job_retries existed; read once by upgrade_schema to backfill those tables
+_legacy_jobs = table(
+    "jobs",
+    column("job_id"),
+    column("state_transitions", JSON),
+    column("retry_count", Integer),
+    column("last_retry_error", JSON),
+    column("created_at", DateTime),
+    column("updated_at", DateTime),
+)
+
+
+def upgrade_schema(engine: Engine) -> None:
+    """
+    Bring tables created by an earlier schema up to the current models
+
+    create_all only creates missing tables, so existing databases keep the old
+    jobs columns (state_transitions, retry_count, last_retry_error and the
+    per-state timestamps), text job ids, indexes and Python-side timestamp
+    defaults. This creates the history tables, backfills them from the old
+    columns and reshapes jobs/templates to match the models. A database
+    already on the current schema is left untouched.
+
+    Args:
+        engine: Database engine
+    """
+    from src.models import Base
+
+    with engine.begin() as conn:
+        inspector = inspect(conn)
+        existing = set(inspector.get_table_names())
+        if "jobs" not in existing:
+            return
+
+        job_columns = {col["name"] for col in inspector.get_columns("jobs")}
+        history = (
+            conn.execute(select(_legacy_jobs)).mappings().all()
+            if "state_transitions" in job_columns
+            else []
+        )
+
+        for model_table in Base.metadata.sorted_tables:
+            if model_table.name not in existing:
+                continue
+            if conn.dialect.name == "sqlite":
+                if not _table_is_current(inspector, model_table):
+                    _rebuild_sqlite_table(conn, inspector, model_table)
+            else:
+                _alter_table(conn, inspector, model_table)
+
+        for child in (JobStateTransitionModel, JobRetryModel):
+            child.__table__.create(conn, checkfirst=True)
+        _backfill_job_history(conn, history)
+
+
+def _table_is_current(inspector: Inspector, model_table: Table) -> bool:
+    """Whether an existing table has the model's columns, defaults and indexes"""
+    reflected = {col["name"]: col for col in inspector.get_columns(model_table.name)}
+    if set(reflected) != set(model_table.columns.keys()):
+        return False
+    if any(
+        col.server_default is not None and reflected[col.name]["default"] is None
+        for col in model_table.columns
+    ):
+        return False
+    index_names = {index["name"] for index in inspector.get_indexes(model_table.name)}
+    return index_names == {index.name for index in model_table.indexes}
+
+
+def _rebuild_sqlite_table(conn: Connection, inspector: Inspector, model_table: Table) -> None:
+    """
+    Recreate a SQLite table from its model and copy the shared columns
+
+    SQLite cannot change column defaults in place, so the table is rebuilt:
+    the rows are copied into a new table before the old one is dropped.
+    """
+    name = model_table.name
+    new_name = f"_{name}_new"
+    old_columns = {col["name"] for col in inspector.get_columns(name)}
+
+    # Indexes are created after the rename so their names do not collide
+    new_table = model_table.to_metadata(MetaData(), name=new_name)
+    new_table.indexes.clear()
+    new_table.drop(conn, checkfirst=True)
+    new_table.create(conn)
+
+    shared = ", ".join(f'"{col.name}"' for col in model_table.columns if col.name in old_columns)
+    conn.exec_driver_sql(f'INSERT INTO "{new_name}" ({shared}) SELECT {shared} FROM "{name}"')
+    conn.exec_driver_sql(f'DROP TABLE "{name}"')
+    conn.exec_driver_sql(f'ALTER TABLE "{new_name}" RENAME TO "{name}"')
+    for index in model_table.indexes:
+        index.create(conn)
+
+
+def _alter_table(conn: Connection, inspector: Inspector, model_table: Table) -> None:
+    """Bring an existing table to its model with ALTER statements (PostgreSQL)"""
+    name = model_table.name
+    reflected = {col["name"]: col for col in inspector.get_columns(name)}
+
+    for column_name in reflected.keys() - model_table.columns.keys():
+        conn.exec_driver_sql(f'ALTER TABLE "{name}" DROP COLUMN "{column_name}"')
+
+    ddl_compiler = conn.dialect.ddl_compiler(conn.dialect, CreateTable(model_table))
+    for col in model_table.columns:
+        if col.name not in reflected:
+            continue
+        # Text job ids become native UUID columns
+        column_type = col.type.dialect_impl(conn.dialect)
+        if isinstance(column_type, Uuid) and not isinstance(reflected[col.name]["type"], Uuid):
+            type_sql = column_type.compile(dialect=conn.dialect)
+            conn.exec_driver_sql(
+                f'ALTER TABLE "{name}" ALTER COLUMN "{col.name}" '
+                f'TYPE {type_sql} USING "{col.name}"::{type_sql}'
+            )
+        default_sql = ddl_compiler.get_column_default_string(col)
+        if default_sql is not None and reflected[col.name]["default"] is None:
+            conn.exec_driver_sql(
+                f'ALTER TABLE "{name}" ALTER COLUMN "{col.name}" SET DEFAULT {default_sql}'
+            )
+
+    # Unique indexes are kept: they may back job_id foreign keys
+    model_indexes = {index.name for index in model_table.indexes}
+    for reflected_index in inspector.get_indexes(name):
+        if reflected_index["name"] not in model_indexes and not reflected_index["unique"]:
+            conn.exec_driver_sql(f'DROP INDEX "{reflected_index["name"]}"')
+    for index in model_table.indexes:
+        index.create(conn, checkfirst=True)
+
+
+def _backfill_job_history(conn: Connection, history: Sequence[RowMapping]) -> None:
+    """Insert transitions and the latest retry read from the old jobs columns"""
+    # Jobs already recorded in the history tables keep what is there
+    recorded: Set[str] = set(conn.scalars(select(JobStateTransitionModel.job_id).distinct()))
+    recorded.update(conn.scalars(select(JobRetryModel.job_id).distinct()))
+
+    transition_rows: List[Dict[str, Any]] = []
+    retry_rows: List[Dict[str, Any]] = []
+    for job in history:
+        if job["job_id"] in recorded:
+            continue
+        transitions = job["state_transitions"]
+        if isinstance(transitions, str):
+            transitions = json.loads(transitions)
+        for seq, transition in enumerate(transitions or []):
+            row = JobStateTransitionModel.from_dict(seq, transition)
+            transition_rows.append(
+                {
+                    "job_id": job["job_id"],
+                    "seq": seq,
+                    "state": row.state,
+                    "timestamp": row.timestamp,
+                    "event": row.event,
+                }
+            )
+        if job["retry_count"]:
+            # retry_count/last_retry_error read the latest attempt only
+            retry_rows.append(
+                {
+                    "job_id": job["job_id"],
+                    "attempt": job["retry_count"],
+                    "error_details": job["last_retry_error"],
+                    "retried_at": job["updated_at"] or job["created_at"],
+                }
+            )
+
+    if transition_rows:
+        conn.execute(insert(JobStateTransitionModel.__table__), transition_rows)
+    if retry_rows:
+        conn.execute(insert(JobRetryModel.__table__), retry_rows)
+
+
 def init_db(db: Session) -> None:
     """
     Initialize database with default data
     """
-    # Create tables
+    # Upgrade tables from earlier schemas, then create missing ones
     from src.models import Base
+    upgrade_schema(db.get_bind().engine)
     Base.metadata.create_all(bind=db.get_bind())
 
     # Load templates from file system
@@ -16,9 +16,16 @@ class Wan26Downloader:
     Download generated videos from DashScope URLs
     """
 
-    def __init__(self):
-        """Initialize downloader"""
+    def __init__(self, temp_dir: Optional[str] = None):
+        """
+        Initialize downloader
+
+        Args:
+            temp_dir: Directory for downloads without a target path (system
+                temp directory if None)
+        """
         self.client = httpx.AsyncClient(timeout=300.0)
+        self.temp_dir = temp_dir
 
     async def download_video(
         self,
@@ -52,7 +59,7 @@ class Wan26Downloader:
                 # Determine target path
                 if target_path is None:
                     # Create temporary file
-                    target_path = tempfile.mktemp(suffix=".mp4")
+                    target_path = tempfile.mktemp(suffix=".mp4", dir=self.temp_dir)
 
                 # Ensure directory exists
                 Path(target_path).parent.mkdir(parents=True, exist_ok=True)
@@ -4,24 +4,39 @@ RQ task definitions for long-running render jobs.
 
 import asyncio
 
+from sqlalchemy.orm import Session
+
+from src.core.wan26_adapter import Wan26Adapter, install_blocking_executor
 from src.models import SessionLocal
 from src.services.job_manager import JobManager
 from src.services.observability import logger
 
 
+async def _execute_render_job(job_manager: JobManager, db: Session, job_id: str, client_ip: str) -> None:
+    install_blocking_executor()
+    # Warm the DashScope connection pool while the job is loaded and planned
+    prewarm = asyncio.create_task(Wan26Adapter().prewarm())
+    try:
+        await job_manager.execute_generation_from_job(
+            db=db,
+            job_id=job_id,
+            client_ip=client_ip,
+            skip_rate_limit=True,
+        )
+    finally:
+        # asyncio.run closes this loop on return; queued metadata must land first
+        await job_manager.artifact_writer.flush()
+        await prewarm
+        # The shared DashScope client is bound to this job's event loop
+        await Wan26Adapter.aclose_client()
+
+
 def run_render_job(job_id: str, client_ip: str) -> None:
     logger.info("render_worker_start", job_id=job_id, client_ip=client_ip)
     db = SessionLocal()
     try:
         job_manager = JobManager()
-        asyncio.run(
-            job_manager.execute_generation_from_job(
-                db=db,
-                job_id=job_id,
-                client_ip=client_ip,
-                skip_rate_limit=True,
-            )
-        )
+        asyncio.run(_execute_render_job(job_manager, db, job_id, client_ip))
     except Exception as exc:
         logger.error("render_worker_failed", job_id=job_id, error=str(exc))
         raise
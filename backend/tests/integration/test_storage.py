@@ -2,9 +2,15 @@
 Integration Tests for Storage Services
 """
 
+import json
+
 import pytest
-from src.services.storage import JobDB, TemplateDB
-from src.models.job import JobModel, JobState
+from sqlalchemy import create_engine, inspect, text
+from sqlalchemy.orm import Session
+
+from src.models import Base
+from src.services.storage import JobDB, TemplateDB, upgrade_schema
+from src.models.job import JobModel, JobState, JobStateTransitionModel
 from src.models.template import TemplateModel
 
 
@@ -153,6 +159,26 @@ class TestJobDB:
         retrieved = JobDB.get_job(test_db_session, "test_job_123")
         assert retrieved is None
 
+    def test_state_history_and_retries(self, test_db_session: "Session", sample_job: JobModel):
+        """Test transitions and retries are appended as child rows"""
+        JobDB.create_job(test_db_session, sample_job)
+
+        JobDB.update_job_state(test_db_session, "test_job_123", JobState.SUBMITTED, "submitted")
+        JobDB.update_job_retry(test_db_session, "test_job_123", 1, {"code": "TIMEOUT"}, False)
+        job = JobDB.update_job_retry(test_db_session, "test_job_123", 2, {"code": "HTTP_503"}, True)
+
+        assert [t["state"] for t in job.state_transitions] == ["CREATED", "SUBMITTED"]
+        assert [t.seq for t in job.transitions] == [0, 1]
+        assert job.retry_count == 2
+        assert job.last_retry_error == {"code": "HTTP_503"}
+        assert job.to_dict()["state_transitions"][-1]["event"] == "submitted"
+        assert job.submitted_at == job.transitions[-1].timestamp
+        assert job.to_dict()["submitted_at"] == job.submitted_at.isoformat()
+        assert job.running_at is None
+
+        JobDB.delete_job(test_db_session, "test_job_123")
+        assert test_db_session.query(JobStateTransitionModel).count() == 0
+
 
 class TestTemplateDB:
     """Integration tests for Template database operations"""
@@ -248,5 +274,150 @@ class TestTemplateDB:
         assert retrieved is None
 
 
+# jobs/templates as created before the history tables and column changes
+LEGACY_SCHEMA = (
+    """
+    CREATE TABLE jobs (
+        id INTEGER NOT NULL PRIMARY KEY,
+        job_id VARCHAR NOT NULL,
+        user_input_redacted VARCHAR NOT NULL,
+        user_input_hash VARCHAR NOT NULL,
+        pii_flags JSON,
+        template_id VARCHAR NOT NULL,
+        template_version VARCHAR NOT NULL,
+        quality_mode VARCHAR NOT NULL,
+        state VARCHAR NOT NULL,
+        clarification_state VARCHAR,
+        clarification_required_fields JSON,
+        ir JSON NOT NULL,
+        shot_plan JSON NOT NULL,
+        shot_requests JSON NOT NULL,
+        shot_assets JSON,
+        preview_shot_assets JSON,
+        selected_seeds JSON,
+        external_task_ids JSON NOT NULL,
+        total_duration_s INTEGER NOT NULL,
+        resolution VARCHAR NOT NULL,
+        error_details JSON,
+        state_transitions JSON NOT NULL,
+        retry_count INTEGER NOT NULL,
+        last_retry_error JSON,
+        retry_exhausted JSON,
+        revision_of VARCHAR,
+        targeted_fields JSON,
+        created_at DATETIME NOT NULL,
+        updated_at DATETIME,
+        submitted_at DATETIME,
+        running_at DATETIME,
+        succeeded_at DATETIME,
+        failed_at DATETIME
+    )
+    """,
+    "CREATE UNIQUE INDEX ix_jobs_job_id ON jobs (job_id)",
+    "CREATE INDEX idx_job_id ON jobs (job_id)",
+    "CREATE INDEX ix_jobs_user_input_hash ON jobs (user_input_hash)",
+    """
+    CREATE TABLE templates (
+        id INTEGER NOT NULL PRIMARY KEY,
+        template_id VARCHAR NOT NULL,
+        version VARCHAR NOT NULL,
+        tags JSON NOT NULL,
+        constraints JSON NOT NULL,
+        shot_skeletons JSON NOT NULL,
+        negative_prompt_base VARCHAR NOT NULL,
+        created_at DATETIME,
+        updated_at DATETIME,
+        CONSTRAINT uq_template_version UNIQUE (template_id, version)
+    )
+    """,
+    "CREATE UNIQUE INDEX ix_templates_template_id ON templates (template_id)",
+)
+
+LEGACY_JOB = {
+    "job_id": "legacy_job",
+    "state": "SUBMITTED",
+    "state_transitions": json.dumps(
+        [
+            {"state": "CREATED", "timestamp": "2024-01-01T00:00:00", "event": "job_created"},
+            {"state": "SUBMITTED", "timestamp": "2024-01-01T00:01:00", "event": "submitted"},
+        ]
+    ),
+    "retry_count": 2,
+    "last_retry_error": json.dumps({"code": "HTTP_503"}),
+    "created_at": "2024-01-01 00:00:00",
+    "updated_at": "2024-01-01 00:02:00",
+    "submitted_at": "2024-01-01 00:01:00",
+}
+
+class TestUpgradeSchema:
+    """Integration tests for upgrading databases created by older schemas"""
+
+    @pytest.fixture
+    def legacy_engine(self, test_db_path: str):
+        """Engine on a database holding the old jobs/templates tables"""
+        engine = create_engine(f"sqlite:///{test_db_path}")
+        with engine.begin() as conn:
+            for statement in LEGACY_SCHEMA:
+                conn.exec_driver_sql(statement)
+            conn.execute(
+                text(
+                    "INSERT INTO jobs (job_id, user_input_redacted, user_input_hash, template_id,"
+                    " template_version, quality_mode, state, ir, shot_plan, shot_requests,"
+                    " external_task_ids, total_duration_s, resolution, state_transitions,"
+                    " retry_count, last_retry_error, created_at, updated_at, submitted_at)"
+                    " VALUES (:job_id, 'input', 'hash', 'insomnia_relaxation', '1.0', 'balanced',"
+                    " :state, '{}', '{}', '[]', '{}', 0, '1280*720', :state_transitions,"
+                    " :retry_count, :last_retry_error, :created_at, :updated_at, :submitted_at)"
+                ),
+                LEGACY_JOB,
+            )
+        yield engine
+        engine.dispose()
+
+    def test_upgrade_backfills_history_and_drops_old_columns(self, legacy_engine):
+        """Test old job history is moved into the child tables"""
+        upgrade_schema(legacy_engine)
+        Base.metadata.create_all(legacy_engine)
+
+        columns = {col["name"] for col in inspect(legacy_engine).get_columns("jobs")}
+        assert "state_transitions" not in columns
+        assert "retry_count" not in columns
+        assert "submitted_at" not in columns
+
+        with Session(legacy_engine) as db:
+            job = JobDB.get_job(db, "legacy_job")
+            assert [t["event"] for t in job.state_transitions] == ["job_created", "submitted"]
+            assert job.retry_count == 2
+            assert job.last_retry_error == {"code": "HTTP_503"}
+            assert job.submitted_at.isoformat() == "2024-01-01T00:01:00"
+
+            # created_at is now filled in by the database
+            job = JobDB.create_job(
+                db,
+                JobModel(
+                    job_id="new_job",
+                    user_input_redacted="input",
+                    input_hash="hash",
+                    ir={},
+                    shot_plan={"template_id": "insomnia_relaxation"},
+                    shot_requests=[],
+                    state=JobState.CREATED,
+                    quality_mode="balanced",
+                ),
+            )
+            assert job.created_at is not None
+
+    def test_upgrade_is_idempotent(self, legacy_engine):
+        """Test a second upgrade leaves the upgraded tables alone"""
+        upgrade_schema(legacy_engine)
+        indexes = inspect(legacy_engine).get_indexes("jobs")
+
+        upgrade_schema(legacy_engine)
+
+        assert inspect(legacy_engine).get_indexes("jobs") == indexes
+        with Session(legacy_engine) as db:
+            assert len(JobDB.get_job(db, "legacy_job").transitions) == 2
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
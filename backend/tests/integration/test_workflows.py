@@ -52,24 +52,27 @@ def _stub_generation_dependencies(job_manager, ir, template, shot_plan, assets):
     )
 
     job_manager.llm_orchestrator.instantiate_template = Mock(
-        return_value=Mock(dict=Mock(return_value=shot_plan))
+        return_value=Mock(model_dump=Mock(return_value=shot_plan))
     )
     job_manager.validator.validate_parameters = Mock(return_value=(True, None))
-    job_manager.prompt_compiler.compile_shot_prompt = Mock(
-        return_value=Mock(
-            compiled_prompt="prompt",
-            compiled_negative_prompt="",
-            params={
-                "size": "1280*720",
-                "duration": 3,
-                "seed": 12345,
-                "prompt_extend": False,
-                "watermark": False,
-            },
-        )
+    job_manager.prompt_compiler.compile_shot_prompts_batch = Mock(
+        side_effect=lambda shots, **_kwargs: [
+            Mock(
+                compiled_prompt="prompt",
+                compiled_negative_prompt="",
+                params={
+                    "size": "1280*720",
+                    "duration": 3,
+                    "seed": 12345,
+                    "prompt_extend": False,
+                    "watermark": False,
+                },
+            )
+            for _ in shots
+        ]
     )
     job_manager._generate_shots = AsyncMock(return_value=assets)
-    job_manager._write_job_metadata = Mock()
+    job_manager._write_job_metadata = AsyncMock()
 
 
 class TestGenerationWorkflow:
@@ -265,7 +268,7 @@ class TestFinalizationWorkflow:
                 }
             ]
         )
-        job_manager._write_job_metadata = Mock()
+        job_manager._write_job_metadata = AsyncMock()
 
         finalized = await job_manager.execute_finalization_workflow(
             db=test_db_session,
@@ -335,7 +338,7 @@ class TestRevisionWorkflow:
 
         job_manager.llm_orchestrator.instantiate_template = Mock(
             return_value=Mock(
-                dict=Mock(
+                model_dump=Mock(
                     return_value={
                         "template_id": "test_template",
                         "template_version": "1.0",
@@ -356,18 +359,21 @@ class TestRevisionWorkflow:
             )
         )
         job_manager.validator.validate_parameters = Mock(return_value=(True, None))
-        job_manager.prompt_compiler.compile_shot_prompt = Mock(
-            return_value=Mock(
-                compiled_prompt="prompt",
-                compiled_negative_prompt="",
-                params={
-                    "size": "1280*720",
-                    "duration": 3,
-                    "seed": 12345,
-                    "prompt_extend": False,
-                    "watermark": False,
-                },
-            )
+        job_manager.prompt_compiler.compile_shot_prompts_batch = Mock(
+            side_effect=lambda shots, **_kwargs: [
+                Mock(
+                    compiled_prompt="prompt",
+                    compiled_negative_prompt="",
+                    params={
+                        "size": "1280*720",
+                        "duration": 3,
+                        "seed": 12345,
+                        "prompt_extend": False,
+                        "watermark": False,
+                    },
+                )
+                for _ in shots
+            ]
         )
         job_manager._generate_shots = AsyncMock(
             return_value=[
@@ -381,7 +387,7 @@ class TestRevisionWorkflow:
                 }
             ]
         )
-        job_manager._write_job_metadata = Mock()
+        job_manager._write_job_metadata = AsyncMock()
 
         revision_job = await job_manager.execute_revision_workflow(
             db=test_db_session,
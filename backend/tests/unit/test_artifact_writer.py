@@ -0,0 +1,60 @@
+"""
+Unit Tests for AsyncArtifactWriter
+"""
+
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, Mock
+
+from src.services.artifact_writer import AsyncArtifactWriter
+
+
+@pytest.mark.asyncio
+async def test_enqueue_returns_before_write_and_flush_waits():
+    """Writes happen in the background and flush waits for them."""
+    release = asyncio.Event()
+    written = []
+
+    async def _write(job_id, metadata):
+        await release.wait()
+        written.append((job_id, metadata))
+
+    storage = Mock(write_job_metadata_async=AsyncMock(side_effect=_write))
+    writer = AsyncArtifactWriter(storage)
+
+    await writer.enqueue("job1", {"v": 1})
+    assert written == []
+
+    release.set()
+    await writer.flush()
+    assert written == [("job1", {"v": 1})]
+
+
+@pytest.mark.asyncio
+async def test_pending_writes_for_same_job_are_coalesced():
+    """Only the latest queued document per job is written."""
+    storage = Mock(write_job_metadata_async=AsyncMock())
+    writer = AsyncArtifactWriter(storage)
+
+    await writer.enqueue("job1", {"v": 1})
+    await writer.enqueue("job2", {"v": 1})
+    await writer.enqueue("job1", {"v": 2})
+    await AsyncArtifactWriter.flush_all()
+
+    assert [call.args for call in storage.write_job_metadata_async.await_args_list] == [
+        ("job2", {"v": 1}),
+        ("job1", {"v": 2}),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_write_failure_does_not_stop_queue():
+    """A failed write is logged and later documents are still written."""
+    storage = Mock(write_job_metadata_async=AsyncMock(side_effect=[OSError("disk full"), None]))
+    writer = AsyncArtifactWriter(storage)
+
+    await writer.enqueue("job1", {"v": 1})
+    await writer.enqueue("job2", {"v": 1})
+    await writer.flush()
+
+    assert storage.write_job_metadata_async.await_count == 2
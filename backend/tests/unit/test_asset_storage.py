@@ -3,6 +3,7 @@ Unit Tests for AssetStorage
 """
 
 import os
+from pathlib import Path
 import pytest
 
 from src.config.settings import settings
@@ -43,6 +44,44 @@ def test_paths_and_urls(storage: AssetStorage):
     assert metadata_url == f"{settings.static_url_prefix}/metadata/job1.json"
 
 
+def test_download_dir_outside_static_root(storage: AssetStorage, tmp_path):
+    """Partial downloads must not be reachable under the static mount."""
+    download_dir = Path(storage.download_dir)
+
+    assert download_dir.is_dir()
+    assert download_dir.parent == tmp_path.parent
+    assert tmp_path not in download_dir.parents
+
+
+def test_path_and_url_share_relative_location(storage: AssetStorage):
+    """Test combined path/URL helpers match the individual getters."""
+    video_path, video_url = storage.get_video_path_and_url("job1", 3, suffix="seed1")
+    audio_path, audio_url = storage.get_audio_path_and_url("job1", 3, suffix="seed1")
+
+    assert video_path == storage.get_video_storage_path("job1", 3, suffix="seed1")
+    assert video_url == storage.get_video_url("job1", 3, suffix="seed1")
+    assert audio_path == storage.get_audio_storage_path("job1", 3, suffix="seed1")
+    assert audio_url == storage.get_audio_url("job1", 3, suffix="seed1")
+    assert video_url.endswith("/job1_shot_3_seed1.mp4")
+    assert os.path.isdir(os.path.dirname(video_path))
+
+
+def test_date_directory_rolls_over_at_utc_midnight(storage: AssetStorage, monkeypatch):
+    """Test the cached date directory changes exactly at the UTC day boundary."""
+    import time
+
+    midnight = 1704153600  # 2024-01-02T00:00:00Z
+    monkeypatch.setattr(time, "time", lambda: midnight - 0.5)
+    assert storage._today_str() == "2024/01/01"
+
+    monkeypatch.setattr(time, "time", lambda: midnight)
+    assert storage._today_str() == "2024/01/02"
+    assert storage.get_video_url("job1", 1).endswith("/2024/01/02/job1_shot_1.mp4")
+    video_path = storage.get_video_storage_path("job1", 1)
+    assert video_path == os.path.join(storage.video_dir, "2024/01/02", "job1_shot_1.mp4")
+    assert os.path.isdir(os.path.dirname(video_path))
+
+
 def test_write_and_read_metadata(storage: AssetStorage):
     """Test metadata round-trip."""
     metadata = {"job_id": "job1", "status": "ok"}
@@ -55,6 +94,51 @@ def test_write_and_read_metadata(storage: AssetStorage):
     assert loaded["status"] == "ok"
 
 
+def test_metadata_serializes_datetimes_and_int_keys(storage: AssetStorage):
+    """Test metadata with datetimes, int keys and non-ASCII text round-trips."""
+    from datetime import datetime
+
+    metadata = {
+        "created_at": datetime(2024, 1, 1, 8, 30),
+        "selected_seeds": {1: 12345},
+        "topic": "失眠",
+    }
+
+    storage.write_job_metadata("job1", metadata)
+    loaded = storage.read_job_metadata("job1")
+
+    assert loaded["created_at"].startswith("2024-01-01")
+    assert loaded["selected_seeds"] == {"1": 12345}
+    assert loaded["topic"] == "失眠"
+
+
+def test_write_metadata_payload_is_atomic(storage: AssetStorage):
+    """Test metadata is replaced in one step and the payload is returned."""
+    storage.write_job_metadata("job1", {"status": "running"})
+
+    path, payload = storage.write_job_metadata_payload("job1", {"status": "ok"})
+
+    with open(path, "rb") as f:
+        assert f.read() == payload
+    assert storage.read_job_metadata("job1")["status"] == "ok"
+    assert os.listdir(os.path.dirname(path)) == ["job1.json"]
+
+
+def test_read_metadata_cached_until_file_changes(storage: AssetStorage):
+    """Test repeated reads reuse the parsed document until it is rewritten."""
+    storage.write_job_metadata("job1", {"status": "running"})
+
+    first = storage.read_job_metadata("job1")
+    assert storage.read_job_metadata("job1") is first
+
+    storage.write_job_metadata("job1", {"status": "succeeded"})
+    assert storage.read_job_metadata("job1")["status"] == "succeeded"
+
+    storage.delete_job_assets("job1")
+    with pytest.raises(FileNotFoundError):
+        storage.read_job_metadata("job1")
+
+
 def test_delete_job_assets(storage: AssetStorage):
     """Test deleting video/audio/metadata assets."""
     video_path = storage.get_video_storage_path("job1", 1)
@@ -74,3 +158,94 @@ def test_delete_job_assets(storage: AssetStorage):
     assert not os.path.exists(video_path)
     assert not os.path.exists(audio_path)
     assert not os.path.exists(metadata_path)
+
+
+def test_delete_job_assets_from_earlier_day(storage: AssetStorage):
+    """Test assets recorded in metadata are deleted even from a past date directory."""
+    video_path = os.path.join(settings.static_video_dir, "2024", "01", "01", "job1_shot_1.mp4")
+    audio_path = os.path.join(settings.static_audio_dir, "2024", "01", "01", "job1_shot_1.mp3")
+    for path in [video_path, audio_path]:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(b"data")
+    storage.write_job_metadata(
+        "job1",
+        {"shot_assets": [{"shot_id": 1, "video_path": video_path, "audio_path": audio_path}]},
+    )
+
+    deleted = storage.delete_job_assets("job1")
+
+    assert video_path in deleted
+    assert audio_path in deleted
+    assert not os.path.exists(video_path)
+    assert not os.path.exists(audio_path)
+
+
+def test_metadata_records_storage_date(storage: AssetStorage):
+    """Test metadata is stamped with the date directory unless one is given."""
+    storage.write_job_metadata("job1", {"job_id": "job1"})
+    storage.write_job_metadata("job2", {"job_id": "job2", "storage_date": "2024/01/01"})
+
+    assert storage.read_job_metadata("job1")["storage_date"] == storage._today_str()
+    assert storage.read_job_metadata("job2")["storage_date"] == "2024/01/01"
+
+
+def test_metadata_shot_assets_written_as_list(storage: AssetStorage):
+    """Test the served metadata file keeps shot assets as a list of objects."""
+    import json
+
+    assets = [
+        {"shot_id": 1, "seed": 7, "video_url": "/v/1.mp4"},
+        {"shot_id": 2, "seed": 8, "video_url": "/v/2.mp4"},
+    ]
+    path = storage.write_job_metadata("job1", {"job_id": "job1", "shot_assets": assets})
+
+    with open(path, "rb") as f:
+        on_disk = json.loads(f.read())
+    assert on_disk["shot_assets"] == assets
+    assert storage.read_job_metadata("job1")["shot_assets"] == assets
+
+
+def test_metadata_columnar_shot_assets_still_readable(storage: AssetStorage):
+    """Test metadata written with columnar shot assets reads back as dicts."""
+    import json
+
+    path = storage.get_metadata_storage_path("job1")
+    with open(path, "w") as f:
+        json.dump(
+            {
+                "job_id": "job1",
+                "shot_assets": {"columns": ["shot_id", "seed"], "rows": [[1, 7], [2, 8]]},
+            },
+            f,
+        )
+
+    assert storage.read_job_metadata("job1")["shot_assets"] == [
+        {"shot_id": 1, "seed": 7},
+        {"shot_id": 2, "seed": 8},
+    ]
+
+
+def test_delete_job_assets_without_metadata_scans_retention_window(storage: AssetStorage):
+    """Test assets from a recent past day are deleted when metadata is gone."""
+    import time
+
+    yesterday = time.strftime("%Y/%m/%d", time.gmtime(time.time() - 86400))
+    video_path = os.path.join(settings.static_video_dir, yesterday, "job1_shot_1.mp4")
+    os.makedirs(os.path.dirname(video_path), exist_ok=True)
+    with open(video_path, "wb") as f:
+        f.write(b"data")
+
+    deleted = storage.delete_job_assets("job1")
+
+    assert deleted == [video_path]
+    assert not os.path.exists(video_path)
+
+
+@pytest.mark.asyncio
+async def test_metadata_async_round_trip(storage: AssetStorage):
+    """Test async metadata helpers write and read the same document."""
+    path = await storage.write_job_metadata_async("job-async", {"job_id": "job-async"})
+
+    assert os.path.exists(path)
+    assert (await storage.read_job_metadata_async("job-async"))["job_id"] == "job-async"
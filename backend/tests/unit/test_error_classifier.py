@@ -2,6 +2,8 @@
 Unit Tests for ErrorClassifier
 """
 
+import json
+
 import httpx
 
 from src.services.error_classifier import ErrorClassifier
@@ -80,3 +82,16 @@ def test_classify_unknown_error():
 
     assert result["code"] == classifier.ERROR_UNKNOWN
     assert result["retryable"] is False
+
+
+def test_classify_fixed_results_are_fresh_json_dicts():
+    classifier = ErrorClassifier()
+
+    first = classifier.classify(_http_status_error(429))
+    first["suggested_modifications"].append("mutated")
+    second = classifier.classify(_http_status_error(429))
+
+    assert type(second) is dict
+    assert second["suggested_modifications"] == ["Wait a few minutes and try again"]
+    assert json.loads(json.dumps(second)) == second
+    assert classifier.classify(_http_status_error(302))["code"] == classifier.ERROR_UNKNOWN
@@ -9,11 +9,11 @@ import pytest
 from src.services.ffmpeg_splitter import FFmpegSplitter, FFmpegError
 
 
-def _completed(returncode=0, stderr=b""):
+def _completed(returncode=0, stderr=b"", stdout=b""):
     return subprocess.CompletedProcess(
         args=["ffmpeg"],
         returncode=returncode,
-        stdout=b"",
+        stdout=stdout,
         stderr=stderr,
     )
 
@@ -62,7 +62,7 @@ def test_split_video_audio_audio_failure(tmp_path, monkeypatch):
     input_path.write_bytes(b"data")
     video_path = tmp_path / "video.mp4"
 
-    def _extract_video(_input, output):
+    def _extract_video(_input, output, **_kwargs):
         with open(output, "wb") as f:
             f.write(b"video")
         return _completed(returncode=0)
@@ -92,12 +92,12 @@ def test_split_video_audio_success(tmp_path, monkeypatch):
     video_path = tmp_path / "video.mp4"
     audio_path = tmp_path / "audio.mp3"
 
-    def _extract_video(_input, output):
+    def _extract_video(_input, output, **_kwargs):
         with open(output, "wb") as f:
             f.write(b"video")
         return _completed(returncode=0)
 
-    def _extract_audio(_input, output):
+    def _extract_audio(_input, output, **_kwargs):
         with open(output, "wb") as f:
             f.write(b"audio")
         return _completed(returncode=0)
@@ -112,3 +112,166 @@ def test_split_video_audio_success(tmp_path, monkeypatch):
     assert result["duration_s"] == 4.5
     assert os.path.exists(video_path)
     assert os.path.exists(audio_path)
+
+
+def test_split_video_audio_extracts_concurrently(tmp_path, monkeypatch):
+    """Audio extraction runs while video extraction is still in progress."""
+    import threading
+
+    splitter = FFmpegSplitter()
+    input_path = tmp_path / "input.mp4"
+    input_path.write_bytes(b"data")
+    audio_started = threading.Event()
+
+    def _extract_video(_input, output, **_kwargs):
+        assert audio_started.wait(timeout=5)
+        with open(output, "wb") as f:
+            f.write(b"video")
+        return _completed(returncode=0)
+
+    def _extract_audio(_input, output, **_kwargs):
+        audio_started.set()
+        with open(output, "wb") as f:
+            f.write(b"audio")
+        return _completed(returncode=0)
+
+    monkeypatch.setattr(splitter, "_is_ffmpeg_available", lambda: True)
+    monkeypatch.setattr(splitter, "_probe_stream_codecs", lambda _path: {"video": "h264", "audio": "aac"})
+    monkeypatch.setattr(splitter, "_extract_video", _extract_video)
+    monkeypatch.setattr(splitter, "_extract_audio", _extract_audio)
+    monkeypatch.setattr(splitter, "_get_video_duration", lambda _path: 4.5)
+
+    result = splitter.split_video_audio(
+        str(input_path),
+        str(tmp_path / "video.mp4"),
+        str(tmp_path / "audio.mp3"),
+    )
+
+    assert result["success"] is True
+
+
+def test_extract_stream_copies_supported_codecs(monkeypatch):
+    """H.264 video and MP3 audio are copied; other codecs are re-encoded."""
+    commands = []
+
+    def _run_ffmpeg(cmd, **_kwargs):
+        commands.append(cmd)
+        return _completed(returncode=0)
+
+    splitter = FFmpegSplitter()
+    monkeypatch.setattr(splitter, "_run_ffmpeg", _run_ffmpeg)
+
+    splitter._extract_video("in.mp4", "video.mp4", source_codec="h264")
+    splitter._extract_video("in.mp4", "video.mp4", source_codec="vp9")
+    splitter._extract_audio("in.mp4", "audio.mp3", source_codec="mp3")
+    splitter._extract_audio("in.mp4", "audio.mp3", source_codec="aac")
+
+    assert "copy" == commands[0][commands[0].index("-c:v") + 1]
+    assert splitter.video_codec == commands[1][commands[1].index("-c:v") + 1]
+    assert "copy" == commands[2][commands[2].index("-c:a") + 1]
+    assert splitter.audio_codec == commands[3][commands[3].index("-c:a") + 1]
+
+
+def test_split_video_audio_duration_from_progress(tmp_path, monkeypatch):
+    """Duration comes from ffmpeg progress output without spawning ffprobe."""
+    splitter = FFmpegSplitter()
+    input_path = tmp_path / "input.mp4"
+    input_path.write_bytes(b"data")
+    progress = b"out_time_ms=N/A\nprogress=continue\nout_time_ms=3916667\nprogress=end\n"
+
+    def _extract_video(_input, output, **_kwargs):
+        with open(output, "wb") as f:
+            f.write(b"video")
+        return _completed(returncode=0, stdout=progress)
+
+    def _extract_audio(_input, output, **_kwargs):
+        with open(output, "wb") as f:
+            f.write(b"audio")
+        return _completed(returncode=0)
+
+    def _get_video_duration(_path):
+        raise AssertionError("ffprobe should not be needed")
+
+    monkeypatch.setattr(splitter, "_is_ffmpeg_available", lambda: True)
+    monkeypatch.setattr(splitter, "_probe_stream_codecs", lambda _path: {"video": "h264", "audio": "aac"})
+    monkeypatch.setattr(splitter, "_extract_video", _extract_video)
+    monkeypatch.setattr(splitter, "_extract_audio", _extract_audio)
+    monkeypatch.setattr(splitter, "_get_video_duration", _get_video_duration)
+
+    result = splitter.split_video_audio(
+        str(input_path),
+        str(tmp_path / "video.mp4"),
+        str(tmp_path / "audio.mp3"),
+    )
+
+    assert result["duration_s"] == pytest.approx(3.916667)
+
+
+def test_ffmpeg_path_resolved_once(tmp_path, monkeypatch):
+    """The ffmpeg binary is located at construction and not looked up again."""
+    import shutil
+    from src.config.settings import settings
+
+    binary = tmp_path / "ffmpeg"
+    binary.write_bytes(b"")
+    binary.chmod(0o755)
+    monkeypatch.setattr(settings, "ffmpeg_path", str(binary))
+
+    splitter = FFmpegSplitter()
+
+    def _which(*_args, **_kwargs):
+        raise AssertionError("ffmpeg lookup should be cached")
+
+    monkeypatch.setattr(shutil, "which", _which)
+    monkeypatch.setattr(os, "access", _which)
+
+    assert splitter._is_ffmpeg_available()
+    assert splitter._ffmpeg_exe == str(binary)
+
+
+def test_run_ffmpeg_keeps_stderr_tail(monkeypatch):
+    """Only the last lines of a long stderr log are kept."""
+    import sys
+    from src.config.constants import FFMPEG_STDERR_TAIL_LINES
+
+    splitter = FFmpegSplitter()
+    script = (
+        "import sys\n"
+        "for i in range(5000): sys.stderr.write(f'line {i}\\n')\n"
+        "print('out_time_ms=1500000')\n"
+        "sys.exit(3)\n"
+    )
+
+    result = splitter._run_ffmpeg([sys.executable, "-c", script], read_progress=True)
+
+    lines = result.stderr.splitlines()
+    assert result.returncode == 3
+    assert len(lines) == FFMPEG_STDERR_TAIL_LINES
+    assert lines[-1] == b"line 4999"
+    assert splitter._progress_duration(result.stdout) == 1.5
+
+
+def test_ffprobe_output_parsed_as_bytes(monkeypatch):
+    """ffprobe output is parsed without decoding to text."""
+    outputs = iter([b"4.25\n", b'{"format": {"duration": "4.25"}}'])
+
+    def _run(cmd, **kwargs):
+        assert "text" not in kwargs
+        return subprocess.CompletedProcess(args=cmd, returncode=0, stdout=next(outputs), stderr=b"")
+
+    monkeypatch.setattr(subprocess, "run", _run)
+    splitter = FFmpegSplitter()
+
+    assert splitter._get_video_duration("video.mp4") == 4.25
+    assert splitter.get_video_info("video.mp4") == {"format": {"duration": "4.25"}}
+
+
+def test_spawn_uses_minimal_environment(monkeypatch):
+    """ffmpeg processes get a small fixed environment and skip the fd close pass."""
+    monkeypatch.setenv("PRISM_UNRELATED_SECRET", "x")
+
+    splitter = FFmpegSplitter()
+
+    assert splitter._spawn_kwargs["close_fds"] is False
+    assert splitter._spawn_kwargs["env"]["LANG"] == "C"
+    assert "PRISM_UNRELATED_SECRET" not in splitter._spawn_kwargs["env"]
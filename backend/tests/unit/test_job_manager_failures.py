@@ -3,7 +3,7 @@ Unit Tests for JobManager Failure Paths
 """
 
 import pytest
-from unittest.mock import AsyncMock, Mock
+from unittest.mock import AsyncMock, Mock, patch
 
 from src.services.storage import JobDB
 
@@ -100,22 +100,25 @@ def _stub_base_pipeline(job_manager, ir, template, shot_plan):
         )
     )
     job_manager.llm_orchestrator.instantiate_template = Mock(
-        return_value=Mock(dict=Mock(return_value=shot_plan))
+        return_value=Mock(model_dump=Mock(return_value=shot_plan))
     )
-    job_manager.prompt_compiler.compile_shot_prompt = Mock(
-        return_value=Mock(
-            compiled_prompt="prompt",
-            compiled_negative_prompt="",
-            params={
-                "size": "1280*720",
-                "duration": 3,
-                "seed": 12345,
-                "prompt_extend": False,
-                "watermark": False,
-            },
-        )
+    job_manager.prompt_compiler.compile_shot_prompts_batch = Mock(
+        side_effect=lambda shots, **_kwargs: [
+            Mock(
+                compiled_prompt="prompt",
+                compiled_negative_prompt="",
+                params={
+                    "size": "1280*720",
+                    "duration": 3,
+                    "seed": 12345,
+                    "prompt_extend": False,
+                    "watermark": False,
+                },
+            )
+            for _ in shots
+        ]
     )
-    job_manager._write_job_metadata = Mock()
+    job_manager._write_job_metadata = AsyncMock()
 
 
 @pytest.mark.asyncio
@@ -137,6 +140,25 @@ async def test_rate_limit_failure_no_job_created(job_manager, test_db_session):
     assert JobDB.list_jobs(test_db_session) == []
 
 
+@pytest.mark.asyncio
+async def test_blank_input_skips_ir_parsing(job_manager, test_db_session):
+    """Input that is empty after processing fails before the LLM is called."""
+    _stub_base_pipeline(job_manager, _base_ir(), _template_dict(), _shot_plan_dict())
+    job_manager.input_processor.process_input.return_value["redacted_text"] = "   "
+
+    with pytest.raises(ValueError, match="Empty input"):
+        await job_manager.execute_generation_workflow(
+            db=test_db_session,
+            user_input="   ",
+            quality_mode="balanced",
+            client_ip="192.168.1.1",
+            resolution="1280x720",
+        )
+
+    job_manager.llm_orchestrator.parse_ir.assert_not_called()
+    assert JobDB.list_jobs(test_db_session) == []
+
+
 @pytest.mark.asyncio
 async def test_template_match_failure_no_job_created(job_manager, test_db_session):
     """Template match failures should not create jobs."""
@@ -198,3 +220,139 @@ async def test_external_failure_marks_job_failed(job_manager, test_db_session):
     assert job.state == "FAILED"
     assert job.error_details is not None
     assert job.state_transitions[-1]["state"] == "FAILED"
+
+
+def test_apply_feedback_does_not_mutate_parent_ir(job_manager):
+    """Revision feedback should leave the parent job's IR untouched."""
+    ir = _base_ir().model_dump()
+    original = _base_ir().model_dump()
+
+    modified = job_manager._apply_feedback_to_ir(
+        ir=ir,
+        targeted_fields=["camera", "lighting"],
+        suggested_modifications={"camera_motion": "pan", "lighting": "dim"},
+    )
+
+    assert ir == original
+    assert modified["scene"] == {**original["scene"], "camera_motion": "pan"}
+    assert modified["style"]["lighting"] == "dim"
+    assert modified["audio"] is ir["audio"]
+
+
+@pytest.mark.asyncio
+async def test_preview_candidates_use_distinct_seeds(job_manager):
+    """Each preview candidate of a shot should be its own DashScope task."""
+    submitted = []
+
+    async def fake_submit(request):
+        submitted.append(request.seed)
+        return Mock(task_id=f"task_{request.seed}")
+
+    job_manager.wan26_adapter.submit_shot_request_with_retry = AsyncMock(side_effect=fake_submit)
+    job_manager.wan26_adapter.poll_task_status = AsyncMock(
+        side_effect=lambda task_id: Mock(status="failed", task_id=task_id, error="x", video_url=None)
+    )
+    job = Mock(job_id="job", quality_mode="balanced", resolution="1280x720", external_task_ids=[])
+    shot_request = {
+        "shot_id": 1,
+        "compiled_prompt": "prompt",
+        "compiled_negative_prompt": "",
+        "params": {
+            "size": "1280*720",
+            "duration": 3,
+            "seed": 2**31 - 2,
+            "prompt_extend": False,
+            "watermark": False,
+        },
+        "preview_seeds": 3,
+    }
+
+    await job_manager._generate_shots(db=Mock(), job=job, shot_requests=[shot_request])
+
+    assert sorted(submitted) == [1, 2**31 - 2, 2**31 - 1]
+    assert sorted(job.external_task_ids) == ["task_1", f"task_{2**31 - 2}", f"task_{2**31 - 1}"]
+
+
+@pytest.mark.asyncio
+async def test_preview_candidates_split_to_separate_files(job_manager):
+    """Candidates of one shot share a shot_id but must not share output files."""
+    job_manager.wan26_adapter.submit_shot_request_with_retry = AsyncMock(
+        side_effect=lambda request: Mock(task_id=f"task_{request.seed}")
+    )
+    job_manager.wan26_adapter.poll_task_status = AsyncMock(
+        side_effect=lambda task_id: Mock(
+            status="succeeded", task_id=task_id, error=None, video_url=f"https://example.com/{task_id}.mp4"
+        )
+    )
+    job_manager.downloader.download_video = AsyncMock(side_effect=lambda url: f"/tmp/{url[-10:]}")
+    job_manager.ffmpeg_splitter.split_video_audio_async = AsyncMock(return_value={"duration_s": 3})
+    job = Mock(job_id="job", quality_mode="balanced", resolution="1280x720", external_task_ids=[])
+    shot_request = {
+        "shot_id": 1,
+        "compiled_prompt": "prompt",
+        "compiled_negative_prompt": "",
+        "params": {
+            "size": "1280*720",
+            "duration": 3,
+            "seed": 100,
+            "prompt_extend": False,
+            "watermark": False,
+        },
+        "preview_seeds": 2,
+    }
+
+    with patch("src.services.job_manager.os.remove"), patch("src.services.job_manager.JobDB"):
+        assets = await job_manager._generate_shots(db=Mock(), job=job, shot_requests=[shot_request])
+
+    assert sorted(asset["seed"] for asset in assets) == [100, 101]
+    assert len({asset["video_path"] for asset in assets}) == 2
+    assert len({asset["audio_path"] for asset in assets}) == 2
+
+
+@pytest.mark.asyncio
+async def test_final_shots_finalized_as_tasks_finish(job_manager):
+    """A shot whose task finishes early is downloaded before a slow task finishes."""
+    import asyncio
+
+    events = []
+    early_downloaded = asyncio.Event()
+
+    def succeeded(task_id):
+        return Mock(status="succeeded", task_id=task_id, error=None, video_url=f"https://example.com/{task_id[-1]}.mp4")
+
+    async def fake_poll_many(task_ids, done_q=None, **kwargs):
+        done_q.put_nowait(("task_1", succeeded("task_1")))
+        # The slow task only finishes once the early shot has been downloaded
+        await asyncio.wait_for(early_downloaded.wait(), timeout=1)
+        events.append("task_2 finished")
+        done_q.put_nowait(("task_2", succeeded("task_2")))
+
+    async def fake_download(url):
+        events.append(f"downloaded {url[-5:]}")
+        early_downloaded.set()
+        return f"/tmp/{url[-5:]}"
+
+    job_manager.wan26_adapter.submit_shot_request_with_retry = AsyncMock(
+        side_effect=lambda request: Mock(task_id=f"task_{request.seed}")
+    )
+    job_manager.wan26_adapter.poll_many = fake_poll_many
+    job_manager.downloader.download_video = AsyncMock(side_effect=fake_download)
+    job_manager.ffmpeg_splitter.split_video_audio_async = AsyncMock(return_value={"duration_s": 3})
+    shot_requests = [
+        {
+            "shot_id": shot_id,
+            "compiled_prompt": "prompt",
+            "compiled_negative_prompt": "",
+            "params": {"duration": 3, "prompt_extend": False, "watermark": False},
+        }
+        for shot_id in (1, 2)
+    ]
+    job = Mock(job_id="job", shot_requests=shot_requests)
+
+    with patch("src.services.job_manager.os.remove"):
+        assets = await job_manager._generate_final_shots(
+            db=Mock(), job=job, selected_seeds={1: 1, 2: 2}, target_resolution="1920x1080"
+        )
+
+    assert events == ["downloaded 1.mp4", "task_2 finished", "downloaded 2.mp4"]
+    assert [asset["shot_id"] for asset in assets] == [1, 2]
@@ -9,6 +9,7 @@ from src.services.job_state import (
     get_current_state,
     is_terminal_state,
     transition_state,
+    transition_states,
 )
 from src.services.storage import JobDB
 
@@ -49,6 +50,38 @@ def test_transition_state_invalid(test_db_session):
         transition_state(test_db_session, job.job_id, "SUCCEEDED", "invalid")
 
 
+def test_transition_states_records_chain_in_order(test_db_session):
+    """Batched transitions end in the last state and record every step."""
+    job = _create_job(test_db_session)
+
+    updated = transition_states(
+        test_db_session,
+        job.job_id,
+        [("SUBMITTED", "submitted"), ("RUNNING", "started")],
+    )
+
+    assert updated.state == "RUNNING"
+    assert [t["event"] for t in updated.state_transitions][-2:] == ["submitted", "started"]
+    assert [t["state"] for t in updated.state_transitions][-2:] == ["SUBMITTED", "RUNNING"]
+
+
+def test_transition_states_invalid_chain_writes_nothing(test_db_session):
+    """An invalid step anywhere in the chain leaves the job untouched."""
+    job = _create_job(test_db_session)
+    history_len = len(job.state_transitions)
+
+    with pytest.raises(JobStateError):
+        transition_states(
+            test_db_session,
+            job.job_id,
+            [("SUBMITTED", "submitted"), ("SUCCEEDED", "invalid")],
+        )
+
+    test_db_session.refresh(job)
+    assert job.state == "CREATED"
+    assert len(job.state_transitions) == history_len
+
+
 def test_get_current_state(test_db_session):
     """Current state is returned for existing jobs."""
     job = _create_job(test_db_session)
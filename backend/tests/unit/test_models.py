@@ -198,6 +198,28 @@ class TestShotRequest:
         assert request.compiled_prompt == "测试提示词"
         assert request.params["size"] == "1280*720"
 
+    def test_shot_request_is_frozen(self):
+        """Test shot requests reject mutation and unknown fields"""
+        from pydantic import ValidationError
+
+        request = ShotRequest(
+            shot_id=1,
+            compiled_prompt="测试提示词",
+            compiled_negative_prompt="",
+            params={},
+        )
+
+        with pytest.raises(ValidationError):
+            request.shot_id = 2
+        with pytest.raises(ValidationError):
+            ShotRequest(
+                shot_id=1,
+                compiled_prompt="测试提示词",
+                compiled_negative_prompt="",
+                params={},
+                seed=1,
+            )
+
 
 class TestTemplateModel:
     """Test suite for TemplateModel"""
@@ -244,6 +266,62 @@ class TestTemplateModel:
         assert data["version"] == "1.0"
         assert "shot_skeletons" in data
 
+    def test_template_to_dicts_matches_to_dict(self):
+        """Test bulk serialization uses the same column plan as to_dict"""
+        from datetime import datetime
+
+        templates = [
+            TemplateModel(
+                template_id=f"t{i}",
+                version="1.0",
+                shot_skeletons=[],
+                constraints={},
+                tags={},
+                created_at=datetime(2024, 1, 1),
+            )
+            for i in range(3)
+        ]
+
+        data = TemplateModel.to_dicts(templates)
+
+        assert data == [template.to_dict() for template in templates]
+        assert data[0]["created_at"] == "2024-01-01T00:00:00"
+        assert data[0]["updated_at"] is None
+
+    def test_template_to_dict_raw_datetimes(self):
+        """Test raw datetimes encode to the same JSON as isoformat strings"""
+        from datetime import datetime
+
+        orjson = pytest.importorskip("orjson")
+        template = TemplateModel(
+            template_id="test_template",
+            version="1.0",
+            shot_skeletons=[],
+            constraints={},
+            tags={},
+            created_at=datetime(2024, 1, 1, 8, 30, 0, 125000),
+        )
+
+        raw = template.to_dict(iso_datetimes=False)
+
+        assert raw["created_at"] == datetime(2024, 1, 1, 8, 30, 0, 125000)
+        assert orjson.dumps(raw) == orjson.dumps(template.to_dict())
+
+
+class TestJSONColumns:
+    """Test suite for JSON column encoding"""
+
+    def test_json_serializer_matches_stdlib(self):
+        """Test JSON column values round-trip like stdlib json"""
+        import json
+        from src.models import _json_deserializer, _json_serializer
+
+        value = {1: 12345, "narration": "长期失眠？", "shots": [{"duration_s": 4}], "ok": None}
+
+        encoded = _json_serializer(value)
+
+        assert _json_deserializer(encoded) == json.loads(json.dumps(value))
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
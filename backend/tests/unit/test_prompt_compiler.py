@@ -110,6 +110,32 @@ class TestPromptCompiler:
             assert req["params"]["size"] == "1280*720"
             assert "seed" in req["params"]
 
+    def test_compile_shot_prompts_batch_matches_single(self, compiler: PromptCompiler, sample_shot_plan):
+        """Batch compilation matches per-shot compilation apart from the seed"""
+        ir = {"scene": {"location": "卧室", "time": "夜"}, "resolution": "1920x1080"}
+        shots = list(reversed(sample_shot_plan["shots"]))
+
+        batch = compiler.compile_shot_prompts_batch(
+            shots=shots,
+            shot_plan=sample_shot_plan,
+            ir=ir,
+            negative_prompt_base="低质量",
+        )
+
+        assert len(batch) == len(shots)
+        for shot, compiled in zip(shots, batch):
+            single = compiler.compile_shot_prompt(
+                shot=shot,
+                shot_plan=sample_shot_plan,
+                ir=ir,
+                negative_prompt_base="低质量",
+            )
+            assert compiled.compiled_prompt == single.compiled_prompt
+            assert compiled.compiled_negative_prompt == single.compiled_negative_prompt
+            assert {k: v for k, v in compiled.params.items() if k != "seed"} == {
+                k: v for k, v in single.params.items() if k != "seed"
+            }
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -113,6 +113,15 @@ class TestRateLimiter:
         limiter.reset_rate_limit("192.168.1.1")
         redis_client.delete.assert_called()
 
+    def test_planned_within_grace(self):
+        """Test only recently planned jobs skip the render rate limit"""
+        from datetime import datetime, timedelta
+
+        now = datetime.utcnow()
+        assert RateLimiter.planned_within_grace(now - timedelta(seconds=5))
+        assert not RateLimiter.planned_within_grace(now - timedelta(minutes=10))
+        assert not RateLimiter.planned_within_grace(None)
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
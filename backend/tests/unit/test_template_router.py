@@ -78,7 +78,7 @@ class TestTemplateRouter:
             }
         }
 
-        similarity = router._calculate_jaccard_similarity(ir, template)
+        similarity = router._calculate_jaccard_similarity(router._build_ir_view(ir), template)
 
         # Should have good overlap
         assert similarity > 0.0
@@ -98,7 +98,7 @@ class TestTemplateRouter:
             }
         }
 
-        similarity = router._calculate_jaccard_similarity(ir, template)
+        similarity = router._calculate_jaccard_similarity(router._build_ir_view(ir), template)
 
         # Should have low or no overlap
         assert similarity >= 0.0
@@ -109,7 +109,7 @@ class TestTemplateRouter:
         ir = {"topic": "", "emotion_curve": []}
         template = {"tags": {}}
 
-        similarity = router._calculate_jaccard_similarity(ir, template)
+        similarity = router._calculate_jaccard_similarity(router._build_ir_view(ir), template)
 
         # Should return 0.0 for empty tags
         assert similarity == 0.0
@@ -199,5 +199,21 @@ class TestTemplateRouter:
         assert match.confidence_components.get("fallback") == 1.0
 
 
+    def test_build_index_keeps_flat_index_when_quantization_fails(self, router: TemplateRouter, monkeypatch):
+        """Test a quantization error leaves the flat index in place"""
+        from unittest.mock import Mock, patch
+        from src.config.settings import settings
+
+        flat_index = Mock()
+        router.embeddings = Mock()
+        monkeypatch.setattr(settings, "template_index_sq8_min_templates", 1)
+        template = {"template_id": "test_template", "version": "1.0", "tags": {"topic": ["失眠"]}}
+
+        with patch("src.core.template_router.FAISS.from_texts", return_value=flat_index), \
+                patch.object(router, "_quantize_index", side_effect=RuntimeError("too few training points")):
+            router.build_index([template])
+
+        assert router.faiss_index is flat_index
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -65,6 +65,27 @@ class TestValidator:
         assert not result.is_valid
         assert any("prompt" in error.lower() for error in result.errors)
 
+    def test_validate_shot_plan_soa(self, validator: Validator):
+        """Test columnar shot validation reports errors in shot order"""
+        count = 8
+        durations = [2] * count
+        durations[5] = 30
+        has_prompt = [True] * count
+        has_prompt[2] = False
+
+        result = validator.validate_shot_plan_soa(
+            durations,
+            [f"s{i}" for i in range(count)],
+            has_prompt,
+            quality_mode="high",
+        )
+
+        assert not result.is_valid
+        assert result.errors[-2:] == [
+            "Missing compiled prompt for shot s2",
+            "Shot s5 duration 30s out of range",
+        ]
+
     def test_validate_quality_mode_fast(self, validator: Validator, sample_shot_plan):
         """Test validation for fast quality mode"""
         result = validator.validate_shot_plan(
@@ -104,6 +125,20 @@ class TestValidator:
         # Should generate warning about medical advice
         assert not result.is_compliant or len(result.warnings) > 0
 
+    def test_validate_medical_compliance_english_phrases(self, validator: Validator):
+        """Test English phrases are matched case-insensitively across all texts"""
+        is_compliant, suggestions = validator.validate_medical_compliance(
+            "A Guaranteed Cure for insomnia",
+            ["Avoid doctors and rest", "calm bedroom"],
+            return_tuple=True,
+        )
+
+        assert not is_compliant
+        assert suggestions == [
+            "Remove or soften absolute claim: 'guaranteed cure'",
+            "Remove harmful advice: 'avoid doctors'",
+        ]
+
     def test_validate_resolution_valid(self, validator: Validator):
         """Test resolution validation"""
         assert validator.validate_resolution("1280*720")
@@ -128,6 +163,15 @@ class TestValidator:
         assert validator.validate_seed_count(3, "high")
         assert not validator.validate_seed_count(1, "high")
 
+    def test_compress_narration_fast_keeps_decimals(self, validator: Validator):
+        """Test fast-mode simplification keeps punctuation inside words"""
+        narration = "Um take 2.5 mg before bed basically every night for a week"
+
+        compressed, suggestion = validator.compress_narration(narration, "fast")
+
+        assert compressed == "take 2.5 mg before bed basi..."
+        assert suggestion is not None
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -2,6 +2,10 @@
 Unit Tests for WAN26 Adapter
 """
 
+import asyncio
+import json
+
+import httpx
 import pytest
 from unittest.mock import Mock, patch, AsyncMock
 from src.core.wan26_adapter import (
@@ -12,6 +16,30 @@ from src.core.wan26_adapter import (
 )
 
 
+def mock_dashscope(handler):
+    """Route the adapter's shared HTTP client through an httpx mock transport"""
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return patch.object(Wan26Adapter, "_get_client", return_value=client)
+
+
+def test_module_does_not_import_dashscope_sdk():
+    """Test the REST adapter imports without loading the dashscope SDK"""
+    import subprocess
+    import sys
+    from pathlib import Path
+
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys, src.core.wan26_adapter; sys.exit('dashscope' in sys.modules)",
+        ],
+        cwd=Path(__file__).resolve().parents[2],
+    )
+
+    assert result.returncode == 0
+
+
 class TestShotGenerationRequest:
     """Test suite for ShotGenerationRequest model"""
 
@@ -69,13 +97,18 @@ class TestWan26Adapter:
             seed=12345
         )
 
-        # Mock DashScope VideoSynthesis.async_call
-        with patch('src.core.wan26_adapter.VideoSynthesis') as mock_video:
-            mock_response = Mock()
-            mock_response.status_code = 200
-            mock_response.output.task_id = "test_task_123"
-            mock_video.async_call.return_value = mock_response
-
+        def handler(http_request: httpx.Request) -> httpx.Response:
+            assert http_request.url.path.endswith("/video-synthesis")
+            assert http_request.headers["X-DashScope-Async"] == "enable"
+            payload = json.loads(http_request.content)
+            assert payload["model"] == "wan2.6-t2v"
+            assert payload["parameters"]["seed"] == 12345
+            return httpx.Response(
+                200, json={"output": {"task_id": "test_task_123", "task_status": "PENDING"}}
+            )
+
+        # Mock DashScope video-synthesis endpoint
+        with mock_dashscope(handler):
             response = await adapter.submit_shot_request(request)
 
             assert response.task_id == "test_task_123"
@@ -95,33 +128,30 @@ class TestWan26Adapter:
         )
 
         # Mock DashScope failure
-        with patch('src.core.wan26_adapter.VideoSynthesis') as mock_video:
-            mock_response = Mock()
-            mock_response.status_code = 400
-            mock_response.code = "InvalidParameter"
-            mock_response.message = "Invalid prompt"
-            mock_video.async_call.return_value = mock_response
+        def handler(http_request: httpx.Request) -> httpx.Response:
+            return httpx.Response(
+                400, json={"code": "InvalidParameter", "message": "Invalid prompt"}
+            )
 
+        with mock_dashscope(handler):
             with pytest.raises(Exception) as exc_info:
                 await adapter.submit_shot_request(request)
 
             assert "Failed" in str(exc_info.value)
+            assert "InvalidParameter" in str(exc_info.value)
 
     @pytest.mark.asyncio
     async def test_poll_task_status_success(self, adapter: Wan26Adapter):
         """Test successful task status polling"""
-        # Mock VideoSynthesis.wait
-        with patch('src.core.wan26_adapter.VideoSynthesis') as mock_video:
-            mock_response = Mock()
-            mock_response.status_code = 200
-            mock_response.output.video_url = "https://example.com/video.mp4"
-
-            # Create mock task object
-            mock_task = Mock()
-            mock_task.task_id = "test_task_123"
-
-            mock_video.wait.return_value = mock_response
-
+        def handler(http_request: httpx.Request) -> httpx.Response:
+            assert http_request.url.path.endswith("/tasks/test_task_123")
+            return httpx.Response(200, json={"output": {
+                "task_id": "test_task_123",
+                "task_status": "SUCCEEDED",
+                "video_url": "https://example.com/video.mp4",
+            }})
+
+        with mock_dashscope(handler):
             response = await adapter.poll_task_status("test_task_123")
 
             assert response.task_id == "test_task_123"
@@ -129,25 +159,290 @@ class TestWan26Adapter:
             assert response.video_url == "https://example.com/video.mp4"
 
     @pytest.mark.asyncio
-    async def test_poll_task_status_failed(self, adapter: Wan26Adapter):
-        """Test failed task status polling"""
-        # Mock VideoSynthesis.wait with failure
-        with patch('src.core.wan26_adapter.VideoSynthesis') as mock_video:
-            mock_response = Mock()
-            mock_response.status_code = 500
-            mock_response.code = "InternalError"
-            mock_response.message = "Generation failed"
+    async def test_poll_task_status_waits_while_running(self, adapter: Wan26Adapter):
+        """Test polling continues until the task leaves the running state"""
+        statuses = iter(["PENDING", "RUNNING", "SUCCEEDED"])
+
+        def handler(http_request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json={"output": {
+                "task_status": next(statuses),
+                "video_url": "https://example.com/video.mp4",
+            }})
+
+        with mock_dashscope(handler):
+            response = await adapter.poll_task_status("test_task_123", poll_interval=0)
+
+            assert response.status == "succeeded"
+            assert next(statuses, None) is None
+
+    @pytest.mark.asyncio
+    async def test_poll_task_status_backoff(self, adapter: Wan26Adapter):
+        """Test poll delays double up to poll_interval with bounded jitter"""
+        statuses = iter(["PENDING"] * 4 + ["SUCCEEDED"])
+
+        def handler(http_request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json={"output": {
+                "task_status": next(statuses),
+                "video_url": "https://example.com/video.mp4",
+            }})
 
-            mock_task = Mock()
-            mock_task.task_id = "test_task_123"
+        with mock_dashscope(handler), \
+                patch("src.core.wan26_adapter.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+            response = await adapter.poll_task_status("test_task_123", poll_interval=4)
 
-            mock_video.wait.return_value = mock_response
+        delays = [call.args[0] for call in mock_sleep.await_args_list]
+        assert response.status == "succeeded"
+        for delay, expected in zip(delays, [1, 2, 4, 4], strict=True):
+            assert expected * 0.8 <= delay <= expected * 1.2
 
+    @pytest.mark.asyncio
+    async def test_poll_task_status_retries_failed_queries(self, adapter: Wan26Adapter):
+        """Test a dropped status query does not end polling before the deadline"""
+        responses = iter([
+            httpx.ConnectError("connection reset"),
+            httpx.Response(200, json={"output": {
+                "task_status": "SUCCEEDED",
+                "video_url": "https://example.com/video.mp4",
+            }}),
+        ])
+
+        def handler(http_request: httpx.Request) -> httpx.Response:
+            response = next(responses)
+            if isinstance(response, Exception):
+                raise response
+            return response
+
+        with mock_dashscope(handler):
+            response = await adapter.poll_task_status("test_task_123", poll_interval=0)
+
+        assert response.status == "succeeded"
+
+    @pytest.mark.asyncio
+    async def test_poll_task_status_timeout(self, adapter: Wan26Adapter):
+        """Test polling gives up once the deadline passes"""
+        def handler(http_request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json={"output": {"task_status": "RUNNING"}})
+
+        with mock_dashscope(handler):
+            with pytest.raises(TimeoutError):
+                await adapter.poll_task_status("test_task_123", timeout_s=0)
+
+    @pytest.mark.asyncio
+    async def test_poll_task_status_task_failed_details(self, adapter: Wan26Adapter):
+        """Test a failed task reports DashScope's failure details"""
+        def handler(http_request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json={"output": {
+                "task_status": "FAILED",
+                "video_url": None,
+                "code": "DataInspectionFailed",
+                "message": "Input data may contain inappropriate content.",
+            }})
+
+        with mock_dashscope(handler):
+            response = await adapter.poll_task_status("test_task_123")
+
+        assert response.status == "failed"
+        assert response.error == (
+            "task_status=FAILED; code=DataInspectionFailed; "
+            "message=Input data may contain inappropriate content."
+        )
+
+    @pytest.mark.asyncio
+    async def test_poll_task_status_failed(self, adapter: Wan26Adapter):
+        """Test failed task status polling"""
+        # Mock DashScope task query failure
+        def handler(http_request: httpx.Request) -> httpx.Response:
+            return httpx.Response(
+                404, json={"code": "InvalidParameter", "message": "Task not found"}
+            )
+
+        with mock_dashscope(handler):
             response = await adapter.poll_task_status("test_task_123")
 
             assert response.status == "failed"
             assert response.error is not None
 
+    @pytest.mark.asyncio
+    async def test_poll_task_status_keeps_polling_on_gateway_errors(self, adapter: Wan26Adapter):
+        """Test a 429 or 5xx status query does not fail a task that is still rendering"""
+        responses = iter([
+            httpx.Response(429, json={"code": "Throttling"}),
+            httpx.Response(502, text="Bad Gateway"),
+            httpx.Response(200, json={"output": {
+                "task_status": "SUCCEEDED",
+                "video_url": "https://example.com/video.mp4",
+            }}),
+        ])
+
+        with mock_dashscope(lambda http_request: next(responses)):
+            response = await adapter.poll_task_status("test_task_123", poll_interval=0)
+
+        assert response.status == "succeeded"
+
+    @pytest.mark.asyncio
+    async def test_poll_many_full_jitter_per_task(self, adapter: Wan26Adapter):
+        """Test each task backs off on its own with full-jitter delays"""
+        statuses = {"a": iter(["RUNNING", "SUCCEEDED"]), "b": iter(["RUNNING", "RUNNING", "FAILED"])}
+
+        def handler(http_request: httpx.Request) -> httpx.Response:
+            task_id = http_request.url.path.rsplit("/", 1)[-1]
+            return httpx.Response(200, json={"output": {
+                "task_status": next(statuses[task_id]),
+                "video_url": "https://example.com/video.mp4",
+            }})
+
+        rng = Mock(uniform=Mock(return_value=0.0))
+        with mock_dashscope(handler), patch.object(adapter, "_poll_rng", rng):
+            results = await adapter.poll_many(["a", "b"], poll_interval=1.5)
+
+        assert results["a"].status == "succeeded"
+        assert results["b"].status == "failed"
+        # a: one pending answer; b: two, the second capped by poll_interval
+        assert sorted(call.args for call in rng.uniform.call_args_list) == [(0, 1.0), (0, 1.0), (0, 1.5)]
+
+    @pytest.mark.asyncio
+    async def test_poll_many_retries_failed_queries(self, adapter: Wan26Adapter):
+        """Test a status query that raises is retried instead of ending the task"""
+        attempts = {"flaky": 0}
+
+        def handler(http_request: httpx.Request) -> httpx.Response:
+            attempts["flaky"] += 1
+            if attempts["flaky"] == 1:
+                raise httpx.ConnectError("connection reset")
+            return httpx.Response(200, json={"output": {
+                "task_status": "SUCCEEDED",
+                "video_url": "https://example.com/video.mp4",
+            }})
+
+        with mock_dashscope(handler), \
+                patch.object(adapter, "_poll_rng", Mock(uniform=Mock(return_value=0.0))):
+            results = await adapter.poll_many(["flaky"])
+
+        assert results["flaky"].status == "succeeded"
+        assert attempts["flaky"] == 2
+
+    @pytest.mark.asyncio
+    async def test_poll_many_reports_errors_per_task(self, adapter: Wan26Adapter):
+        """Test a failing status query or timeout is returned for that task only"""
+        def handler(http_request: httpx.Request) -> httpx.Response:
+            task_id = http_request.url.path.rsplit("/", 1)[-1]
+            if task_id == "broken":
+                raise httpx.ConnectError("connection refused")
+            return httpx.Response(200, json={"output": {"task_status": "RUNNING"}})
+
+        with mock_dashscope(handler):
+            results = await adapter.poll_many(["broken", "slow"], timeout_s=0)
+
+        assert isinstance(results["broken"], httpx.ConnectError)
+        assert isinstance(results["slow"], TimeoutError)
+
+    @pytest.mark.asyncio
+    async def test_poll_many_reports_each_task_to_done_queue(self, adapter: Wan26Adapter):
+        """Test every finished task is queued with its result, in finishing order"""
+        statuses = {"slow": iter(["RUNNING", "SUCCEEDED"]), "fast": iter(["SUCCEEDED"])}
+
+        def handler(http_request: httpx.Request) -> httpx.Response:
+            task_id = http_request.url.path.rsplit("/", 1)[-1]
+            return httpx.Response(200, json={"output": {
+                "task_status": next(statuses[task_id]),
+                "video_url": "https://example.com/video.mp4",
+            }})
+
+        done_q: asyncio.Queue = asyncio.Queue()
+        with mock_dashscope(handler), \
+                patch.object(adapter, "_poll_rng", Mock(uniform=Mock(return_value=0.0))):
+            results = await adapter.poll_many(["slow", "fast"], done_q=done_q)
+
+        queued = [done_q.get_nowait() for _ in range(done_q.qsize())]
+        assert [task_id for task_id, _ in queued] == ["fast", "slow"]
+        assert all(results[task_id] is result for task_id, result in queued)
+
+    @pytest.mark.asyncio
+    async def test_submit_many_bounded_by_concurrency(self, adapter: Wan26Adapter):
+        """Test concurrent submissions never exceed the resizable cap"""
+        in_flight = 0
+        peak = 0
+
+        async def handler(http_request: httpx.Request) -> httpx.Response:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return httpx.Response(200, json={"output": {"task_id": "task"}})
+
+        requests = [ShotGenerationRequest(prompt="测试视频", seed=i) for i in range(6)]
+
+        try:
+            with mock_dashscope(handler):
+                await adapter.set_concurrency(2)
+                results = await adapter.submit_many(requests)
+                assert [result.status for result in results] == ["submitted"] * 6
+                assert peak == 2
+
+                peak = 0
+                await adapter.set_concurrency(3)
+                await adapter.submit_many(requests)
+                assert peak == 3
+
+                # The cap is process-wide, not per adapter instance
+                peak = 0
+                await asyncio.gather(adapter.submit_many(requests), Wan26Adapter().submit_many(requests))
+                assert peak == 3
+
+            with pytest.raises(ValueError):
+                await adapter.set_concurrency(0)
+        finally:
+            Wan26Adapter._submit_slots.cap = None
+
+    @pytest.mark.asyncio
+    async def test_set_concurrency_applies_to_every_adapter(self, adapter: Wan26Adapter):
+        """Test a runtime resize reaches existing and future adapter instances"""
+        try:
+            await Wan26RetryAdapter.set_concurrency(2)
+            assert adapter._submit_slots.limit == 2
+            assert Wan26RetryAdapter()._submit_slots.limit == 2
+        finally:
+            Wan26Adapter._submit_slots.cap = None
+
+    @pytest.mark.asyncio
+    async def test_submission_slot_released_on_cancel(self, adapter: Wan26Adapter):
+        """Test a cancelled submission hands its slot to the next waiter"""
+        slots = Wan26Adapter._submit_slots
+        started = asyncio.Event()
+
+        async def holder():
+            async with slots.hold():
+                started.set()
+                await asyncio.sleep(60)
+
+        async def waiter():
+            async with slots.hold():
+                return "acquired"
+
+        try:
+            await slots.resize(1)
+            holding = asyncio.create_task(holder())
+            await started.wait()
+            waiting = asyncio.create_task(waiter())
+            await asyncio.sleep(0)
+            holding.cancel()
+
+            assert await asyncio.wait_for(waiting, timeout=1) == "acquired"
+            assert slots.active == 0
+        finally:
+            slots.cap = None
+
+    @pytest.mark.asyncio
+    async def test_prewarm_ignores_connection_errors(self, adapter: Wan26Adapter):
+        """Test connection pre-warming never raises"""
+        handler = Mock(side_effect=httpx.ConnectError("unreachable"))
+
+        with mock_dashscope(handler):
+            await adapter.prewarm()
+
+        assert handler.call_count == 1
+
 
 class TestWan26RetryAdapter:
     """Test suite for Wan26RetryAdapter"""
@@ -169,16 +464,15 @@ class TestWan26RetryAdapter:
             seed=12345
         )
 
-        with patch('src.core.wan26_adapter.VideoSynthesis') as mock_video:
-            mock_response = Mock()
-            mock_response.status_code = 200
-            mock_response.output.task_id = "test_task_123"
-            mock_video.async_call.return_value = mock_response
+        handler = Mock(return_value=httpx.Response(
+            200, json={"output": {"task_id": "test_task_123"}}
+        ))
 
+        with mock_dashscope(handler):
             response = await retry_adapter.submit_shot_request_with_retry(request)
 
             assert response.task_id == "test_task_123"
-            assert mock_video.async_call.call_count == 1
+            assert handler.call_count == 1
 
     @pytest.mark.asyncio
     async def test_submit_with_retry_success_after_retry(self, retry_adapter: Wan26RetryAdapter):
@@ -191,25 +485,80 @@ class TestWan26RetryAdapter:
             seed=12345
         )
 
-        with patch('src.core.wan26_adapter.VideoSynthesis') as mock_video:
-            # First call fails with timeout
-            mock_error_response = Mock()
-            mock_error_response.status_code = 504
-
-            # Second call succeeds
-            mock_success_response = Mock()
-            mock_success_response.status_code = 200
-            mock_success_response.output.task_id = "test_task_123"
-
-            mock_video.async_call.side_effect = [
-                Exception("Timeout"),
-                mock_success_response
-            ]
+        # First call fails at the transport level, second call succeeds
+        handler = Mock(side_effect=[
+            httpx.ConnectError(""),
+            httpx.Response(200, json={"output": {"task_id": "test_task_123"}}),
+        ])
 
+        with mock_dashscope(handler):
             response = await retry_adapter.submit_shot_request_with_retry(request)
 
             assert response.task_id == "test_task_123"
-            assert mock_video.async_call.call_count == 2
+            assert handler.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_submit_with_retry_jittered_backoff(self, retry_adapter: Wan26RetryAdapter):
+        """Test retryable failures back off exponentially with bounded jitter"""
+        request = ShotGenerationRequest(
+            prompt="测试视频生成",
+            negative_prompt="",
+            size="1280*720",
+            duration=5,
+            seed=12345
+        )
+        handler = Mock(return_value=httpx.Response(503, json={"message": "busy"}))
+
+        with mock_dashscope(handler), \
+                patch("src.core.wan26_adapter.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+            with pytest.raises(Exception, match="503"):
+                await retry_adapter.submit_shot_request_with_retry(request)
+
+        delays = [call.args[0] for call in mock_sleep.await_args_list]
+        assert handler.call_count == retry_adapter.MAX_RETRY_ATTEMPTS
+        for delay, expected in zip(delays, [2, 4], strict=True):
+            assert expected <= delay <= expected + retry_adapter.RETRY_JITTER_S
+
+    @pytest.mark.asyncio
+    async def test_submit_with_retry_keeps_repeated_requests_separate(self, retry_adapter: Wan26RetryAdapter):
+        """Test identical concurrent submissions each create their own DashScope task"""
+        request = ShotGenerationRequest(prompt="测试视频生成", seed=12345)
+        calls = 0
+
+        async def handler(http_request: httpx.Request) -> httpx.Response:
+            nonlocal calls
+            calls += 1
+            task_id = f"task_{calls}"
+            await asyncio.sleep(0.01)
+            return httpx.Response(200, json={"output": {"task_id": task_id}})
+
+        with mock_dashscope(handler):
+            first, second = await asyncio.gather(
+                retry_adapter.submit_shot_request_with_retry(request),
+                retry_adapter.submit_shot_request_with_retry(request),
+            )
+
+        assert {first.task_id, second.task_id} == {"task_1", "task_2"}
+
+    @pytest.mark.asyncio
+    async def test_submit_many_keeps_order_and_errors(self, retry_adapter: Wan26RetryAdapter):
+        """Test batch submission returns per-request results in order"""
+        requests = [
+            ShotGenerationRequest(prompt=f"测试视频 {i}", seed=12345 + i)
+            for i in range(3)
+        ]
+
+        async def fake_submit(request):
+            if request.seed == 12346:
+                raise Exception("Invalid API key")
+            return ShotGenerationResponse(task_id=f"task_{request.seed}", status="submitted")
+
+        with patch.object(retry_adapter, "submit_shot_request", side_effect=fake_submit):
+            results = await retry_adapter.submit_many(requests)
+
+        assert results[0].task_id == "task_12345"
+        assert isinstance(results[1], Exception)
+        assert results[2].task_id == "task_12347"
 
     def test_is_retryable_error_timeout(self, retry_adapter: Wan26RetryAdapter):
         """Test retryable error detection for timeout"""
@@ -221,6 +570,13 @@ class TestWan26RetryAdapter:
         error = Exception("Connection refused")
         assert retry_adapter._is_retryable_error(error)
 
+    def test_is_retryable_error_server_status(self, retry_adapter: Wan26RetryAdapter):
+        """Test retryable error detection for 5xx statuses and transport errors"""
+        assert retry_adapter._is_retryable_error(Exception("Failed, status_code: 503, code: None"))
+        assert retry_adapter._is_retryable_error(Exception("TEMPORARY failure"))
+        assert retry_adapter._is_retryable_error(httpx.ReadTimeout(""))
+        assert not retry_adapter._is_retryable_error(Exception("Failed, status_code: 501, code: None"))
+
     def test_is_retryable_error_non_retryable(self, retry_adapter: Wan26RetryAdapter):
         """Test non-retryable error detection"""
         error = Exception("Invalid API key")
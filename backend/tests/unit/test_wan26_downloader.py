@@ -59,6 +59,19 @@ async def test_download_video_success(tmp_path):
     assert os.path.getsize(path) > 0
 
 
+@pytest.mark.asyncio
+async def test_download_video_uses_temp_dir(tmp_path):
+    """Test downloads without a target path go to the configured directory."""
+    response = _MockStreamResponse([b"data"], status_code=200)
+    downloader = Wan26Downloader(temp_dir=str(tmp_path))
+    downloader.client = _MockClient(response)
+
+    path = await downloader.download_video("https://example.com/video.mp4")
+
+    assert os.path.dirname(path) == str(tmp_path)
+    assert path.endswith(".mp4")
+
+
 @pytest.mark.asyncio
 async def test_download_video_http_error(tmp_path):
     """Test HTTP error propagates."""
@@ -1,39 +1,56 @@
 #!/usr/bin/env bash
-# Setup a local DashScope mock and optional static video server for dev.
+# Setup a local DashScope REST mock that also serves a static dummy video for dev.
 
 set -euo pipefail
 
 MOCK_ROOT="${MOCK_ROOT:-/tmp/prism-mock}"
 MOCK_PORT="${MOCK_PORT:-8009}"
 VIDEO_PATH="${MOCK_ROOT}/dummy.mp4"
-MODULE_DIR="${MOCK_ROOT}/dashscope"
-MODULE_PATH="${MODULE_DIR}/__init__.py"
-
-mkdir -p "${MODULE_DIR}"
-
-cat > "${MODULE_PATH}" <<'PY'
-from http import HTTPStatus
-
-class _Output:
-    def __init__(self, task_id=None, video_url=None):
-        self.task_id = task_id
-        self.video_url = video_url
-
-class _Response:
-    def __init__(self, status_code=HTTPStatus.OK, output=None, code="OK", message=""):
-        self.status_code = status_code
-        self.output = output or _Output()
-        self.code = code
-        self.message = message
-
-class VideoSynthesis:
-    @staticmethod
-    def async_call(*args, **kwargs):
-        return _Response(output=_Output(task_id="mock-task"))
-
-    @staticmethod
-    def wait(task=None, api_key=None):
-        return _Response(output=_Output(video_url="http://127.0.0.1:8009/dummy.mp4"))
+SERVER_PATH="${MOCK_ROOT}/mock_dashscope_server.py"
+
+mkdir -p "${MOCK_ROOT}"
+
+cat > "${SERVER_PATH}" <<'PY'
+import json
+import os
+import sys
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+PORT = int(sys.argv[1])
+ROOT = sys.argv[2]
+
+
+class Handler(SimpleHTTPRequestHandler):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, directory=ROOT, **kwargs)
+
+    def _json(self, payload):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        if self.path.endswith("/video-synthesis"):
+            self._json({"output": {"task_id": "mock-task", "task_status": "PENDING"}})
+        else:
+            self.send_error(404)
+
+    def do_GET(self):
+        if "/tasks/" in self.path:
+            self._json({"output": {
+                "task_id": os.path.basename(self.path),
+                "task_status": "SUCCEEDED",
+                "video_url": f"http://127.0.0.1:{PORT}/dummy.mp4",
+            }})
+        else:
+            super().do_GET()
+
+
+ThreadingHTTPServer(("127.0.0.1", PORT), Handler).serve_forever()
 PY
 
 if ! command -v ffmpeg >/dev/null 2>&1; then
@@ -52,7 +69,7 @@ DashScope mock is ready:
 
 Next steps (in another terminal):
   cd backend
-  PYTHONPATH=${MOCK_ROOT} ./run_dev.sh
+  DASHSCOPE_BASE_URL=http://127.0.0.1:${MOCK_PORT}/api/v1 ./run_dev.sh
 
 Start React frontend:
   cd frontend
@@ -61,6 +78,6 @@ EOF
 
 if [ "${1:-}" = "--serve" ] || [ "${1:-}" = "" ]; then
     echo ""
-    echo "Starting mock video server on http://127.0.0.1:${MOCK_PORT}"
-    python -m http.server "${MOCK_PORT}" --directory "${MOCK_ROOT}"
+    echo "Starting mock DashScope server on http://127.0.0.1:${MOCK_PORT}"
+    python "${SERVER_PATH}" "${MOCK_PORT}" "${MOCK_ROOT}"
 fi